@@ -0,0 +1,14 @@
+"""Micro-benchmarks runnable with ``python manage.py benchmark <name>``."""
+
+from . import (batch_scoring, cv_extraction, email_rendering, extractor_scaling, matcher_scaling, skill_matching,
+               spacy_loading)
+
+BENCHMARKS = {
+    'batch_scoring': batch_scoring,
+    'cv_extraction': cv_extraction,
+    'email_rendering': email_rendering,
+    'extractor_scaling': extractor_scaling,
+    'matcher_scaling': matcher_scaling,
+    'skill_matching': skill_matching,
+    'spacy_loading': spacy_loading,
+}
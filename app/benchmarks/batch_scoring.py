@@ -0,0 +1,69 @@
+"""Scores one job against a large synthetic candidate pool, vectorised versus one employee at a time."""
+
+import random
+import numpy as np
+from types import SimpleNamespace
+from app.benchmarks.skill_matching import ALIASES
+from app.benchmarks.timing import best_of, report
+from app.management.commands.seed import Command as SeedCommand
+from app.services.batch_scorer import BatchScorer, CandidatePool, SkillVocabulary
+from app.services.job_matcher import JobMatcher
+from app.services.skill_normalizer import _cached_profile
+
+def generate_pool(size, seed=404):
+    """Returns (pool, employees) where employees holds the (skills, contract) text of every pool row."""
+    rng = random.Random(seed)
+    names = list(dict.fromkeys(
+        skill.lower() for skill in SeedCommand.ALL_TECHNICAL_SKILLS + SeedCommand.SOFT_SKILLS + ALIASES
+    ))
+    vocabulary = SkillVocabulary(enumerate(names, start=1))
+
+    employees, pairs = [], []
+    for employee_id in range(1, size + 1):
+        skills = rng.sample(names, rng.randint(0, 12))
+        employees.append((', '.join(skills), rng.choice(['FT', 'PT', ''])))
+        pairs.extend((employee_id, vocabulary.ids_by_name[skill]) for skill in skills)
+
+    pool = CandidatePool.from_pairs(
+        np.arange(1, size + 1),
+        [contract for _, contract in employees],
+        np.array(pairs, dtype=np.int64).reshape(-1, 2),
+        vocabulary
+    )
+    return pool, employees
+
+def score_pairwise(job, employees):
+    """The previous match_job_to_employees loop: one calculate_match_score call per employee."""
+    scores = [
+        JobMatcher.calculate_match_score(skills, job.skills_needed, job.skills_wanted, contract, job.job_type)[0]
+        for skills, contract in employees
+    ]
+    return sorted(range(len(scores)), key=lambda row: scores[row], reverse=True)
+
+def score_batch(job, pool):
+    return BatchScorer.score_job(job, pool).ranking()
+
+def run(stdout, repeat=5, size=100000, sample=2000):
+    pool, employees = generate_pool(size)
+    job = SimpleNamespace(
+        skills_needed='Python, Django, JavaScript, PostgreSQL, Docker',
+        skills_wanted='AWS, Kubernetes, React, Communication',
+        job_type='FT'
+    )
+
+    result = BatchScorer.score_job(job, pool)
+    mismatches = sum(
+        1 for row in range(min(sample, size))
+        if result.details(row) != JobMatcher.calculate_match_score(
+            employees[row][0], job.skills_needed, job.skills_wanted, employees[row][1], job.job_type
+        )
+    )
+    stdout.write(f"Checked {min(sample, size)} of {size} candidates; {mismatches} differ from calculate_match_score")
+
+    pairwise = best_of(lambda: _cached_profile.cache_clear() or score_pairwise(job, employees), repeat)
+    batch = best_of(lambda: score_batch(job, pool), repeat)
+    report(stdout, "pairwise: score and rank every candidate", pairwise, size)
+    report(stdout, "batch: score and rank every candidate", batch, size)
+    stdout.write(f"Speedup: {pairwise / batch:.1f}x")
+
+    return {'candidates': size, 'mismatches': mismatches, 'pairwise_seconds': pairwise, 'batch_seconds': batch}
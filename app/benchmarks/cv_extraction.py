@@ -0,0 +1,93 @@
+"""Compares the CV extractors sharing one CVDocument and the compiled gazetteers against the original
+per-extractor text scans."""
+
+import random
+import re
+from app import helper
+from app.benchmarks import legacy_cv_extractors as legacy
+from app.benchmarks.timing import best_of, report
+
+EXTRACTORS = ['extract_email', 'extract_phone_number', 'extract_education', 'extract_experience',
+              'extract_skills', 'extract_interests', 'extract_languages']
+
+SAMPLE_CV = """
+John Smith
+Software Engineer
+
+john.smith@example.com
+(123) 456-7890
+
+EDUCATION
+Bachelor of Science in Computer Science
+University of Technology - 2015-2019
+
+WORK EXPERIENCE
+Software Engineer at Tech Company
+2019 - Present
+
+SKILLS
+Python, Java, JavaScript, Machine Learning, Project Management
+
+LANGUAGES
+English (Fluent), Spanish (Intermediate), French (Basic)
+
+INTERESTS
+Hiking, Photography, Reading
+"""
+
+SECTION_LINES = {
+    'PROFILE': ['Motivated engineer interested in robotics, renewable energy and travel.',
+                'Fluent in Spanish and proficient in German.', 'Team player with customer service background'],
+    'WORK EXPERIENCE': ['Internship at Acme Ltd', 'Worked at Globex as Technical Support', 'Position: Job Coordinator',
+                        'Vehicle Maintenance and Parts Management', 'Company: Initech'],
+    'EDUCATION': ['MSc Data Science, University of Leeds', 'BSc Mechanical Engineering', 'A-Levels: Physics, Maths'],
+    'KEY SKILLS': ['Python • Django • Docker', 'SQL | MongoDB | AWS', 'Leadership, Teamwork, Negotiation',
+                   'Including such as etc', 'AutoCAD; SolidWorks; MATLAB', 'REF - 123'],
+    'LANGUAGES': ['English: native', 'French - B2', 'Japanese (basic)', 'Catalan', 'Sign language'],
+    'HOBBIES': ['Guitar, Chess, Hiking', 'Martial Arts • Kayaking', 'Volunteering at the local food bank',
+                'Interested in astronomy and UK Space Industry.'],
+    'REFERENCES': ['Two references here', 'Available upon request'],
+}
+
+def generate_cvs(count, seed=404):
+    rng = random.Random(seed)
+    cvs = [SAMPLE_CV]
+    for i in range(count - 1):
+        lines = [f"Candidate {i}", f"candidate{i}@example.com", f"+44 7{rng.randint(100, 999)} {rng.randint(100000, 999999)}"]
+        for section in rng.sample(list(SECTION_LINES), rng.randint(3, len(SECTION_LINES))):
+            lines.append(section if rng.random() < 0.7 else section.title())
+            lines += rng.sample(SECTION_LINES[section], rng.randint(1, len(SECTION_LINES[section])))
+            lines.append('')
+        cvs.append('\n'.join(lines))
+    return cvs
+
+def extract_legacy(text):
+    return [getattr(legacy, name)(text) for name in EXTRACTORS]
+
+def extract_shared(text):
+    document = helper.CVDocument(text)
+    return [getattr(helper, name)(document) for name in EXTRACTORS]
+
+def matches_legacy(legacy_output, shared_output):
+    """Equal outputs, except that skills may also hold dictionary terms the legacy token lookup could never find
+    (multi-word terms and ones like C++ or CI/CD)"""
+    skills = EXTRACTORS.index('extract_skills')
+    extra_skills = set(shared_output[skills]) - set(legacy_output[skills])
+    return (
+        all(legacy == shared for i, (legacy, shared) in enumerate(zip(legacy_output, shared_output)) if i != skills)
+        and set(legacy_output[skills]) <= set(shared_output[skills])
+        and all(skill in helper.GAZETTEERS['skills'].terms and not re.fullmatch(r'\w+', skill) for skill in extra_skills)
+    )
+
+def run(stdout, repeat=5, size=200):
+    cvs = generate_cvs(size)
+    mismatches = sum(1 for text in cvs if not matches_legacy(extract_legacy(text), extract_shared(text)))
+    stdout.write(f"Extracted {len(cvs)} CVs; {mismatches} differ from the legacy extractors")
+
+    legacy_seconds = best_of(lambda: [extract_legacy(text) for text in cvs], repeat)
+    shared_seconds = best_of(lambda: [extract_shared(text) for text in cvs], repeat)
+    report(stdout, "legacy: every extractor scans the text", legacy_seconds, len(cvs))
+    report(stdout, "shared CVDocument and gazetteers", shared_seconds, len(cvs))
+    stdout.write(f"Speedup: {legacy_seconds / shared_seconds:.1f}x")
+
+    return {'cvs': len(cvs), 'mismatches': mismatches, 'legacy_seconds': legacy_seconds, 'shared_seconds': shared_seconds}
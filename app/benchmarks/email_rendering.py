@@ -0,0 +1,34 @@
+"""Compares rendering verification and reset emails with render_to_string against the compiled email templates."""
+
+from types import SimpleNamespace
+from django.template.loader import render_to_string
+from app.benchmarks.timing import best_of, report
+from app.services.email_templates import EmailTemplates
+
+TEMPLATES = ['account/email_verification.html', 'account/password_reset_email.html']
+
+def emails(count):
+    return [
+        (TEMPLATES[i % 2], SimpleNamespace(first_name=f"Candidate {i} O'Neil"), f"{i % 1000000:06d}")
+        for i in range(count)
+    ]
+
+def render_legacy(batch):
+    return [render_to_string(template, {'user': user, 'code': code, 'site_name': 'TappedIn'})
+            for template, user, code in batch]
+
+def render_compiled(batch):
+    return [EmailTemplates.render(template, user, code, 'TappedIn')[0] for template, user, code in batch]
+
+def run(stdout, repeat=5, size=2000):
+    batch = emails(size)
+    mismatches = sum(1 for legacy, compiled in zip(render_legacy(batch), render_compiled(batch)) if legacy != compiled)
+    stdout.write(f"Rendered {size} emails; {mismatches} differ from render_to_string")
+
+    legacy_seconds = best_of(lambda: render_legacy(batch), repeat)
+    compiled_seconds = best_of(lambda: render_compiled(batch), repeat)
+    report(stdout, "render_to_string per email", legacy_seconds, size)
+    report(stdout, "compiled template (HTML and plaintext)", compiled_seconds, size)
+    stdout.write(f"Speedup: {legacy_seconds / compiled_seconds:.1f}x")
+
+    return {'emails': size, 'mismatches': mismatches, 'legacy_seconds': legacy_seconds, 'compiled_seconds': compiled_seconds}
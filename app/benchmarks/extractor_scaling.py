@@ -0,0 +1,45 @@
+"""Times every extract_* function on synthetic CVs of growing length, up to the CV_PDF_MAX_CHARS cap."""
+
+import random
+from django.conf import settings
+from app import helper
+from app.benchmarks.cv_extraction import EXTRACTORS, SAMPLE_CV, SECTION_LINES
+from app.benchmarks.timing import best_of, report_curve
+
+SIZES = (1000, 4000, 16000, settings.CV_PDF_MAX_CHARS)
+
+def generate_cv(length, seed=404):
+    """SAMPLE_CV followed by random sections, cut to exactly length characters"""
+    rng = random.Random(seed)
+    parts = [SAMPLE_CV]
+    total = len(SAMPLE_CV)
+    while total < length:
+        section = rng.choice(list(SECTION_LINES))
+        lines = [section] + rng.sample(SECTION_LINES[section], rng.randint(1, len(SECTION_LINES[section]))) + ['']
+        parts.append('\n'.join(lines))
+        total += len(parts[-1]) + 1
+    return '\n'.join(parts)[:length]
+
+def extractors():
+    """EXTRACTORS, plus extract_name when the spaCy model is installed"""
+    names = list(EXTRACTORS)
+    try:
+        helper.nlp.load()
+    except OSError:
+        return names
+    return names + ['extract_name']
+
+def run(stdout, repeat=5, sizes=SIZES):
+    cvs = {size: generate_cv(size) for size in sizes}
+    names = extractors()
+    if 'extract_name' not in names:
+        stdout.write("spaCy model not installed; skipping extract_name")
+
+    results = {'ops_per_sec': {}, 'scaling': {}}
+    for name in names:
+        extract = getattr(helper, name)
+        # Plain str, so every call builds its own CVDocument as it does for a single extractor in production
+        seconds = {size: best_of(lambda text=cvs[size]: extract(text), repeat) for size in sizes}
+        results['scaling'][name] = report_curve(stdout, name, seconds, 'chars')
+        results['ops_per_sec'].update({f"{name} [{size} chars]": 1 / elapsed for size, elapsed in seconds.items()})
+    return results
@@ -0,0 +1,244 @@
+"""Load benchmark of the core user journeys, run with ``python manage.py bench``.
+
+Seeds a synthetic dataset into a throwaway test database and drives the Django test client through each
+scenario, recording the latency and SQL query count of every request.
+"""
+
+import random
+import statistics
+import time
+from contextlib import ExitStack
+from django.contrib.auth.hashers import make_password
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+from app.management.commands.seed import Command as SeedCommand
+from app.models import User, Admin, Employee, Employer, Job, JobApplication
+from app.services.bulk_writer import BulkWriter
+from app.services.match_cache import MatchCache
+
+PASSWORD = 'Bench-password-1'
+COUNTRIES = ['US', 'UK', 'CA', 'DE', 'FR']
+
+class Dataset:
+    """Accounts and jobs the scenarios act on"""
+
+    def __init__(self, sizes, employee, employer, admin, hot_job, open_job_ids):
+        self.sizes = sizes
+        self.employee = employee
+        self.employer = employer
+        self.admin = admin
+        self.hot_job = hot_job
+        self.open_job_ids = open_job_ids
+
+
+def _skills(rng, category=None):
+    category = category or rng.choice(list(SeedCommand.SKILL_CATEGORIES))
+    technical = rng.sample(SeedCommand.SKILL_CATEGORIES[category], rng.randint(3, 5))
+    return ', '.join(technical + rng.sample(SeedCommand.SOFT_SKILLS, 2))
+
+
+def _users(prefix, user_type, count, password):
+    return [
+        User(username=f'@{prefix}{i}', email=f'{prefix}{i}@bench.example.com', first_name=prefix.title(),
+             last_name=str(i), user_type=user_type, password=password)
+        for i in range(count)
+    ]
+
+
+def seed(employees=500, employers=50, jobs=1000, applications=5000, hot_applications=200, seed=1234):
+    """Bulk-creates the dataset (one password hash shared by every account) and returns a Dataset.
+
+    One "hot" job receives hot_applications applications for the job_detail scenario; the rest are spread at random.
+    """
+    rng = random.Random(seed)
+    password = make_password(PASSWORD)
+
+    admin_user, = _users('admin', 'admin', 1, password)
+    employer_rows = [
+        Employer(company_name=f'Bench Company {i}', country=rng.choice(COUNTRIES)) for i in range(employers)
+    ]
+    employee_rows = [
+        Employee(skills=_skills(rng, 'Software Engineering' if i == 0 else None),
+                 country=rng.choice(COUNTRIES), preferred_contract=rng.choice(['FT', 'PT', '']))
+        for i in range(employees)
+    ]
+    BulkWriter.save_users(
+        [(admin_user, Admin())]
+        + list(zip(_users('employer', 'employer', employers, password), employer_rows))
+        + list(zip(_users('employee', 'employee', employees, password), employee_rows)),
+        batch_size=500
+    )
+
+    job_rows = []
+    for i in range(jobs):
+        category = rng.choice(list(SeedCommand.SKILL_CATEGORIES))
+        job_rows.append(Job(
+            name=f'{category} {rng.choice(["Engineer", "Developer", "Analyst", "Lead", "Specialist"])} {i}',
+            department=category, description=f'{category} role number {i}.', salary=rng.randrange(20000, 120000, 1000),
+            job_type=rng.choice(['FT', 'FT', 'FT', 'PT']), skills_needed=_skills(rng, category),
+            skills_wanted=', '.join(rng.sample(SeedCommand.SOFT_SKILLS, 2)), created_by=rng.choice(employer_rows),
+            country=rng.choice(COUNTRIES)
+        ))
+    BulkWriter.save_jobs(job_rows, batch_size=500)
+
+    # The first employee applies through the apply_to_job scenario, so it starts with no applications.
+    hot_job, applicants = job_rows[0], employee_rows[1:]
+    pairs = {(hot_job.pk, employee.pk): (hot_job, employee) for employee in applicants[:hot_applications]}
+    attempts = 0
+    while len(pairs) < applications and attempts < applications * 3 and len(job_rows) > 1:
+        attempts += 1
+        job, employee = rng.choice(job_rows[1:]), rng.choice(applicants)
+        pairs.setdefault((job.pk, employee.pk), (job, employee))
+
+    application_rows = [
+        JobApplication(job=job, applicant=employee, full_name=employee.user.get_full_name(),
+                       email=employee.user.email, skills=employee.skills, country=employee.country)
+        for job, employee in pairs.values()
+    ]
+    BulkWriter.save_applications(application_rows, batch_size=500)
+    BulkWriter.finish()
+
+    sizes = {'employees': employees, 'employers': employers, 'jobs': jobs, 'applications': len(application_rows),
+             'hot_job_applications': min(hot_applications, len(applicants))}
+    return Dataset(sizes, employee_rows[0], hot_job.created_by, admin_user, hot_job, [job.pk for job in job_rows[1:]])
+
+
+class Scenario:
+    """One request type; request(client, dataset, i) issues the i-th request and returns the response, after the
+    unmeasured before(dataset, i) if given"""
+
+    def __init__(self, name, role, request, expected_status=200, before=None):
+        self.name = name
+        self.role = role
+        self.request = request
+        self.expected_status = expected_status
+        self.before = before
+
+
+def _login(client, dataset, i):
+    return Client().post(reverse('login'), {'username': dataset.employee.user.username, 'password': PASSWORD})
+
+
+def _dashboard(params):
+    return lambda client, dataset, i: client.get(reverse('employee_dashboard'), params)
+
+
+def _apply_job_id(dataset, i):
+    return dataset.open_job_ids[i % len(dataset.open_job_ids)]
+
+
+def _withdraw(dataset, i):
+    JobApplication.objects.filter(job_id=_apply_job_id(dataset, i), applicant=dataset.employee).delete()
+
+
+def _apply(client, dataset, i):
+    return client.post(reverse('apply_job', args=[_apply_job_id(dataset, i)]), {'cover_letter': 'Benchmark application'})
+
+
+def _clear_match_cache(dataset, i):
+    MatchCache.clear()
+
+
+SCENARIOS = [
+    Scenario('login', None, _login, expected_status=302),
+    Scenario('employee_dashboard_all', 'employee', _dashboard({'tab': 'all'})),
+    Scenario('employee_dashboard_all_filtered', 'employee',
+             _dashboard({'tab': 'all', 'search': 'engineer', 'job_type': 'FT', 'min_salary': '40000'})),
+    # The match cache is cleared first, so these measure a cold ranking rather than a cache hit.
+    Scenario('employee_dashboard_suitable', 'employee', _dashboard({'tab': 'suitable'}), before=_clear_match_cache),
+    Scenario('employee_dashboard_suitable_filtered', 'employee',
+             _dashboard({'tab': 'suitable', 'job_type': 'FT', 'country': 'US'}), before=_clear_match_cache),
+    Scenario('job_detail', 'employer',
+             lambda client, dataset, i: client.get(reverse('job_detail', args=[dataset.hot_job.pk]))),
+    Scenario('apply_to_job', 'employee', _apply, expected_status=302, before=_withdraw),
+    Scenario('list_users', 'admin', lambda client, dataset, i: client.get(reverse('list_users'))),
+    Scenario('list_jobs', 'admin', lambda client, dataset, i: client.get(reverse('list_jobs'))),
+]
+
+
+class QueryCounter:
+    """Counts the SQL queries run on every connection while installed"""
+
+    def __init__(self):
+        self.queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+
+def measure(scenario, client, dataset, requests, warmup):
+    """Runs the scenario warmup + requests times; returns the summary of the measured requests"""
+    latencies, queries, errors = [], [], 0
+    for i in range(warmup + requests):
+        if scenario.before:
+            scenario.before(dataset, i)
+        counter = QueryCounter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            start = time.perf_counter()
+            response = scenario.request(client, dataset, i)
+            seconds = time.perf_counter() - start
+        if i < warmup:
+            continue
+        latencies.append(seconds)
+        queries.append(counter.queries)
+        errors += response.status_code != scenario.expected_status
+    return summarize(latencies, queries, errors)
+
+
+def summarize(latencies, queries, errors=0):
+    cuts = statistics.quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'p50_ms': 1000 * cuts[49],
+        'p95_ms': 1000 * cuts[94],
+        'p99_ms': 1000 * cuts[98],
+        'mean_ms': 1000 * statistics.fmean(latencies),
+        'queries_per_request': statistics.fmean(queries),
+        'max_queries': max(queries),
+        'throughput_rps': len(latencies) / sum(latencies),
+    }
+
+
+def run(dataset, requests=30, warmup=3, names=None, stdout=None):
+    """Measures every scenario (or those named) against the seeded dataset; returns {name: summary}"""
+    clients = {}
+    for role, user in (('employee', dataset.employee.user), ('employer', dataset.employer.user), ('admin', dataset.admin)):
+        clients[role] = Client()
+        clients[role].force_login(user)
+
+    results = {}
+    for scenario in SCENARIOS:
+        if names and scenario.name not in names:
+            continue
+        results[scenario.name] = measure(scenario, clients.get(scenario.role), dataset, requests, warmup)
+        if stdout:
+            stdout.write(format_row(scenario.name, results[scenario.name]))
+    return results
+
+
+HEADER = f"{'scenario':<38} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8} {'req/s':>8} {'errors':>7}"
+
+def format_row(name, summary):
+    return (f"{name:<38} {summary['p50_ms']:9.1f} {summary['p95_ms']:9.1f} {summary['p99_ms']:9.1f} "
+            f"{summary['queries_per_request']:8.1f} {summary['throughput_rps']:8.1f} {summary['errors']:7d}")
+
+
+def compare(previous, current):
+    """Lines giving the p50/p95 change of every scenario present in both result sets"""
+    lines = []
+    for name, summary in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        changes = [
+            f"{key[:-3]} {before[key]:.1f} -> {summary[key]:.1f} ms ({(summary[key] / before[key] - 1) * 100:+.0f}%)"
+            for key in ('p50_ms', 'p95_ms') if before[key]
+        ]
+        queries = f"queries {before['queries_per_request']:.1f} -> {summary['queries_per_request']:.1f}"
+        lines.append(f"{name:<38} {', '.join(changes + [queries])}")
+    return lines
@@ -0,0 +1,66 @@
+"""Throughput of the JobMatcher primitives, and of match_employee_to_jobs / match_job_to_employees as the job and
+candidate pools grow. The pools are seeded into a throwaway database."""
+
+from app.benchmarks import load
+from app.benchmarks.environment import throwaway_database
+from app.benchmarks.skill_matching import generate_pairs
+from app.benchmarks.timing import best_of, report, report_curve
+from app.models import Employee, Job
+from app.services.job_matcher import JobMatcher
+from app.services.skill_normalizer import _cached_profile
+
+POOL_SIZES = (100, 500, 2000)
+
+def primitive_rates(stdout, repeat=5, size=2000):
+    """ops/sec of _parse_skills, _skill_matches and calculate_match_score over distinct synthetic pairs"""
+    pairs = generate_pairs(size)
+    texts = [text for pair in pairs for text in pair[:3]]
+    lookups = [
+        (job_skill, JobMatcher._parse_skills(employee_skills))
+        for employee_skills, needed, *_ in pairs for job_skill in JobMatcher._parse_skills(needed)
+    ]
+    workloads = [
+        ('_parse_skills', len(texts), lambda: [JobMatcher._parse_skills(text) for text in texts]),
+        ('_skill_matches', len(lookups),
+         lambda: _cached_profile.cache_clear() or [JobMatcher._skill_matches(*lookup) for lookup in lookups]),
+        ('calculate_match_score', len(pairs),
+         lambda: _cached_profile.cache_clear() or [JobMatcher.calculate_match_score(*pair) for pair in pairs]),
+    ]
+
+    rates = {}
+    for label, operations, func in workloads:
+        seconds = best_of(func, repeat)
+        report(stdout, label, seconds, operations)
+        rates[label] = operations / seconds
+    return rates
+
+def pool_curves(stdout, repeat=5, pool_sizes=POOL_SIZES):
+    """Seconds per match_* call against the first n jobs / employees for every n in pool_sizes; expects a database
+    seeded with at least max(pool_sizes) of each"""
+    employee = Employee.objects.order_by('pk').first()
+    job = Job.objects.order_by('pk').first()
+    job_ids = list(Job.objects.order_by('pk').values_list('pk', flat=True))
+    employee_ids = list(Employee.objects.order_by('pk').values_list('pk', flat=True))
+
+    curves = {'match_employee_to_jobs': {}, 'match_job_to_employees': {}}
+    for n in pool_sizes:
+        jobs = Job.objects.filter(pk__in=job_ids[:n])
+        employees = Employee.objects.filter(pk__in=employee_ids[:n]).select_related('user')
+        curves['match_employee_to_jobs'][n] = best_of(lambda: JobMatcher.match_employee_to_jobs(employee, jobs), repeat)
+        curves['match_job_to_employees'][n] = best_of(lambda: JobMatcher.match_job_to_employees(job, employees), repeat)
+
+    results = {'ops_per_sec': {}, 'scaling': {}}
+    for label, seconds in curves.items():
+        results['scaling'][label] = report_curve(stdout, label, seconds, 'pool')
+        results['ops_per_sec'].update({f"{label} [{n} pool]": 1 / elapsed for n, elapsed in seconds.items()})
+    return results
+
+def run(stdout, repeat=5, pool_sizes=POOL_SIZES):
+    results = {'ops_per_sec': primitive_rates(stdout, repeat)}
+    with throwaway_database():
+        stdout.write(f"Seeding {max(pool_sizes)} jobs and employees...")
+        load.seed(employees=max(pool_sizes), employers=20, jobs=max(pool_sizes), applications=0, hot_applications=0)
+        curves = pool_curves(stdout, repeat, pool_sizes)
+    results['ops_per_sec'].update(curves['ops_per_sec'])
+    results['scaling'] = curves['scaling']
+    return results
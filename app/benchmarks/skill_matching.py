@@ -0,0 +1,146 @@
+"""Compares the precompiled skill matcher against the original per-call implementation."""
+
+import random
+from app.management.commands.seed import Command as SeedCommand
+from app.services.job_matcher import JobMatcher
+from app.services.skill_normalizer import SkillProfile, _cached_profile
+from app.benchmarks.timing import best_of, report
+
+def legacy_skill_matches(job_skill, employee_skills):
+    """The JobMatcher._skill_matches implementation that rebuilt its alias table on every call."""
+    if job_skill in employee_skills:
+        return True
+    
+    job_skill_lower = job_skill.lower()
+    
+    skill_variations = {
+        'javascript': ['js'],
+        'typescript': ['ts'],
+        'react': ['reactjs', 'react.js'],
+        'react native': ['rn'],
+        'node.js': ['nodejs', 'node'],
+        'python': ['py'],
+        'ruby on rails': ['rails', 'ror'],
+        'amazon web services': ['aws'],
+        'google cloud platform': ['gcp'],
+        'microsoft azure': ['azure'],
+        'ci/cd': ['cicd', 'continuous integration', 'continuous deployment'],
+        'machine learning': ['ml'],
+        'artificial intelligence': ['ai'],
+        'user experience': ['ux'],
+        'user interface': ['ui'],
+        'docker': ['containerization'],
+        'kubernetes': ['k8s'],
+        'database': ['db'],
+        'postgresql': ['postgres'],
+        'mongodb': ['mongo']
+    }
+    
+    if job_skill_lower in skill_variations:
+        variations = skill_variations[job_skill_lower]
+        for variation in variations:
+            if variation in employee_skills:
+                return True
+    
+    for key, variations in skill_variations.items():
+        if job_skill_lower in variations and key in employee_skills:
+            return True
+    
+    for employee_skill in employee_skills:
+        if (len(employee_skill) > 3 and employee_skill in job_skill_lower) or \
+           (len(job_skill_lower) > 3 and job_skill_lower in employee_skill):
+            return True
+    
+    return False
+
+def legacy_match_score(employee_skills, job_required_skills, job_preferred_skills=None, employee_preferred_contract=None, job_type=None):
+    """The original JobMatcher.calculate_match_score, built on legacy_skill_matches."""
+    employee_skills_list = JobMatcher._parse_skills(employee_skills)
+    job_required_list = JobMatcher._parse_skills(job_required_skills)
+    job_preferred_list = JobMatcher._parse_skills(job_preferred_skills)
+
+    if not employee_skills_list:
+        return 15.0, [], job_required_list
+    
+    if not job_required_list and not job_preferred_skills:
+        return 50.0, employee_skills_list, []
+    
+    required_matches = [skill for skill in job_required_list if legacy_skill_matches(skill, employee_skills_list)]
+    preferred_matches = [skill for skill in job_preferred_list if legacy_skill_matches(skill, employee_skills_list)]
+    missing_required = [skill for skill in job_required_list if not legacy_skill_matches(skill, employee_skills_list)]
+
+    required_match_pct = len(required_matches) / len(job_required_list) if job_required_list else 1.0
+    preferred_match_pct = len(preferred_matches) / len(job_preferred_list) if job_preferred_list else 1.0
+
+    if job_required_list and job_preferred_list:
+        required_weight, preferred_weight = 0.7, 0.3
+    elif job_required_list:
+        required_weight, preferred_weight = 1.0, 0.0
+    else:
+        required_weight, preferred_weight = 0.0, 1.0
+    
+    skill_score = (required_match_pct * required_weight + preferred_match_pct * preferred_weight) * 90
+    contract_bonus = 10 if employee_preferred_contract and job_type and employee_preferred_contract == job_type else 0
+    final_score = min(100, skill_score + contract_bonus)
+    all_matches = required_matches + [s for s in preferred_matches if s not in required_matches]
+    
+    return round(final_score, 1), all_matches, missing_required
+
+ALIASES = ['js', 'ts', 'reactjs', 'node', 'py', 'aws', 'gcp', 'k8s', 'ml', 'postgres', 'mongo', 'ci/cd']
+
+def generate_skills(rng, low, high):
+    skills = rng.sample(SeedCommand.ALL_TECHNICAL_SKILLS + SeedCommand.SOFT_SKILLS + ALIASES, rng.randint(low, high))
+    return ', '.join(skills)
+
+def generate_pairs(count, seed=404):
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        pairs.append((
+            generate_skills(rng, 0, 12),
+            generate_skills(rng, 1, 6),
+            generate_skills(rng, 0, 4),
+            rng.choice(['FT', 'PT', '']),
+            rng.choice(['FT', 'PT']),
+        ))
+    return pairs
+
+def score_employee_against_jobs(employee_skills, jobs):
+    """The scoring loop of JobMatcher.match_employee_to_jobs: one compiled profile reused for every job."""
+    employee_skills_list = JobMatcher._parse_skills(employee_skills)
+    profile = SkillProfile.for_skills(employee_skills_list) if employee_skills_list else None
+    return [
+        JobMatcher._score(profile, JobMatcher._parse_skills(needed), JobMatcher._parse_skills(wanted), wanted, 'FT', job_type)
+        for needed, wanted, job_type in jobs
+    ]
+
+def run(stdout, repeat=5, size=2000):
+    pairs = generate_pairs(size)
+    jobs = [(needed, wanted, job_type) for _, needed, wanted, _, job_type in pairs]
+    employee_skills = pairs[0][0] or 'Python, Django, JS, AWS, Communication'
+
+    mismatches = sum(1 for pair in pairs if legacy_match_score(*pair) != JobMatcher.calculate_match_score(*pair))
+    mismatches += sum(
+        1 for job, score in zip(jobs, score_employee_against_jobs(employee_skills, jobs))
+        if legacy_match_score(employee_skills, job[0], job[1], 'FT', job[2]) != score
+    )
+    stdout.write(f"Scored {len(pairs)} (employee, job) pairs; {mismatches} differ from the legacy implementation")
+
+    results = {'pairs': len(pairs), 'mismatches': mismatches}
+    workloads = [
+        ('calculate_match_score, distinct pairs',
+         lambda: [legacy_match_score(*pair) for pair in pairs],
+         lambda: _cached_profile.cache_clear() or [JobMatcher.calculate_match_score(*pair) for pair in pairs]),
+        ('one employee against every job',
+         lambda: [legacy_match_score(employee_skills, needed, wanted, 'FT', job_type) for needed, wanted, job_type in jobs],
+         lambda: score_employee_against_jobs(employee_skills, jobs)),
+    ]
+    for label, legacy_func, compiled_func in workloads:
+        legacy = best_of(legacy_func, repeat)
+        compiled = best_of(compiled_func, repeat)
+        report(stdout, f"legacy: {label}", legacy, len(pairs))
+        report(stdout, f"compiled: {label}", compiled, len(pairs))
+        stdout.write(f"Speedup: {legacy / compiled:.1f}x")
+        results[label] = {'legacy_seconds': legacy, 'compiled_seconds': compiled}
+
+    return results
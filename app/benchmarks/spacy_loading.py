@@ -0,0 +1,37 @@
+"""Cold start time and peak RSS of fresh processes, with the spaCy model loaded at import (the old behaviour)
+and loaded lazily without the unused components."""
+
+import json
+import subprocess
+import sys
+
+SCENARIOS = [
+    ("django.setup() only", ""),
+    ("legacy: import helper, full en_core_web_sm", "import app.helper, spacy; spacy.load('en_core_web_sm')"),
+    ("lazy: import helper", "import app.helper"),
+    ("lazy: import helper and extract one name", "from app.helper import extract_name; extract_name('Jane Doe\\nEngineer')"),
+]
+
+SCRIPT = """
+import json, resource, time
+start = time.perf_counter()
+import django
+django.setup()
+{code}
+print(json.dumps({{'seconds': time.perf_counter() - start,
+                  'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+def measure(code):
+    output = subprocess.run([sys.executable, '-c', SCRIPT.format(code=code)], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def run(stdout, repeat=5):
+    results = {}
+    for label, code in SCENARIOS:
+        runs = [measure(code) for _ in range(repeat)]
+        seconds = min(run['seconds'] for run in runs)
+        rss_mb = min(run['rss_kb'] for run in runs) / 1024
+        stdout.write(f"{label:<50} {seconds * 1000:10.2f} ms  {rss_mb:10.1f} MB peak RSS")
+        results[label] = {'seconds': seconds, 'rss_mb': rss_mb}
+    return results
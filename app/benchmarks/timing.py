@@ -0,0 +1,41 @@
+import math
+import time
+
+def best_of(func, repeat=5, number=1):
+    """Returns the fastest wall-clock time in seconds of ``number`` calls to func over ``repeat`` rounds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def report(stdout, label, seconds, operations):
+    stdout.write(f"{label:<50} {seconds * 1000:10.2f} ms  {operations / seconds:14,.0f} ops/sec")
+
+def scaling_exponent(seconds_by_size):
+    """Least-squares slope of log(seconds) against log(size): about 1 for linear work, 2 for quadratic"""
+    points = [(math.log(size), math.log(seconds)) for size, seconds in seconds_by_size.items() if seconds > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread if spread else None
+
+def report_curve(stdout, label, seconds_by_size, unit='items'):
+    """Reports one call per size and the scaling exponent of the curve, which it returns"""
+    for size, seconds in seconds_by_size.items():
+        report(stdout, f"{label} [{size} {unit}]", seconds, 1)
+    exponent = scaling_exponent(seconds_by_size)
+    if exponent is not None:
+        stdout.write(f"{label} scales as n^{exponent:.2f}")
+    return exponent
+
+def regressions(baseline, current, threshold):
+    """(label, baseline, current) for every ops/sec figure more than threshold (a fraction) below its baseline"""
+    return [
+        (label, baseline[label], rate) for label, rate in current.items()
+        if baseline.get(label) and rate < baseline[label] * (1 - threshold)
+    ]
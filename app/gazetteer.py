@@ -0,0 +1,61 @@
+import json
+import re
+from pathlib import Path
+
+DATA_FILE = Path(__file__).resolve().parent / 'data' / 'cv_gazetteers.json'
+
+class Gazetteer:
+    """A dictionary of terms compiled into one regex, so all occurrences are found in a single scan of a text.
+
+    Matching is case-insensitive against lowercased text. With whole_words, a term only matches where it is
+    not directly preceded or followed by a word character (like \\b around terms that start and end with one).
+    """
+
+    def __init__(self, terms, whole_words=True):
+        self.terms = list(dict.fromkeys(terms))
+        self.whole_words = whole_words
+
+        self._terms_by_lower = {}
+        for term in self.terms:
+            self._terms_by_lower.setdefault(term.lower(), []).append(term)
+
+        # Longest alternatives first, so a position reports its longest term; shorter terms starting at the
+        # same position are necessarily prefixes of it and are recovered from _prefixes.
+        lowered = sorted(self._terms_by_lower, key=len, reverse=True)
+        self._prefixes = {
+            term: [other for other in lowered if other != term and term.startswith(other)]
+            for term in lowered
+        }
+        alternation = '|'.join(re.escape(term) for term in lowered) or '(?!)'
+        if whole_words:
+            self._pattern = re.compile(rf'(?<!\w)(?=({alternation})(?!\w))')
+        else:
+            self._pattern = re.compile(rf'(?=({alternation}))')
+
+    def find(self, lowered_text):
+        """Returns the set of terms (original spelling) occurring in already lowercased text"""
+        found = set()
+        for match in self._pattern.finditer(lowered_text):
+            longest = match.group(1)
+            found.update(self._terms_by_lower[longest])
+            for prefix in self._prefixes[longest]:
+                end = match.start() + len(prefix)
+                if not self.whole_words or end >= len(lowered_text) or not _is_word_char(lowered_text[end]):
+                    found.update(self._terms_by_lower[prefix])
+        return found
+
+    def in_order(self, lowered_text):
+        """The terms occurring in lowered_text, in dictionary order (for callers that act on the first match)"""
+        found = self.find(lowered_text)
+        return [term for term in self.terms if term in found] if found else []
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+def load_gazetteers(substring_lists=(), path=DATA_FILE):
+    """Builds one Gazetteer per list in the data file; the lists named in substring_lists also match inside words"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return {name: Gazetteer(terms, whole_words=name not in substring_lists) for name, terms in data.items()}
@@ -1,33 +1,139 @@
-import pdfplumber
-import spacy
 import re
 import fitz
+import threading
+from functools import cached_property
+from django.conf import settings
+from app.gazetteer import Gazetteer, load_gazetteers
 
-nlp = spacy.load("en_core_web_sm")
+class SpacyPipeline:
+    """A spaCy model loaded on first use and then shared by the whole process.
 
-def is_valid_pdf(pdf_path):
-    """Check if a file is a valid PDF before attempting to parse it."""
-    try:
-        doc = fitz.open(pdf_path)
-        return len(doc) > 0
-    except Exception:
-        return False
+    Importing this module (every web worker and management command does, through the views) no longer imports
+    spaCy or loads the model; only processes that actually extract names pay for it. Components that name
+    extraction does not need are excluded, so they are never loaded into memory.
+    """
+
+    def __init__(self, model, exclude=()):
+        self.model = model
+        self.exclude = list(exclude)
+        self._nlp = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._nlp is not None
+
+    def load(self):
+        if self._nlp is None:
+            with self._lock:
+                if self._nlp is None:
+                    import spacy
+                    self._nlp = spacy.load(self.model, exclude=self.exclude)
+        return self._nlp
+
+    def __call__(self, text):
+        return self.load()(text)
+
+    def pipe(self, texts, **kwargs):
+        return self.load().pipe(texts, **kwargs)
+
+nlp = SpacyPipeline("en_core_web_sm", exclude=["parser", "lemmatizer", "attribute_ruler", "tagger"])
+
+# The candidate's name sits at the top of a CV; NER over the rest of the document only costs time.
+NAME_SEARCH_CHARS = 1000
+
+# Dictionaries from app/data/cv_gazetteers.json, compiled once per process. The extractors always tested context
+# skills, specific interests and languages as plain substrings, so those keep matching inside words.
+GAZETTEERS = load_gazetteers(substring_lists={'context_skills', 'specific_interests', 'languages'})
+INTEREST_SUBSTRINGS = Gazetteer(GAZETTEERS['interests'].terms, whole_words=False)
+
+def iter_pdf_text(pdf_path, max_pages=None, max_chars=None):
+    """Yields the non-empty text of successive pages, stopping after max_pages pages or max_chars characters.
+
+    The document is opened once and only the pages read are loaded, so a huge scan costs no more than the budget.
+    Raises if the file is not a PDF or is encrypted.
+    """
+    max_pages = settings.CV_PDF_MAX_PAGES if max_pages is None else max_pages
+    remaining = settings.CV_PDF_MAX_CHARS if max_chars is None else max_chars
+
+    with fitz.open(pdf_path) as doc:
+        if doc.needs_pass:
+            raise ValueError("PDF is encrypted")
+        for page_number in range(min(len(doc), max_pages)):
+            text = doc[page_number].get_text().strip()
+            if not text:
+                continue
+            yield text[:remaining]
+            remaining -= len(text)
+            if remaining <= 0:
+                return
 
 def extract_text_from_pdf(pdf_path):
     """Extract text from a PDF, ensuring it is valid."""
-    
-    text = ""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                extracted_text = page.extract_text()
-                if extracted_text:
-                    text += extracted_text + "\n"
-        return text.strip()
-    except Exception as e:
+        return "\n".join(iter_pdf_text(pdf_path)).strip()
+    except Exception:
         return ""
 
 
+class CVDocument(str):
+    """CV text that is lowercased, split into lines and tokenised once, then shared by all the extractors.
+
+    It is a str, so extractors still accept plain text; they wrap it with CVDocument.of.
+    """
+
+    @classmethod
+    def of(cls, text):
+        return text if isinstance(text, cls) else cls(text)
+
+    @cached_property
+    def lowered(self):
+        return self.lower()
+
+    @cached_property
+    def lines(self):
+        return self.split('\n')
+
+    @cached_property
+    def lines_lower(self):
+        return self.lowered.split('\n')
+
+    @cached_property
+    def words(self):
+        return set(re.findall(r'\b\w+\b', self.lowered))
+
+    @cached_property
+    def _sections(self):
+        return {}
+
+    def section(self, start_keywords, end_keywords):
+        """Stripped non-empty lines after a line containing a start keyword, until a line containing an end keyword"""
+        key = (tuple(start_keywords), tuple(end_keywords))
+        if key not in self._sections:
+            starts = [keyword.lower() for keyword in start_keywords]
+            ends = [keyword.lower() for keyword in end_keywords]
+            content = []
+            in_section = False
+            for line, line_lower in zip(self.lines, self.lines_lower):
+                if not in_section and any(keyword in line_lower for keyword in starts):
+                    in_section = True
+                    continue
+                stripped = line.strip()
+                if in_section and stripped and any(keyword in line_lower for keyword in ends):
+                    in_section = False
+                if in_section and stripped:
+                    content.append(stripped)
+            self._sections[key] = content
+        return self._sections[key]
+
+    def lines_containing(self, keywords):
+        """Stripped lines containing any of the keywords, case-insensitively"""
+        keywords = [keyword.lower() for keyword in keywords]
+        return [
+            line.strip() for line, line_lower in zip(self.lines, self.lines_lower)
+            if any(keyword in line_lower for keyword in keywords)
+        ]
+
 def extract_email(text):
     match = re.search(r'[\w\.-]+@[\w\.-]+', text)
     return match.group(0) if match else None
@@ -37,7 +143,15 @@ def extract_phone_number(text):
     return match.group(0) if match else None
 
 def extract_name(text):
-    doc = nlp(text)
+    doc = nlp(str(text)[:NAME_SEARCH_CHARS])
+    return _person_in(doc)
+
+def extract_names(texts, batch_size=64, n_process=1):
+    """extract_name for many CVs at once, streaming them through nlp.pipe"""
+    docs = nlp.pipe((str(text)[:NAME_SEARCH_CHARS] for text in texts), batch_size=batch_size, n_process=n_process)
+    return [_person_in(doc) for doc in docs]
+
+def _person_in(doc):
     for ent in doc.ents:
         if ent.label_ == "PERSON":
             return ent.text
@@ -45,49 +159,17 @@ def extract_name(text):
 
 def extract_education(text):
     education_keywords = ["Bachelor", "Master", "PhD", "Degree", "University", "College", "BSc", "MSc", "MBA"]
-    education_info = []
-    for line in text.split("\n"):
-        if any(keyword.lower() in line.lower() for keyword in education_keywords):
-            education_info.append(line.strip())
-    return education_info
+    return CVDocument.of(text).lines_containing(education_keywords)
 
 def extract_experience(text):
     """Busca menciones de experiencia laboral en el CV."""
     experience_keywords = ["Experience", "Internship", "Worked at", "Company", "Job", "Position"]
-    experience_info = []
-    for line in text.split("\n"):
-        if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-            experience_info.append(line.strip())
-    return experience_info
+    return CVDocument.of(text).lines_containing(experience_keywords)
 
 def extract_skills(text):
     """
     Extract skills from CV text using a more reliable approach that filters out non-skills.
     """
-    common_skills = [
-        # Technical Skills
-        "Python", "Java", "C++", "C#", "JavaScript", "TypeScript", "Ruby", "PHP", "Go", "Swift", 
-        "SQL", "MySQL", "PostgreSQL", "MongoDB", "AWS", "Azure", "GCP", "Docker", "Kubernetes",
-        "Git", "GitHub", "Jenkins", "CI/CD", "React", "Angular", "Vue", "Django", "Flask", 
-        "TensorFlow", "PyTorch", "Machine Learning", "Data Science", "AI", "Data Analysis",
-        "Web Development", "Mobile Development", "Android", "iOS", "Excel", "PowerPoint", "Word",
-        
-        # Engineering Skills
-        "CAD", "AutoCAD", "SolidWorks", "MATLAB", "Simulink", "Circuit Design", "PCB Design",
-        "Mechanical Engineering", "Civil Engineering", "Electrical Engineering", "Aerospace Engineering",
-        "Structural Analysis", "Fluid Dynamics", "Thermodynamics", "Control Systems",
-        
-        # Transferable Skills
-        "Project Management", "Teamwork", "Leadership", "Communication", "Problem Solving",
-        "Critical Thinking", "Time Management", "Customer Service", "Sales", "Negotiation",
-        "Conflict Resolution", "Presentation", "Public Speaking", "Report Writing", "Research",
-        
-        # Industry-Specific
-        "Vehicle Maintenance", "Repair", "Servicing", "Diagnostics", "Parts Management",
-        "Warehouse Management", "Inventory Control", "Stock Management", "Customer Support",
-        "Technical Support", "Quality Assurance", "Quality Control"
-    ]
-    
     exclude_sections = [
         "REFERENCES", "EDUCATION", "WORK EXPERIENCE", "INTERESTS", "HOBBIES", 
         "CONTACT", "PROFILE", "SUMMARY", "OBJECTIVE", "NAME"
@@ -103,31 +185,13 @@ def extract_skills(text):
         "wherever needed", "wherever required"
     ]
     
-    found_skills = set()
-    
-    for skill in common_skills:
-        if skill.lower() in text.lower():
-            words = re.findall(r'\b\w+\b', text.lower())
-            if skill.lower() in words:
-                found_skills.add(skill)
+    document = CVDocument.of(text)
+    found_skills = GAZETTEERS['skills'].find(document.lowered)
     
     skills_keywords = ["Skills", "Technical Skills", "Core Competencies", "Competencies", 
                        "Key Skills", "Professional Skills", "Technical Proficiencies"]
     
-    lines = text.split('\n')
-    in_skills_section = False
-    skills_section_content = []
-    
-    for i, line in enumerate(lines):
-        if any(keyword.lower() in line.lower() for keyword in skills_keywords) and not in_skills_section:
-            in_skills_section = True
-            continue
-        
-        if in_skills_section and line.strip() and any(keyword.lower() in line.lower() for keyword in exclude_sections):
-            in_skills_section = False
-        
-        if in_skills_section and line.strip():
-            skills_section_content.append(line.strip())
+    skills_section_content = document.section(skills_keywords, exclude_sections)
     
     if skills_section_content:
         for line in skills_section_content:
@@ -157,16 +221,7 @@ def extract_skills(text):
                 
                 found_skills.add(skill)
     
-    context_skills = [
-        "Vehicle Maintenance", "Vehicle Repair", "Parts Management", "Warehouse Management",
-        "Stock Control", "Customer Service", "Food Preparation", "Kitchen Operations",
-        "Industrial Dishwasher Operation", "Cleaning", "Money Handling", "Retail Operations",
-        "Technical Apprenticeship", "Vehicle Servicing", "Workshop Operations"
-    ]
-    
-    for skill in context_skills:
-        if skill.lower() in text.lower():
-            found_skills.add(skill)
+    found_skills |= GAZETTEERS['context_skills'].find(document.lowered)
     
     filtered_skills = set()
     for skill in found_skills:
@@ -183,33 +238,6 @@ def extract_interests(text):
     Extract genuine interests and hobbies from CV text using a more reliable approach
     that filters out non-interest content.
     """
-    # Common interest and hobby keywords to look for
-    common_interests = [
-        # Sports & Physical Activities
-        "Soccer", "Football", "Basketball", "Tennis", "Golf", "Swimming", "Cycling", 
-        "Running", "Hiking", "Climbing", "Yoga", "Fitness", "Gym", "Martial Arts",
-        "Badminton", "Kayaking", "Sports", "Athletics", "Boxing", "Skiing", "Snowboarding",
-        
-        # Creative Activities
-        "Photography", "Painting", "Drawing", "Writing", "Reading", "Poetry", "Music",
-        "Singing", "Dancing", "Guitar", "Piano", "Drums", "Art", "Crafts", "Design",
-        "Cooking", "Baking", "Knitting", "Sewing", "Theatre", "Acting",
-        
-        # Tech & Intellectual Interests
-        "Programming", "Coding", "Technology", "Computers", "Robotics", "Electronics",
-        "Science", "Physics", "Astronomy", "Space", "History", "Philosophy", "Politics",
-        "Psychology", "Literature", "Languages", "Learning", "Research", "Chess",
-        
-        # Travel & Exploration
-        "Traveling", "Travel", "Backpacking", "Camping", "Hiking", "Sightseeing",
-        "Exploring", "Adventure", "Outdoors", "Nature", "Wildlife", "Environment",
-        
-        # Social & Entertainment
-        "Volunteering", "Community Service", "Charity", "Mentoring", "Teaching",
-        "Movies", "Cinema", "Theatre", "Gaming", "Video Games", "Board Games",
-        "Socializing", "Networking", "Events", "Festivals", "Concerts"
-    ]
-    
     exclude_sections = [
         "REFERENCES", "EDUCATION", "WORK EXPERIENCE", "SKILLS", "CONTACT", 
         "PROFILE", "SUMMARY", "OBJECTIVE", "NAME"
@@ -228,20 +256,8 @@ def extract_interests(text):
         "Extracurricular Activities", "Leisure Activities", "Pastimes"
     ]
     
-    lines = text.split('\n')
-    in_interest_section = False
-    interest_section_content = []
-    
-    for i, line in enumerate(lines):
-        if any(keyword.lower() in line.lower() for keyword in interest_section_keywords) and not in_interest_section:
-            in_interest_section = True
-            continue
-        
-        if in_interest_section and line.strip() and any(keyword.lower() in line.lower() for keyword in exclude_sections):
-            in_interest_section = False
-        
-        if in_interest_section and line.strip():
-            interest_section_content.append(line.strip())
+    document = CVDocument.of(text)
+    interest_section_content = document.section(interest_section_keywords, exclude_sections)
     
     if interest_section_content:
         for line in interest_section_content:
@@ -265,32 +281,28 @@ def extract_interests(text):
                     
                 found_interests.add(interest)
     
-    for interest in common_interests:
-        pattern = r'\b' + re.escape(interest.lower()) + r'\b'
-        if re.search(pattern, text.lower()):
-            genuine_interests.add(interest)
+    genuine_interests |= GAZETTEERS['interests'].find(document.lowered)
     
-    interest_phrases = re.findall(r'interested in\s+(.+?)(?:\.|\,|\;|\n)', text.lower())
+    interest_phrases = re.findall(r'interested in\s+(.+?)(?:\.|\,|\;|\n)', document.lowered)
     for phrase in interest_phrases:
         clean_phrase = phrase.strip()
         if clean_phrase and len(clean_phrase.split()) <= 7: 
-            for interest in common_interests:
-                if interest.lower() in clean_phrase:
-                    match_pos = clean_phrase.find(interest.lower())
-                    start_pos = max(0, match_pos - 20)
-                    end_pos = min(len(clean_phrase), match_pos + len(interest) + 20)
-                    context = clean_phrase[start_pos:end_pos]
+            for interest in INTEREST_SUBSTRINGS.find(clean_phrase):
+                match_pos = clean_phrase.find(interest.lower())
+                start_pos = max(0, match_pos - 20)
+                end_pos = min(len(clean_phrase), match_pos + len(interest) + 20)
+                context = clean_phrase[start_pos:end_pos]
                     
-                    context_words = context.split()
-                    if len(context_words) > 1:
-                        for i in range(len(context_words)):
-                            if interest.lower() in context_words[i].lower():
-                                end_idx = min(i + 4, len(context_words))
-                                phrase = " ".join(context_words[i:end_idx])
-                                if phrase and not any(exclude.lower() in phrase.lower() for exclude in exclude_sections):
-                                    genuine_interests.add(phrase.capitalize())
-                    else:
-                        genuine_interests.add(interest)
+                context_words = context.split()
+                if len(context_words) > 1:
+                    for i in range(len(context_words)):
+                        if interest.lower() in context_words[i].lower():
+                            end_idx = min(i + 4, len(context_words))
+                            phrase = " ".join(context_words[i:end_idx])
+                            if phrase and not any(exclude.lower() in phrase.lower() for exclude in exclude_sections):
+                                genuine_interests.add(phrase.capitalize())
+                else:
+                    genuine_interests.add(interest)
     
     for item in found_interests:
         if len(item.split()) > 5:
@@ -299,30 +311,20 @@ def extract_interests(text):
         if any(item.lower().startswith(indicator + " ") for indicator in non_interest_indicators):
             continue
             
-        contains_interest = False
-        for interest in common_interests:
-            if interest.lower() in item.lower():
-                contains_interest = True
-                interest_parts = item.split()
-                if len(interest_parts) <= 2:  
-                    genuine_interests.add(item)
-                else:
-                    for part in interest_parts:
-                        if any(interest.lower() in part.lower() for interest in common_interests):
-                            genuine_interests.add(part)
-                break
+        contains_interest = bool(INTEREST_SUBSTRINGS.find(item.lower()))
+        if contains_interest:
+            interest_parts = item.split()
+            if len(interest_parts) <= 2:  
+                genuine_interests.add(item)
+            else:
+                for part in interest_parts:
+                    if INTEREST_SUBSTRINGS.find(part.lower()):
+                        genuine_interests.add(part)
         
         if not contains_interest and 1 <= len(item.split()) <= 3:
             genuine_interests.add(item)
     
-    specific_interests = [
-        "Guitar", "Martial Arts", "Kayaking", "Badminton",
-        "UK Space Industry", "Renewable Energy", "Bio-technology"
-    ]
-    
-    for interest in specific_interests:
-        if interest.lower() in text.lower():
-            genuine_interests.add(interest)
+    genuine_interests |= GAZETTEERS['specific_interests'].find(document.lowered)
     
     final_interests = set()
     for interest in genuine_interests:
@@ -342,25 +344,6 @@ def extract_languages(text):
     Looks for dedicated language sections and common language mentions while
     filtering out non-language content.
     """
-    common_languages = [
-        "English", "Spanish", "French", "German", "Portuguese", "Italian", "Dutch", "Russian",
-        "Arabic", "Chinese", "Mandarin", "Cantonese", "Japanese", "Korean", "Hindi", "Bengali",
-        "Urdu", "Turkish", "Vietnamese", "Thai", "Indonesian", "Malay", "Filipino", "Tagalog",
-        
-        "Swedish", "Norwegian", "Danish", "Finnish", "Polish", "Czech", "Slovak", "Hungarian",
-        "Romanian", "Bulgarian", "Greek", "Albanian", "Serbian", "Croatian", "Slovenian",
-        "Ukrainian", "Belarusian", "Lithuanian", "Latvian", "Estonian", "Icelandic", "Irish",
-        "Welsh", "Gaelic", "Catalan", "Basque", "Galician", "Luxembourgish", "Maltese",
-        
-        "Punjabi", "Telugu", "Tamil", "Marathi", "Gujarati", "Kannada", "Malayalam", 
-        "Nepali", "Sinhalese", "Burmese", "Khmer", "Lao", "Mongolian", "Kazakh", "Uzbek",
-        
-        "Hebrew", "Persian", "Farsi", "Kurdish", "Armenian", "Georgian", "Azerbaijani",
-        
-        "Swahili", "Amharic", "Somali", "Yoruba", "Igbo", "Hausa", "Zulu", "Xhosa", 
-        "Afrikaans", "Malagasy", "Oromo"
-    ]
-    
     exclude_sections = [
         "REFERENCES", "EDUCATION", "WORK EXPERIENCE", "SKILLS", "INTERESTS", "HOBBIES",
         "CONTACT", "PROFILE", "SUMMARY", "OBJECTIVE", "NAME"
@@ -381,20 +364,8 @@ def extract_languages(text):
         "Spoken Languages", "Language Competencies"
     ]
     
-    lines = text.split('\n')
-    in_language_section = False
-    language_section_content = []
-    
-    for i, line in enumerate(lines):
-        if any(keyword.lower() in line.lower() for keyword in language_section_keywords) and not in_language_section:
-            in_language_section = True
-            continue
-        
-        if in_language_section and line.strip() and any(keyword.lower() in line.lower() for keyword in exclude_sections):
-            in_language_section = False
-        
-        if in_language_section and line.strip():
-            language_section_content.append(line.strip())
+    document = CVDocument.of(text)
+    language_section_content = document.section(language_section_keywords, exclude_sections)
     
     if language_section_content:
         for line in language_section_content:
@@ -414,52 +385,49 @@ def extract_languages(text):
                     continue
                     
                 contains_language = False
-                for language in common_languages:
-                    if language.lower() in language_entry.lower():
-                        contains_language = True
+                for language in GAZETTEERS['languages'].in_order(language_entry.lower()):
+                    contains_language = True
                         
-                        if ':' in language_entry:
-                            parts = language_entry.split(':')
-                            if language.lower() in parts[0].lower():
-                                found_languages.add(language_entry.strip())
-                                break
-                        elif '-' in language_entry:
-                            parts = language_entry.split('-')
-                            if language.lower() in parts[0].lower():
-                                found_languages.add(language_entry.strip())
-                                break
-                        elif '(' in language_entry and ')' in language_entry:
+                    if ':' in language_entry:
+                        parts = language_entry.split(':')
+                        if language.lower() in parts[0].lower():
                             found_languages.add(language_entry.strip())
                             break
-                        else:
-                            found_languages.add(language)
+                    elif '-' in language_entry:
+                        parts = language_entry.split('-')
+                        if language.lower() in parts[0].lower():
+                            found_languages.add(language_entry.strip())
                             break
+                    elif '(' in language_entry and ')' in language_entry:
+                        found_languages.add(language_entry.strip())
+                        break
+                    else:
+                        found_languages.add(language)
+                        break
                 
                 if not contains_language and len(language_entry.split()) <= 3:
                     found_languages.add(language_entry)
     
-    for line in lines:
-        line_lower = line.lower()
+    for line, line_lower in zip(document.lines, document.lines_lower):
         if any(pattern in line_lower for pattern in language_fluency_patterns):
-            for language in common_languages:
-                if language.lower() in line_lower:
-                    lang_pos = line_lower.find(language.lower())
-                    if lang_pos >= 0:
-                        for pattern in language_fluency_patterns:
-                            pattern_pos = line_lower.find(pattern)
-                            if pattern_pos >= 0:
-                                start_pos = min(lang_pos, pattern_pos)
-                                end_pos = max(lang_pos + len(language), pattern_pos + len(pattern))
+            for language in GAZETTEERS['languages'].find(line_lower):
+                lang_pos = line_lower.find(language.lower())
+                if lang_pos >= 0:
+                    for pattern in language_fluency_patterns:
+                        pattern_pos = line_lower.find(pattern)
+                        if pattern_pos >= 0:
+                            start_pos = min(lang_pos, pattern_pos)
+                            end_pos = max(lang_pos + len(language), pattern_pos + len(pattern))
                                 
-                                start_pos = max(0, start_pos - 5)
-                                end_pos = min(len(line), end_pos + 15)
+                            start_pos = max(0, start_pos - 5)
+                            end_pos = min(len(line), end_pos + 15)
                                 
-                                language_info = line[start_pos:end_pos].strip()
+                            language_info = line[start_pos:end_pos].strip()
                                 
-                                language_info = language_info.strip('.,;:()[]{}')
+                            language_info = language_info.strip('.,;:()[]{}')
                                 
-                                if language_info and len(language_info.split()) <= 5:
-                                    found_languages.add(language_info)
+                            if language_info and len(language_info.split()) <= 5:
+                                found_languages.add(language_info)
     
     filtered_languages = set()
     for entry in found_languages:
@@ -476,10 +444,18 @@ def extract_languages(text):
     
     return sorted(list(filtered_languages))
 
+# Bump whenever parse_cv's output changes so results cached by content hash are not reused.
+PARSER_VERSION = 4
+
 def parse_cv(pdf_path):
-    text = extract_text_from_pdf(pdf_path)
+    text = CVDocument(extract_text_from_pdf(pdf_path))
+    return extract_cv_data(text, extract_name(text))
+
+def extract_cv_data(text, name):
+    """parse_cv's result for already extracted text, with the name found by extract_name or extract_names"""
+    text = CVDocument.of(text)
     extracted_data = {
-        "Name": extract_name(text),
+        "Name": name,
         "E-mail": extract_email(text),
         "Phone": extract_phone_number(text),
         "Education": extract_education(text),
@@ -491,11 +467,9 @@ def parse_cv(pdf_path):
     return extracted_data
 
 ### EMAIL ###
-from django.template.loader import render_to_string
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
-from django.conf import settings
 from app.models import VerificationCode, User
+from app.services.email_outbox import EmailOutbox
+from app.services.email_templates import EmailTemplates
 
 def create_and_send_code_email(user, request, code_type, template, subject):
     try:
@@ -507,23 +481,10 @@ def create_and_send_code_email(user, request, code_type, template, subject):
         )
 
         current_site = "TappedIn"
-        context = {
-            'user': user,
-            'code': code,
-            'site_name': current_site,
-        }
-        email_content = render_to_string(template, context)
-        
-        message = Mail(
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to_emails=user.email,
-            subject=subject,
-            html_content=email_content
-        )
-        message.reply_to = settings.DEFAULT_FROM_EMAIL
+        html_content, text_content = EmailTemplates.render(template, user, code, current_site)
         
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        response = sg.send(message)
+        # Delivery happens in the send_emails worker, so a slow email API never holds up the request.
+        EmailOutbox.enqueue(user.email, subject, html_content, text_content)
         
         if code_type == 'email_verification':
             request.session['verification_email'] = user.email
@@ -543,10 +504,11 @@ def validate_verification_code(code, email, code_type):
     if not user:
         return False, None, None
         
+    # Served by verification_lookup_idx: an index seek on the equality columns, newest row first.
     verification = VerificationCode.objects.filter(
         user=user,
-        code=code,
         code_type=code_type,
+        code=code,
         is_used=False
     ).order_by('-created_at').first()
 
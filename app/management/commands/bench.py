@@ -0,0 +1,64 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from app.benchmarks import load
+from app.benchmarks.environment import git_commit, throwaway_database
+
+class Command(BaseCommand):
+    help = "Load-test the core user journeys against a seeded throwaway database and save the results as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employees', type=int, default=500)
+        parser.add_argument('--employers', type=int, default=50)
+        parser.add_argument('--jobs', type=int, default=1000)
+        parser.add_argument('--applications', type=int, default=5000)
+        parser.add_argument('--hot-applications', type=int, default=200,
+                            help='Applications to the job shown by the job_detail scenario')
+        parser.add_argument('--requests', type=int, default=30, help='Measured requests per scenario')
+        parser.add_argument('--warmup', type=int, default=3, help='Unmeasured requests per scenario')
+        parser.add_argument('--scenario', action='append', dest='scenarios',
+                            choices=[scenario.name for scenario in load.SCENARIOS], help='Run only these (repeatable)')
+        parser.add_argument('--output', help='JSON results file (default: bench_results/<timestamp>-<commit>.json)')
+        parser.add_argument('--compare', help='Earlier JSON results to print the changes against')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError('--requests must be at least 1')
+        previous = None
+        if options['compare']:
+            with open(options['compare']) as f:
+                previous = json.load(f)
+
+        with throwaway_database():
+            self.stdout.write('Seeding...')
+            dataset = load.seed(
+                employees=options['employees'], employers=options['employers'], jobs=options['jobs'],
+                applications=options['applications'], hot_applications=options['hot_applications']
+            )
+            self.stdout.write(', '.join(f'{count} {name}' for name, count in dataset.sizes.items()))
+            self.stdout.write(load.HEADER)
+            results = load.run(dataset, options['requests'], options['warmup'], options['scenarios'], self.stdout)
+
+        commit = git_commit()
+        document = {
+            'commit': commit,
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'database': connection.vendor,
+            'dataset': dataset.sizes,
+            'requests': options['requests'],
+            'scenarios': results,
+        }
+        output = Path(options['output'] or Path(settings.BASE_DIR) / 'bench_results' /
+                      f"{datetime.now():%Y%m%d-%H%M%S}-{commit or 'unknown'}.json")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(document, indent=2))
+        self.stdout.write(f'Saved {output}')
+
+        if previous:
+            self.stdout.write(f"Compared with {previous.get('commit') or options['compare']}:")
+            for line in load.compare(previous['scenarios'], results):
+                self.stdout.write(line)
+
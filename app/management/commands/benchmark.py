@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from app.benchmarks import BENCHMARKS
+from app.benchmarks.environment import git_commit
+from app.benchmarks.timing import regressions
+
+class Command(BaseCommand):
+    help = "Run a micro-benchmark and report timings"
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', choices=sorted(BENCHMARKS))
+        parser.add_argument('--repeat', type=int, default=5, help='Timing rounds; the fastest is reported')
+        parser.add_argument('--save', help='Write the ops/sec figures to this JSON file, for use as a later --baseline')
+        parser.add_argument('--baseline', help='Fail if any ops/sec figure dropped more than --threshold below this file')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Allowed drop from the baseline as a fraction (default: 0.2, i.e. 20%%)')
+
+    def handle(self, *args, **options):
+        if not 0 <= options['threshold'] < 1:
+            raise CommandError('--threshold must be between 0 and 1')
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline']) as f:
+                baseline = json.load(f)
+
+        results = BENCHMARKS[options['name']].run(self.stdout, repeat=options['repeat'])
+        if (options['save'] or baseline) and 'ops_per_sec' not in results:
+            raise CommandError(f"The {options['name']} benchmark does not report ops/sec figures")
+
+        if options['save']:
+            document = {'benchmark': options['name'], 'commit': git_commit(), 'ops_per_sec': results['ops_per_sec']}
+            Path(options['save']).write_text(json.dumps(document, indent=2))
+            self.stdout.write(f"Saved {options['save']}")
+
+        if baseline:
+            slower = regressions(baseline['ops_per_sec'], results['ops_per_sec'], options['threshold'])
+            if slower:
+                raise CommandError('\n'.join(
+                    [f"{len(slower)} regression(s) of more than {options['threshold']:.0%} against "
+                     f"{baseline.get('commit') or options['baseline']}:"] +
+                    [f"  {label}: {before:,.1f} -> {after:,.1f} ops/sec ({after / before - 1:+.0%})"
+                     for label, before, after in slower]
+                ))
+            self.stdout.write(f"No regression of more than {options['threshold']:.0%} against the baseline")
@@ -0,0 +1,77 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from app.helper import extract_cv_data, extract_names
+from app.services.cv_import import CVImporter
+from app.services.cv_worker import extract_cv_text, init_django
+
+class Command(BaseCommand):
+    help = "Create or update employee profiles from a directory of CV PDFs"
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help='Searched recursively for .pdf files')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Text extraction processes')
+        parser.add_argument('--batch-size', type=int, default=64, help='Texts per nlp.pipe batch')
+        parser.add_argument('--n-process', type=int, default=1, help='nlp.pipe processes for name extraction')
+        parser.add_argument('--chunk-size', type=int, default=500, help='CVs extracted and saved per round')
+
+    def handle(self, *args, **options):
+        directory = Path(options['directory'])
+        if not directory.is_dir():
+            raise CommandError(f"{directory} is not a directory")
+
+        paths = sorted(str(path) for path in directory.rglob('*') if path.suffix.lower() == '.pdf' and path.is_file())
+        if not paths:
+            self.stdout.write("No PDF files found")
+            return
+
+        workers = max(1, options['workers'])
+        chunk_size = max(1, options['chunk_size'])
+        created = updated = failed = 0
+        start = time.perf_counter()
+        self.stdout.write(f"Importing {len(paths)} CVs with {workers} extraction worker(s)")
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_django) as pool:
+            for offset in range(0, len(paths), chunk_size):
+                chunk = paths[offset:offset + chunk_size]
+                chunk_created, chunk_updated, failures = self._import(pool, chunk, workers, options)
+                created += chunk_created
+                updated += chunk_updated
+                failed += len(failures)
+                for path, reason in failures:
+                    self.stderr.write(f"{path}: {reason}")
+
+                done = offset + len(chunk)
+                rate = done / (time.perf_counter() - start)
+                self.stdout.write(f"[{done}/{len(paths)}] {created} created, {updated} updated, {failed} failed ({rate:.1f} CVs/s)")
+
+        seconds = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {created + updated} of {len(paths)} CVs in {seconds:.1f}s ({len(paths) / seconds:.1f} CVs/s): "
+            f"{created} created, {updated} updated, {failed} failed"
+        ))
+
+    def _import(self, pool, paths, workers, options):
+        """Extracts text in the pool, names in one nlp.pipe pass and saves the chunk in one transaction"""
+        failures = []
+        texts = []
+        for path, text in pool.map(extract_cv_text, paths, chunksize=max(1, len(paths) // (workers * 4))):
+            if text:
+                texts.append((path, text))
+            else:
+                failures.append((path, 'no text could be extracted'))
+
+        names = extract_names([text for _, text in texts], batch_size=options['batch_size'], n_process=options['n_process'])
+        parsed = []
+        for (path, text), name in zip(texts, names):
+            try:
+                parsed.append((path, extract_cv_data(text, name)))
+            except Exception as e:
+                failures.append((path, f"{type(e).__name__}: {e}"))
+
+        created, updated, save_failures = CVImporter.save(parsed)
+        return created, updated, failures + save_failures
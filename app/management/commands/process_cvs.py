@@ -0,0 +1,77 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from app.services.cv_cache import ParsedCVCache
+from app.services.cv_pipeline import CVPipeline
+from app.services.cv_worker import init_worker, parse_cv_file
+
+class Command(BaseCommand):
+    help = "Parse queued CVs in a pool of worker processes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parser processes')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--stale-after', type=int, default=600, help='Seconds before a processing job is requeued')
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        self.stdout.write(f"Processing CVs with {workers} worker(s)")
+
+        while True:
+            # Spawned (not forked) children start clean instead of inheriting the parent's database connections.
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=init_worker) as pool:
+                try:
+                    drained = self._run(pool, workers, options)
+                except BrokenProcessPool:
+                    self.stderr.write("A parser process died; restarting the pool")
+                    continue
+            if drained:
+                return
+
+    def _run(self, pool, workers, options):
+        """Feeds claimed jobs to the pool until the queue is empty (with --once) or the pool breaks"""
+        while True:
+            CVPipeline.requeue_stale(options['stale_after'])
+            jobs = CVPipeline.claim(workers * 2)
+            if not jobs:
+                if options['once']:
+                    return True
+                time.sleep(options['poll_interval'])
+                continue
+
+            # Identical documents are parsed once per batch, and not at all if another worker already cached them.
+            by_document = {}
+            for job in jobs:
+                cached = ParsedCVCache.get(job.content_hash)
+                if cached is not None:
+                    CVPipeline.finish(job, 'done', cached)
+                    self.stdout.write(f"CV job {job.id}: done (cached)")
+                else:
+                    by_document.setdefault(job.content_hash or f"job-{job.id}", []).append(job)
+
+            futures = {
+                pool.submit(parse_cv_file, os.path.join(settings.MEDIA_ROOT, same[0].file_path)): same
+                for same in by_document.values()
+            }
+            unfinished = set(futures)
+            try:
+                for future in as_completed(futures):
+                    try:
+                        status, outcome = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        status, outcome = 'failed', f"{type(e).__name__}: {e}"
+                    for job in futures[future]:
+                        CVPipeline.finish(job, status, outcome)
+                        self.stdout.write(f"CV job {job.id}: {status}")
+                    unfinished.discard(future)
+            except BrokenProcessPool:
+                CVPipeline.release([job for future in unfinished for job in futures[future]])
+                raise
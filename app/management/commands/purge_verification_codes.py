@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from app.services.verification_codes import VerificationCodePurge
+
+class Command(BaseCommand):
+    help = "Delete used and expired verification codes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Codes deleted per statement')
+
+    def handle(self, *args, **options):
+        deleted = VerificationCodePurge.purge(max(1, options['batch_size']))
+        self.stdout.write(f"Deleted {deleted} verification code(s)")
@@ -1,20 +1,25 @@
-from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
 from app.models import Admin, Employee, Employer, User, Job, JobApplication
 from random import choices, randint, sample
 from faker import Faker
 from datetime import datetime
 import pytz
 from project.constants import COUNTRIES
+from app.services.bulk_writer import BulkWriter
 from app.services.job_matcher import JobMatcher
 import random
  
 class Command(BaseCommand):
-    help = "Seed the database with initial data"
+    help = "Seed the database with initial data, topping it up to the requested numbers of users, jobs and applications"
 
     USER_COUNT = 100
     JOB_COUNT = 200
     APPLICATION_COUNT = 500
     DEFAULT_PASSWORD = 'Password123'
+    BATCH_SIZE = 2000
+    # Generated applications draw their free text from pools this size instead of calling Faker for every row
+    TEXT_POOL_SIZE = 500
 
     SKILL_CATEGORIES = {
         'Software Engineering': [
@@ -71,75 +76,104 @@ class Command(BaseCommand):
     ALL_TECHNICAL_SKILLS = list(set(ALL_TECHNICAL_SKILLS))  
 
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         self.faker = Faker('en_GB')
 
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=self.USER_COUNT, help='Total admins, employers and employees')
+        parser.add_argument('--jobs', type=int, default=self.JOB_COUNT, help='Total jobs')
+        parser.add_argument('--applications', type=int, default=self.APPLICATION_COUNT, help='Total applications')
+        parser.add_argument('--batch-size', type=int, default=self.BATCH_SIZE, help='Rows per bulk insert')
+
     def handle(self, *args, **options):
-        self.create_users()
-        self.admins = Admin.objects.all()
-        self.employees = Employee.objects.all()
-        self.employers = Employer.objects.all()
-        self.create_jobs()
-        self.create_applications()
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+        self.batch_size = options['batch_size']
+        # Hashing is deliberately slow, so every seeded account shares one hash of DEFAULT_PASSWORD.
+        self.password = make_password(self.DEFAULT_PASSWORD)
+
+        self.create_users(options['users'])
+        # The default profile managers annotate email, whose property setter saves the user row for every loaded profile.
+        self.admins = list(Admin._base_manager.select_related('user'))
+        self.employees = list(Employee._base_manager.select_related('user'))
+        self.employers = list(Employer._base_manager.select_related('user'))
+        self.create_jobs(options['jobs'])
+        self.create_applications(options['applications'])
+        # Rebuilds the search index and bumps the shared catalog version, so the web workers' rankings are dropped too.
+        BulkWriter.finish()
+
+    def progress(self, label, done, total):
+        self.stdout.write(f"Seeding {label} {done}/{total}", ending='\r')
+
+    def batches(self, rows):
+        for start in range(0, len(rows), self.batch_size):
+            yield rows[start:start + self.batch_size]
 
     # User seeding
-    def create_users(self):
-        self.generate_fixtures_users()
-        self.generate_random_users()
+    def create_users(self, target):
+        self.usernames = set(User.objects.values_list('username', flat=True))
+        self.emails = set(User.objects.values_list('email', flat=True))
+        existing = Admin.objects.count() + Employee.objects.count() + Employer.objects.count()
+
+        users = [self.build_user(data) for data in self.generate_fixtures_users() if data['username'] not in self.usernames]
+        users += [self.generate_user() for _ in range(target - existing - len(users))]
+
+        done = 0
+        for batch in self.batches(users):
+            BulkWriter.save_users(batch)
+            done += len(batch)
+            self.progress('users', existing + done, target)
+        self.stdout.write("User seeding complete.      ")
 
     def generate_fixtures_users(self):
-        user_fixtures = [
+        return [
             {'username': '@admin', 'email': 'admin@user.com', 'first_name': 'Admin', 'last_name': 'User', 'user_type': 'admin'},
             {'username': '@employee', 'email': 'employee@user.com', 'first_name': 'Employee', 'last_name': 'User', 'user_type': 'employee'},
             {'username': '@employer', 'email': 'employer@user.com', 'first_name': 'Employer', 'last_name': 'User', 'user_type': 'employer'},
         ]
-        for data in user_fixtures:
-            self.create_user(data)
-
-    def generate_random_users(self):
-        user_count = Admin.objects.count() + Employee.objects.count() + Employer.objects.count()
-        while user_count < self.USER_COUNT:
-            print(f"Seeding user {user_count}/{self.USER_COUNT}", end='\r')
-            self.generate_user()
-            user_count = Admin.objects.count() + Employee.objects.count() + Employer.objects.count()
-        print("User seeding complete.      ")
 
     def generate_user(self):
         first_name = self.faker.first_name()
         last_name = self.faker.last_name()
-        email = create_email(first_name, last_name)
-        username = create_username(first_name, last_name)
+        username, email = create_username(first_name, last_name), create_email(first_name, last_name)
+        suffix = 1
+        while username in self.usernames or email in self.emails:
+            suffix += 1
+            username, email = create_username(first_name, last_name, suffix), create_email(first_name, last_name, suffix)
         user_type = choices(['admin', 'employer', 'employee'], weights=[3, 12, 85], k=1)[0]
-        self.create_user({'username': username, 'email': email, 'first_name': first_name, 'last_name': last_name, 'user_type': user_type})
-
-    def create_user(self, data):
-        try:
-            user = User.objects.create_user(
-                username=data['username'],
-                email=data['email'],
-                password=Command.DEFAULT_PASSWORD,
-                first_name=data['first_name'],
-                last_name=data['last_name'],
-                user_type=data['user_type']
+        return self.build_user({'username': username, 'email': email, 'first_name': first_name, 'last_name': last_name, 'user_type': user_type})
+
+    def build_user(self, data):
+        """An unsaved (user, profile) pair; the profile is saved once the user has a primary key"""
+        self.usernames.add(data['username'])
+        self.emails.add(data['email'])
+        user = User(
+            username=data['username'],
+            email=data['email'],
+            password=self.password,
+            first_name=data['first_name'],
+            last_name=data['last_name'],
+            user_type=data['user_type'],
+            is_staff=data['user_type'] == 'admin',
+            is_superuser=data['user_type'] == 'admin'
+        )
+        if data['user_type'] == 'admin':
+            profile = Admin()
+        elif data['user_type'] == 'employee':
+            profile = Employee(
+                skills=self.generate_employee_skills(),
+                education=self.generate_employee_education(),
+                experience=self.generate_employee_experience(),
+                country=random.choice([code for code, name in COUNTRIES])
             )
-            if data['user_type'] == 'admin':
-                Admin.objects.create(user=user)
-                user.is_staff = True
-                user.is_superuser = True
-            elif data['user_type'] == 'employee':
-                skills = self.generate_employee_skills()
-                experience = self.generate_employee_experience()
-                education = self.generate_employee_education()
-                country = random.choice([code for code, name in COUNTRIES])
-                Employee.objects.create(user=user, skills=skills, education=education, experience=experience, country=country)
-            elif data['user_type'] == 'employer':
-                company_name = data.get('company_name', self.generate_company_name())
-                country = random.choice([code for code, name in COUNTRIES])
-                Employer.objects.create(user=user, company_name = company_name, country=country)
-            user.save()
-        except Exception as e: 
-            print(f"Error creating user: {data} - {e}")
-    
+        else:
+            profile = Employer(
+                company_name=data.get('company_name', self.generate_company_name()),
+                country=random.choice([code for code, name in COUNTRIES])
+            )
+        return user, profile
+
     # Employees
     def generate_employee_skills(self):
         primary_category = self.faker.random_element(list(self.SKILL_CATEGORIES.keys()))
@@ -265,25 +299,28 @@ class Command(BaseCommand):
         return self.faker.random_element(suffixes)
 
     # Job seeding
-    def create_jobs(self):
-        self.generate_fixtures_jobs()
-        self.generate_random_jobs()
+    def create_jobs(self, target):
+        jobs = self.generate_fixtures_jobs()
+        existing = Job.objects.count()
+        jobs += [self.generate_job() for _ in range(target - existing - len(jobs))]
+
+        done = 0
+        for batch in self.batches(jobs):
+            BulkWriter.save_jobs(batch)
+            done += len(batch)
+            self.progress('jobs', existing + done, target)
+        self.jobs = list(Job.objects.all())
+        self.stdout.write("Job seeding complete.      ")
     
     def generate_fixtures_jobs(self):
+        employer = next((employer for employer in self.employers if employer.user.username == '@employer'), None)
+        if employer is None or Job.objects.filter(created_by=employer).exists():
+            return []
         job_fixtures = [
-            {'name': 'Software Developer', 'department': 'Engineering', 'description': '', 'salary': 50000, 'job_type': 'FT', 'bonus': 0, 'skills_needed': 'Python, Django', 'skills_wanted': 'AWS, Docker', 'created_at': datetime(2024, 8, 12, 10, 0, tzinfo=pytz.utc), 'created_by': Employer.objects.get(user__username='@employer'), 'country': 'UK'},
-            {'name': 'Senior Developer', 'department': 'Engineering', 'description': '', 'salary': 100000, 'job_type': 'FT', 'bonus': 10000, 'skills_needed': 'Python, Django', 'skills_wanted': 'AWS, Docker', 'created_at': datetime(2024, 8, 12, 10, 0, tzinfo=pytz.utc), 'created_by': Employer.objects.get(user__username='@employer'), 'country': 'US'},
+            {'name': 'Software Developer', 'department': 'Engineering', 'description': '', 'salary': 50000, 'job_type': 'FT', 'bonus': 0, 'skills_needed': 'Python, Django', 'skills_wanted': 'AWS, Docker', 'created_at': datetime(2024, 8, 12, 10, 0, tzinfo=pytz.utc), 'created_by': employer, 'country': 'UK'},
+            {'name': 'Senior Developer', 'department': 'Engineering', 'description': '', 'salary': 100000, 'job_type': 'FT', 'bonus': 10000, 'skills_needed': 'Python, Django', 'skills_wanted': 'AWS, Docker', 'created_at': datetime(2024, 8, 12, 10, 0, tzinfo=pytz.utc), 'created_by': employer, 'country': 'US'},
         ]
-        for data in job_fixtures:
-            self.create_job(data)
-    
-    def generate_random_jobs(self):
-        job_count = Job.objects.count()
-        while job_count < self.JOB_COUNT:
-            print(f"Seeding jobs {job_count}/{self.JOB_COUNT}", end='\r')
-            self.generate_job()
-            job_count = Job.objects.count()
-        print("Job seeding complete.      ")
+        return [Job(**data) for data in job_fixtures]
 
     def generate_job(self):
         job_category = self.faker.random_element(list(self.SKILL_CATEGORIES.keys()))
@@ -321,11 +358,11 @@ class Command(BaseCommand):
         skills_needed = ', '.join(required_skills)
         skills_wanted = ', '.join(preferred_skills)
         created_at = self.faker.date_time_this_year()
-        created_by = choices(Employer.objects.all(), k=1)[0]
+        created_by = random.choice(self.employers)
 
         country_code = random.choice([code for code, name in COUNTRIES])
         
-        self.create_job({
+        return Job(**{
             'name': name, 
             'department': department, 
             'description': description, 
@@ -339,109 +376,81 @@ class Command(BaseCommand):
             'country' : country_code
         })
 
-    def create_job(self, data):
-        try:
-            job = Job.objects.create(
-                name=data['name'],
-                department=data['department'],
-                description=data['description'],
-                salary=data['salary'],
-                job_type=data['job_type'],
-                bonus=data['bonus'],
-                skills_needed=data['skills_needed'],
-                skills_wanted=data['skills_wanted'],
-                created_at=data['created_at'],
-                created_by=data['created_by'],
-                country=data['country']
-            )
-        except Exception as e:
-            print(f"Error creating job: {data} - {e}")
-
     # Application seeding
-    def create_applications(self):
-        self.generate_fixture_application()
-        self.generate_random_applications()
-
-    def create_application(self, data):
-        try:
-            #check if an application already exists for this job-applicant pair
-            if JobApplication.objects.filter(job=data['job'], applicant=data['applicant']).exists():
-                return
-                
-            application = JobApplication.objects.create(
-                job=data['job'],
-                applicant=data['applicant'],
-                status=data['status'],
-                cover_letter=data['cover_letter'],
-                full_name=data['full_name'],
-                email=data['email'],
-                phone=data['phone'],
-                country=data['country'],
-                current_position=data['current_position'],
-                skills=data['skills'],
-                experience=data['experience'],
-                education=data['education'],
-                portfolio_url=data['portfolio_url'],
-                linkedin_url=data['linkedin_url']
-            )
-            return application
-        except Exception as e:
-            print(f"Error creating application: {e}")
-
-    def generate_fixture_application(self):
-        employer_jobs = Job.objects.filter(created_by__user__username='@employer')
-        employer_job = employer_jobs.first() if employer_jobs.exists() else Job.objects.first()
-        
-        application_fixtures = [
-            {
-                'job': employer_job,
-                'applicant': Employee.objects.get(user__username='@employee'),
-                'status': 'pending',
-                'cover_letter': 'I am very interested in this position and believe my skills match your requirements.',
-                'full_name': 'Employee User',
-                'email': 'employee@user.com',
-                'phone': '+44 1234 567890',
-                'country': 'GB',
-                'current_position': 'Junior Developer',
-                'skills': 'Python, Django, JavaScript',
-                'experience': '2 years of web development experience',
-                'education': 'BSc Computer Science from King\'s College London',
-                'portfolio_url': 'https://portfolio.employeeuser.com',
-                'linkedin_url': 'https://linkedin.com/in/employeeuser'
-            }
-        ]
-
-        for data in application_fixtures:
-            self.create_application(data)
-
-    def generate_random_applications(self):
-        application_count = JobApplication.objects.count()
-        jobs = list(Job.objects.all())
-        employees = list(Employee.objects.all())
-        
-        possible_combinations = min(len(jobs) * len(employees), self.APPLICATION_COUNT)
-        
-        while application_count < possible_combinations:
-            print(f"Seeding application {application_count}/{possible_combinations}", end='\r')
-            self.generate_applications()
-            application_count = JobApplication.objects.count()
-        print("Application seeding complete.      ")
-        
-    def generate_applications(self):
-        existing_applications = set(JobApplication.objects.values_list('job_id', 'applicant_id'))
-        
-        available_jobs = Job.objects.all()
-        available_employees = Employee.objects.all()
+    def create_applications(self, target):
+        existing = set(JobApplication.objects.values_list('job_id', 'applicant_id'))
+        self.application_count = len(existing)
+        self.application_target = min(len(self.jobs) * len(self.employees), target)
+
+        # Rows are generated lazily and saved a batch at a time, so a million applications never sit in memory at once.
+        batch = []
+        for application in self.generate_applications(existing):
+            batch.append(application)
+            if len(batch) == self.batch_size:
+                self.save_applications(batch)
+                batch = []
+        self.save_applications(batch)
+        self.stdout.write("Application seeding complete.      ")
+
+    def generate_applications(self, existing):
+        yield from self.generate_fixture_application(existing)
+        remaining = self.application_target - len(existing)
+        if remaining <= 0:
+            return
 
-        for _ in range(10):
-            job = self.faker.random_element(available_jobs)
-            employee = self.faker.random_element(available_employees)
-            
-            if (job.id, employee.user_id) not in existing_applications:
-                break
-        else:
+        self.text_pools = self.generate_text_pools()
+        # Sampling distinct pair indices also works for dense datasets, where retrying random pairs would stall.
+        pair_count = len(self.jobs) * len(self.employees)
+        for index in random.sample(range(pair_count), min(pair_count, remaining + len(existing))):
+            job, employee = self.jobs[index // len(self.employees)], self.employees[index % len(self.employees)]
+            if (job.pk, employee.pk) not in existing:
+                yield self.generate_application(job, employee)
+                remaining -= 1
+                if not remaining:
+                    return
+
+    def save_applications(self, applications):
+        if not applications:
             return
+        BulkWriter.save_applications(applications)
+        self.application_count += len(applications)
+        self.progress('applications', self.application_count, self.application_target)
+
+    def generate_fixture_application(self, existing):
+        employee = next((employee for employee in self.employees if employee.user.username == '@employee'), None)
+        employer = next((employer for employer in self.employers if employer.user.username == '@employer'), None)
+        employer_jobs = [job for job in self.jobs if employer and job.created_by_id == employer.pk]
+        job = employer_jobs[0] if employer_jobs else (self.jobs[0] if self.jobs else None)
+        if employee is None or job is None or (job.pk, employee.pk) in existing:
+            return []
+        existing.add((job.pk, employee.pk))
+
+        return [JobApplication(
+            job=job,
+            applicant=employee,
+            status='pending',
+            cover_letter='I am very interested in this position and believe my skills match your requirements.',
+            full_name='Employee User',
+            email='employee@user.com',
+            phone='+44 1234 567890',
+            country='GB',
+            current_position='Junior Developer',
+            skills='Python, Django, JavaScript',
+            experience='2 years of web development experience',
+            education='BSc Computer Science from King\'s College London',
+            portfolio_url='https://portfolio.employeeuser.com',
+            linkedin_url='https://linkedin.com/in/employeeuser'
+        )]
+
+    def generate_text_pools(self):
+        return {
+            'cover_letter': [self.faker.paragraph(nb_sentences=3) for _ in range(self.TEXT_POOL_SIZE)],
+            'phone': [self.faker.phone_number() for _ in range(self.TEXT_POOL_SIZE)],
+            'current_position': [self.faker.job() for _ in range(self.TEXT_POOL_SIZE)],
+            'domain': [self.faker.domain_name() for _ in range(self.TEXT_POOL_SIZE)],
+        }
 
+    def generate_application(self, job, employee):
         status = choices(['pending', 'reviewing', 'rejected'], 
                         weights=[60, 20, 10], k=1)[0]
         
@@ -451,17 +460,11 @@ class Command(BaseCommand):
         job_preferred_skills = JobMatcher._parse_skills(job.skills_wanted)
         all_job_skills = job_required_skills + job_preferred_skills
         
-        enhance_skills = self.faker.boolean(chance_of_getting_true=70)
+        enhance_skills = random.random() < 0.7
 
         if enhance_skills and all_job_skills:
             max_skills_to_add = max(1, int(len(all_job_skills) * 0.7))
-            num_skills_to_add = self.faker.random_int(min=1, max=max_skills_to_add)
-            
-            skills_to_add = self.faker.random_elements(
-                elements=all_job_skills,
-                length=min(num_skills_to_add, len(all_job_skills)),
-                unique=True
-            )
+            skills_to_add = sample(all_job_skills, randint(1, max_skills_to_add))
             
             employee_skills_list = JobMatcher._parse_skills(original_skills)
             
@@ -473,24 +476,24 @@ class Command(BaseCommand):
         else:
             enhanced_skills = original_skills
 
-        application_data = {
-            'job': job,
-            'applicant': employee,
-            'status': status,
-            'cover_letter': self.faker.paragraph(nb_sentences=3),
-            'full_name': f"{employee.first_name} {employee.last_name}",
-            'email': employee.email,
-            'phone': self.faker.phone_number(),
-            'country': self.faker.random_element([c[0] for c in COUNTRIES]),
-            'current_position': self.faker.job(),
-            'skills': enhanced_skills,
-            'experience': employee.experience,
-            'education': employee.education,
-            'portfolio_url': self.faker.boolean(chance_of_getting_true=30) and f"https://{self.faker.domain_name()}/portfolio" or "",
-            'linkedin_url': self.faker.boolean(chance_of_getting_true=70) and f"https://linkedin.com/in/{employee.user.username.replace('@', '')}" or ""
-        }
-
-        self.create_application(application_data)
+        pools = self.text_pools
+        username = employee.user.username.replace('@', '')
+        return JobApplication(
+            job=job,
+            applicant=employee,
+            status=status,
+            cover_letter=random.choice(pools['cover_letter']),
+            full_name=f"{employee.user.first_name} {employee.user.last_name}",
+            email=employee.user.email,
+            phone=random.choice(pools['phone']),
+            country=random.choice(COUNTRIES)[0],
+            current_position=random.choice(pools['current_position']),
+            skills=enhanced_skills,
+            experience=employee.experience,
+            education=employee.education,
+            portfolio_url=f"https://{random.choice(pools['domain'])}/portfolio" if random.random() < 0.3 else "",
+            linkedin_url=f"https://linkedin.com/in/{username}" if random.random() < 0.7 else ""
+        )
 
     def printAll(self):
         print("Admins:")
@@ -504,8 +507,8 @@ class Command(BaseCommand):
             print(f"  {employer}")
 
 
-def create_username(first_name, last_name):
-    return '@' + first_name.lower() + last_name.lower()
+def create_username(first_name, last_name, suffix=1):
+    return '@' + first_name.lower() + last_name.lower() + (str(suffix) if suffix > 1 else '')
 
-def create_email(first_name, last_name):
-    return first_name + '.' + last_name + '@example.com'
+def create_email(first_name, last_name, suffix=1):
+    return first_name + '.' + last_name + (str(suffix) if suffix > 1 else '') + '@example.com'
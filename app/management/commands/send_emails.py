@@ -0,0 +1,32 @@
+import time
+from django.core.management.base import BaseCommand
+from app.services.email_backends import get_backend
+from app.services.email_outbox import EmailOutbox
+from app.services.verification_codes import VerificationCodePurge
+
+class Command(BaseCommand):
+    help = "Deliver queued emails from the outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='Emails claimed per round')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to wait when nothing is due')
+        parser.add_argument('--stale-after', type=int, default=300, help='Seconds before a sending email is requeued')
+        parser.add_argument('--once', action='store_true', help='Exit once no email is due')
+
+    def handle(self, *args, **options):
+        backend = get_backend()
+        self.stdout.write(f"Sending emails with {type(backend).__name__}")
+
+        while True:
+            # The worker that sends the codes also clears out the ones that expired (VERIFICATION_CODE_PURGE_INTERVAL).
+            VerificationCodePurge.maybe_purge()
+            EmailOutbox.requeue_stale(options['stale_after'])
+            emails = EmailOutbox.claim(max(1, options['batch_size']))
+            if not emails:
+                if options['once']:
+                    return
+                time.sleep(options['poll_interval'])
+                continue
+
+            sent = EmailOutbox.deliver(backend, emails)
+            self.stdout.write(f"Sent {sent} of {len(emails)} email(s)")
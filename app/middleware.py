@@ -0,0 +1,76 @@
+import time
+from contextlib import ExitStack
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.base import Template
+from app.services.request_metrics import RequestMetrics, RequestSample, current_sample
+
+class RequestMetricsMiddleware:
+    """Records query count, SQL time, template render time and total latency of every request, keyed by URL name,
+    into RequestMetrics (shown at /administrator/metrics/).
+
+    Opt-in with the REQUEST_METRICS_ENABLED setting; when it is off Django drops the middleware at startup and
+    templates are left unwrapped, so disabled metrics cost nothing per request. Put it first in MIDDLEWARE so the
+    latency includes the other middleware.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        instrument_templates()
+
+    def __call__(self, request):
+        sample = RequestSample()
+        token = current_sample.set(sample)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(_timed_query))
+                response = self.get_response(request)
+        finally:
+            current_sample.reset(token)
+        seconds = time.perf_counter() - start
+
+        match = request.resolver_match
+        view = (match.view_name if match else None) or '<unresolved>'
+        RequestMetrics.record(view, sample, seconds, response.status_code)
+        return response
+
+
+def _timed_query(execute, sql, params, many, context):
+    sample = current_sample.get()
+    if sample is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        sample.queries += 1
+        sample.db_seconds += time.perf_counter() - start
+
+
+def instrument_templates():
+    """Wraps Template._render (once per process) to add the time of outermost renders to the current sample;
+    includes and extended parents render inside them and are not counted twice"""
+    if getattr(Template._render, 'records_request_metrics', False):
+        return
+    render = Template._render
+
+    def timed_render(template, context):
+        sample = current_sample.get()
+        if sample is None:
+            return render(template, context)
+        sample.template_depth += 1
+        start = time.perf_counter()
+        try:
+            return render(template, context)
+        finally:
+            sample.template_depth -= 1
+            if not sample.template_depth:
+                sample.template_seconds += time.perf_counter() - start
+
+    timed_render.records_request_metrics = True
+    Template._render = timed_render
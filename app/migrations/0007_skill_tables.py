@@ -0,0 +1,136 @@
+# Generated by Django 5.1.2 on 2026-10-18 06:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copy of JobMatcher._parse_skills as of this migration, so later changes to it don't change the backfill.
+def parse_skills(skills_text):
+    if not skills_text:
+        return []
+
+    separator = ','
+    if ';' in skills_text and skills_text.count(';') > skills_text.count(','):
+        separator = ';'
+    elif '\n' in skills_text and skills_text.count('\n') > max(skills_text.count(','), skills_text.count(';')):
+        separator = '\n'
+
+    skills = [skill.strip().lower() for skill in skills_text.split(separator)]
+    return [skill for skill in skills if skill]
+
+
+def parse(skills_text):
+    return [skill for skill in parse_skills(skills_text) if len(skill) <= 255]
+
+
+def backfill_skill_tables(apps, schema_editor):
+    Skill = apps.get_model('app', 'Skill')
+    Job = apps.get_model('app', 'Job')
+    Employee = apps.get_model('app', 'Employee')
+    JobApplication = apps.get_model('app', 'JobApplication')
+    JobSkill = apps.get_model('app', 'JobSkill')
+    EmployeeSkill = apps.get_model('app', 'EmployeeSkill')
+    ApplicationSkill = apps.get_model('app', 'ApplicationSkill')
+
+    jobs = [(job.pk, parse(job.skills_needed), parse(job.skills_wanted)) for job in Job.objects.only('skills_needed', 'skills_wanted').iterator()]
+    employees = [(employee.pk, parse(employee.skills)) for employee in Employee.objects.only('skills').iterator()]
+    applications = [(application.pk, parse(application.skills)) for application in JobApplication.objects.only('skills').iterator()]
+
+    names = set()
+    for _, required, preferred in jobs:
+        names.update(required, preferred)
+    for _, skills in employees + applications:
+        names.update(skills)
+    Skill.objects.bulk_create([Skill(name=name) for name in names], batch_size=1000)
+    ids = dict(Skill.objects.values_list('name', 'id'))
+
+    JobSkill.objects.bulk_create([
+        JobSkill(job_id=job_id, skill_id=ids[name], kind=kind, position=position)
+        for job_id, required, preferred in jobs
+        for kind, skills in (('required', required), ('preferred', preferred))
+        for position, name in enumerate(skills)
+    ], batch_size=1000)
+    EmployeeSkill.objects.bulk_create([
+        EmployeeSkill(employee_id=employee_id, skill_id=ids[name], position=position)
+        for employee_id, skills in employees
+        for position, name in enumerate(skills)
+    ], batch_size=1000)
+    ApplicationSkill.objects.bulk_create([
+        ApplicationSkill(application_id=application_id, skill_id=ids[name], position=position)
+        for application_id, skills in applications
+        for position, name in enumerate(skills)
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_alter_employee_experience'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('required', 'Required'), ('preferred', 'Preferred')], max_length=10)),
+                ('position', models.PositiveSmallIntegerField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_skills', to='app.job')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_skills', to='app.skill')),
+            ],
+            options={
+                'ordering': ['job', 'kind', 'position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EmployeeSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='employee_skills', to='app.employee')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='employee_skills', to='app.skill')),
+            ],
+            options={
+                'ordering': ['employee', 'position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ApplicationSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_skills', to='app.jobapplication')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_skills', to='app.skill')),
+            ],
+            options={
+                'ordering': ['application', 'position'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='jobskill',
+            index=models.Index(fields=['skill', 'kind'], name='app_jobskil_skill_i_2226c7_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobskill',
+            unique_together={('job', 'kind', 'position')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='employeeskill',
+            unique_together={('employee', 'position')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='applicationskill',
+            unique_together={('application', 'position')},
+        ),
+        migrations.RunPython(backfill_skill_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,136 @@
+# Generated by Django 5.1.2 on 2026-10-18 06:37
+
+from django.db import migrations, models
+
+# Frozen copy of JobMatcher's scoring as of this migration, so later changes to it don't change the backfill.
+SKILL_VARIATIONS = {
+    'javascript': ['js'],
+    'typescript': ['ts'],
+    'react': ['reactjs', 'react.js'],
+    'react native': ['rn'],
+    'node.js': ['nodejs', 'node'],
+    'python': ['py'],
+    'ruby on rails': ['rails', 'ror'],
+    'amazon web services': ['aws'],
+    'google cloud platform': ['gcp'],
+    'microsoft azure': ['azure'],
+    'ci/cd': ['cicd', 'continuous integration', 'continuous deployment'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'user experience': ['ux'],
+    'user interface': ['ui'],
+    'docker': ['containerization'],
+    'kubernetes': ['k8s'],
+    'database': ['db'],
+    'postgresql': ['postgres'],
+    'mongodb': ['mongo']
+}
+
+
+def parse_skills(skills_text):
+    if not skills_text:
+        return []
+
+    separator = ','
+    if ';' in skills_text and skills_text.count(';') > skills_text.count(','):
+        separator = ';'
+    elif '\n' in skills_text and skills_text.count('\n') > max(skills_text.count(','), skills_text.count(';')):
+        separator = '\n'
+
+    skills = [skill.strip().lower() for skill in skills_text.split(separator)]
+    return [skill for skill in skills if skill]
+
+
+def skill_matches(job_skill, employee_skills):
+    if job_skill in employee_skills:
+        return True
+
+    job_skill_lower = job_skill.lower()
+    if any(variation in employee_skills for variation in SKILL_VARIATIONS.get(job_skill_lower, [])):
+        return True
+    for key, variations in SKILL_VARIATIONS.items():
+        if job_skill_lower in variations and key in employee_skills:
+            return True
+
+    for employee_skill in employee_skills:
+        if (len(employee_skill) > 3 and employee_skill in job_skill_lower) or \
+           (len(job_skill_lower) > 3 and job_skill_lower in employee_skill):
+            return True
+    return False
+
+
+def calculate_match_score(employee_skills, job_required_skills, job_preferred_skills, employee_preferred_contract, job_type):
+    employee_skills_list = parse_skills(employee_skills)
+    job_required_list = parse_skills(job_required_skills)
+    job_preferred_list = parse_skills(job_preferred_skills)
+
+    if not employee_skills_list:
+        return 15.0, [], job_required_list
+
+    if not job_required_list and not job_preferred_skills:
+        return 50.0, employee_skills_list, []
+
+    required_matches = [skill for skill in job_required_list if skill_matches(skill, employee_skills_list)]
+    preferred_matches = [skill for skill in job_preferred_list if skill_matches(skill, employee_skills_list)]
+    missing_required = [skill for skill in job_required_list if skill not in required_matches]
+
+    required_match_pct = len(required_matches) / len(job_required_list) if job_required_list else 1.0
+    preferred_match_pct = len(preferred_matches) / len(job_preferred_list) if job_preferred_list else 1.0
+
+    if job_required_list and job_preferred_list:
+        required_weight, preferred_weight = 0.7, 0.3
+    elif job_required_list:
+        required_weight, preferred_weight = 1.0, 0.0
+    else:
+        required_weight, preferred_weight = 0.0, 1.0
+    skill_score = (required_match_pct * required_weight + preferred_match_pct * preferred_weight) * 90
+
+    contract_bonus = 10 if employee_preferred_contract and job_type and employee_preferred_contract == job_type else 0
+    all_matches = required_matches + [s for s in preferred_matches if s not in required_matches]
+    return round(min(100, skill_score + contract_bonus), 1), all_matches, missing_required
+
+
+def backfill_application_scores(apps, schema_editor):
+    JobApplication = apps.get_model('app', 'JobApplication')
+
+    applications = []
+    for application in JobApplication.objects.select_related('job', 'applicant').iterator():
+        application.score, application.matching_skills, application.missing_skills = calculate_match_score(
+            application.skills,
+            application.job.skills_needed,
+            application.job.skills_wanted,
+            application.applicant.preferred_contract,
+            application.job.job_type
+        )
+        applications.append(application)
+    JobApplication.objects.bulk_update(applications, ['score', 'matching_skills', 'missing_skills'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_skill_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='matching_skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='missing_skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-score'], name='app_jobappl_job_id_2dd6a2_idx'),
+        ),
+        migrations.RunPython(backfill_application_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='verificationcode',
+            index=models.Index(condition=models.Q(('is_used', False)), fields=['user', 'code_type', 'code', '-created_at'], name='verification_lookup_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='verificationcode',
+            index=models.Index(fields=['created_at'], name='verification_created_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:10
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+# Full-text structures only one backend understands; app/services/job_search.py uses them.
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX job_search_vector_idx ON app_job USING gin (search_vector)",
+    "CREATE INDEX job_name_trgm_idx ON app_job USING gin (name gin_trgm_ops)",
+    "CREATE INDEX job_department_trgm_idx ON app_job USING gin (department gin_trgm_ops)",
+    "CREATE INDEX job_skills_trgm_idx ON app_job USING gin (skills_needed gin_trgm_ops)",
+    """UPDATE app_job SET search_vector =
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(department, '') || ' ' || coalesce(skills_needed, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')""",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS job_search_vector_idx",
+    "DROP INDEX IF EXISTS job_name_trgm_idx",
+    "DROP INDEX IF EXISTS job_department_trgm_idx",
+    "DROP INDEX IF EXISTS job_skills_trgm_idx",
+]
+SQLITE_FORWARD = [
+    """CREATE VIRTUAL TABLE app_job_fts USING fts5(
+        name, description, department, skills_needed, tokenize = 'unicode61 remove_diacritics 2'
+    )""",
+    """INSERT INTO app_job_fts (rowid, name, description, department, skills_needed)
+        SELECT id, name, description, department, skills_needed FROM app_job""",
+]
+SQLITE_BACKWARD = ["DROP TABLE IF EXISTS app_job_fts"]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_verification_code_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['country'], name='job_country_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['job_type'], name='job_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['salary'], name='job_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at'], name='job_created_idx'),
+        ),
+        migrations.RunPython(
+            run_for_vendor({'postgresql': POSTGRES_FORWARD, 'sqlite': SQLITE_FORWARD}),
+            run_for_vendor({'postgresql': POSTGRES_BACKWARD, 'sqlite': SQLITE_BACKWARD}),
+        ),
+    ]
@@ -1,12 +1,24 @@
 from .user_models import User, Admin, Employee, Employer, UserDelegationMixin, UserProfileMixin
 from .job_models import Job, JobApplication
+from .skill_models import Skill, JobSkill, EmployeeSkill, ApplicationSkill
 from .verification_models import VerificationCode
+from .cv_models import CVParseJob, ParsedCV
+from .email_models import OutboundEmail
+from .match_models import MatchCacheVersion
 
 __all__ = [
     # User models
     'User', 'Admin', 'Employee', 'Employer', 'UserDelegationMixin', 'UserProfileMixin',
     # Job models
     'Job', 'JobApplication',
+    # Skill models
+    'Skill', 'JobSkill', 'EmployeeSkill', 'ApplicationSkill',
     # Verification models
-    'VerificationCode'
+    'VerificationCode',
+    # CV models
+    'CVParseJob', 'ParsedCV',
+    # Email models
+    'OutboundEmail',
+    # Match models
+    'MatchCacheVersion'
 ]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from project.constants import COUNTRIES
 from app.models import Employee, Employer
@@ -23,6 +24,18 @@ class Job(models.Model):
     created_by = models.ForeignKey(Employer, on_delete=models.CASCADE, related_name='jobs')
     country = models.CharField(max_length=100, choices=COUNTRIES, blank=True)
 
+    # Kept up to date by the job search backend on PostgreSQL (see app/services/job_search.py); unused elsewhere.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['country'], name='job_country_idx'),
+            models.Index(fields=['job_type'], name='job_type_idx'),
+            models.Index(fields=['salary'], name='job_salary_idx'),
+            # Newest first with the id tiebreaker, the keyset pagination order (app/services/pagination.py)
+            models.Index(fields=['-created_at', '-id'], name='job_created_id_idx'),
+        ]
+
 
 class JobApplication(models.Model):
     STATUS_CHOICES = [
@@ -48,6 +61,11 @@ class JobApplication(models.Model):
     portfolio_url = models.URLField(blank=True, default='')
     linkedin_url = models.URLField(blank=True, default='')
     custom_cv = models.FileField(upload_to='applications/cvs/', blank=True)
+
+    # Match against the job, computed on submission and whenever the job's skills or type change.
+    score = models.FloatField(null=True, blank=True)
+    matching_skills = models.JSONField(default=list, blank=True)
+    missing_skills = models.JSONField(default=list, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -55,6 +73,8 @@ class JobApplication(models.Model):
     class Meta:
         unique_together = ('job', 'applicant')
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['job', '-score'])]
 
     def __str__(self):
         return f"{self.full_name or self.applicant.user.get_full_name()} - {self.job.name}"
+
@@ -0,0 +1,10 @@
+from django.db import models
+
+class MatchCacheVersion(models.Model):
+    """A counter bumped to invalidate MatchCache entries in every process: the job catalog, or one employee"""
+
+    scope = models.CharField(max_length=32, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.scope} v{self.version}"
@@ -0,0 +1,58 @@
+from django.db import models
+from app.models import Employee, Job, JobApplication
+
+class Skill(models.Model):
+    """A normalised (stripped, lower-cased) skill name shared by jobs, employees and applications."""
+    name = models.CharField(max_length=255, unique=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class JobSkill(models.Model):
+    KIND_CHOICES = [
+        ('required', 'Required'),
+        ('preferred', 'Preferred'),
+    ]
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='job_skills')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='job_skills')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    position = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ('job', 'kind', 'position')
+        ordering = ['job', 'kind', 'position']
+        indexes = [models.Index(fields=['skill', 'kind'])]
+
+    def __str__(self):
+        return f"{self.job_id}: {self.skill_id} ({self.kind})"
+
+
+class EmployeeSkill(models.Model):
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='employee_skills')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='employee_skills')
+    position = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ('employee', 'position')
+        ordering = ['employee', 'position']
+
+    def __str__(self):
+        return f"{self.employee_id}: {self.skill_id}"
+
+
+class ApplicationSkill(models.Model):
+    application = models.ForeignKey(JobApplication, on_delete=models.CASCADE, related_name='application_skills')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='application_skills')
+    position = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ('application', 'position')
+        ordering = ['application', 'position']
+
+    def __str__(self):
+        return f"{self.application_id}: {self.skill_id}"
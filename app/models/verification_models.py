@@ -9,6 +9,7 @@ class VerificationCode(models.Model):
         ('password_reset', 'Password Reset'),
         ('email_verification', 'Email Verification'),
     ]
+    LIFETIME = timedelta(minutes=15)
     
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     code = models.CharField(max_length=6)
@@ -21,7 +22,13 @@ class VerificationCode(models.Model):
         return ''.join([str(random.randint(0, 9)) for _ in range(6)])
 
     def is_valid(self):
-        return not self.is_used and self.created_at >= timezone.now() - timedelta(minutes=15)
+        return not self.is_used and self.created_at >= timezone.now() - self.LIFETIME
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # validate_verification_code: a seek on the equality columns, newest unused code first
+            models.Index(fields=['user', 'code_type', 'code', '-created_at'], name='verification_lookup_idx',
+                         condition=models.Q(is_used=False)),
+            models.Index(fields=['created_at'], name='verification_created_idx'),
+        ]
@@ -0,0 +1,194 @@
+from bisect import bisect_right
+import numpy as np
+from django.db.models import QuerySet
+from app.models import Employee, EmployeeSkill, Skill
+from app.services.job_matcher import JobMatcher
+from app.services.skill_normalizer import (
+    ALIAS_IDS, CANONICAL_IDS, CANONICAL_SKILLS, MIN_SUBSTRING_LENGTH, SKILL_VARIATIONS
+)
+
+_SEPARATOR = '\x00'
+
+class SkillVocabulary:
+    """Skill names keyed by Skill id, able to list every name a job skill matches under JobMatcher's rules"""
+
+    def __init__(self, names_by_id):
+        self.names_by_id = dict(names_by_id)
+        self.ids_by_name = {name: skill_id for skill_id, name in self.names_by_id.items()}
+        self.size = max(self.names_by_id, default=0) + 1
+
+        self._ids = list(self.names_by_id)
+        self._haystack = _SEPARATOR.join(self.names_by_id.values())
+        self._starts = []
+        offset = 0
+        for name in self.names_by_id.values():
+            self._starts.append(offset)
+            offset += len(name) + 1
+
+    def matching_ids(self, job_skill):
+        """Ids of every vocabulary skill that on its own would satisfy job_skill"""
+        ids_by_name = self.ids_by_name
+        ids = set()
+
+        if job_skill in ids_by_name:
+            ids.add(ids_by_name[job_skill])
+
+        job_skill_lower = job_skill.lower()
+        if job_skill_lower in CANONICAL_IDS:
+            ids.update(ids_by_name[alias] for alias in SKILL_VARIATIONS[job_skill_lower] if alias in ids_by_name)
+        if job_skill_lower in ALIAS_IDS:
+            canonical = CANONICAL_SKILLS[ALIAS_IDS[job_skill_lower]]
+            if canonical in ids_by_name:
+                ids.add(ids_by_name[canonical])
+
+        # Vocabulary names longer than the threshold that occur inside the job skill.
+        length = len(job_skill_lower)
+        for start in range(length):
+            for end in range(start + MIN_SUBSTRING_LENGTH + 1, length + 1):
+                skill_id = ids_by_name.get(job_skill_lower[start:end])
+                if skill_id is not None:
+                    ids.add(skill_id)
+
+        # Vocabulary names containing the job skill, found by scanning one joined string.
+        if length > MIN_SUBSTRING_LENGTH and _SEPARATOR not in job_skill_lower:
+            position = self._haystack.find(job_skill_lower)
+            while position != -1:
+                index = bisect_right(self._starts, position) - 1
+                ids.add(self._ids[index])
+                position = self._haystack.find(job_skill_lower, self._starts[index + 1] if index + 1 < len(self._starts) else len(self._haystack))
+
+        return ids
+
+    def mask(self, job_skill):
+        mask = np.zeros(self.size, dtype=bool)
+        ids = self.matching_ids(job_skill)
+        if ids:
+            mask[np.fromiter(ids, dtype=np.int64, count=len(ids))] = True
+        return mask
+
+
+class CandidatePool:
+    """Employees encoded as a CSR matrix of Skill ids (row n holds indices[indptr[n]:indptr[n + 1]])"""
+
+    def __init__(self, employee_ids, contracts, indptr, indices, vocabulary):
+        self.employee_ids = np.asarray(employee_ids, dtype=np.int64)
+        self.contracts = np.asarray(contracts, dtype=object)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.vocabulary = vocabulary
+        self.has_skills = np.diff(self.indptr) > 0
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    @classmethod
+    def from_employees(cls, employees=None):
+        """Builds the pool with two queries; a queryset stays a subquery so pools of any size work"""
+        if employees is None:
+            employees = Employee.objects.all()
+
+        if isinstance(employees, QuerySet):
+            rows = list(employees.values_list('pk', 'preferred_contract'))
+            skill_rows = EmployeeSkill.objects.filter(employee__in=employees.order_by().values('pk'))
+        else:
+            rows = [(employee.pk, employee.preferred_contract) for employee in employees]
+            skill_rows = EmployeeSkill.objects.filter(employee_id__in=[pk for pk, _ in rows])
+
+        employee_ids = np.array([pk for pk, _ in rows], dtype=np.int64)
+        contracts = [contract for _, contract in rows]
+        pairs = np.array(
+            list(skill_rows.order_by('employee_id', 'position').values_list('employee_id', 'skill_id')),
+            dtype=np.int64
+        ).reshape(-1, 2)
+        vocabulary = SkillVocabulary(Skill.objects.filter(employee_skills__isnull=False).distinct().values_list('id', 'name'))
+        return cls.from_pairs(employee_ids, contracts, pairs, vocabulary)
+
+    @classmethod
+    def from_pairs(cls, employee_ids, contracts, pairs, vocabulary):
+        """Builds the CSR arrays from (employee_id, skill_id) pairs already in skill position order"""
+        employee_ids = np.asarray(employee_ids, dtype=np.int64)
+        order = np.argsort(employee_ids, kind='stable')
+        rows = order[np.searchsorted(employee_ids[order], pairs[:, 0])]
+        grouped = np.argsort(rows, kind='stable')
+
+        indptr = np.zeros(len(employee_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(employee_ids)), out=indptr[1:])
+        return cls(employee_ids, contracts, indptr, pairs[grouped, 1], vocabulary)
+
+    def skill_names(self, row):
+        names = self.vocabulary.names_by_id
+        return [names[skill_id] for skill_id in self.indices[self.indptr[row]:self.indptr[row + 1]].tolist()]
+
+    def hits(self, job_skills):
+        """Boolean (len(job_skills), len(pool)) matrix: does candidate n satisfy job skill s"""
+        result = np.zeros((len(job_skills), len(self)), dtype=bool)
+        masks = {}
+        for s, job_skill in enumerate(job_skills):
+            if job_skill not in masks:
+                gathered = self.vocabulary.mask(job_skill)[self.indices]
+                counts = np.concatenate(([0], np.cumsum(gathered, dtype=np.int64)))
+                masks[job_skill] = (counts[self.indptr[1:]] - counts[self.indptr[:-1]]) > 0
+            result[s] = masks[job_skill]
+        return result
+
+
+class BatchScores:
+    """Scores of one job against every candidate of a pool, plus what is needed to explain each score"""
+
+    def __init__(self, pool, job, required, preferred, hits, scores):
+        self.pool = pool
+        self.job = job
+        self.required = required
+        self.preferred = preferred
+        self.hits = hits
+        self.scores = scores
+
+    def ranking(self):
+        """Candidate row numbers by descending score, ties kept in pool order (like a stable sort)"""
+        return np.lexsort((np.arange(len(self.scores)), -self.scores))
+
+    def details(self, row):
+        """(score, matching_skills, missing_skills) for one candidate, identical to calculate_match_score"""
+        score = float(self.scores[row])
+        if not self.pool.has_skills[row]:
+            return score, [], list(self.required)
+        if not self.required and not self.job.skills_wanted:
+            return score, self.pool.skill_names(row), []
+
+        required_hits = self.hits[:len(self.required), row]
+        preferred_hits = self.hits[len(self.required):, row]
+        required_matches = [skill for skill, hit in zip(self.required, required_hits) if hit]
+        missing_required = [skill for skill, hit in zip(self.required, required_hits) if not hit]
+        preferred_matches = [skill for skill, hit in zip(self.preferred, preferred_hits) if hit]
+        all_matches = required_matches + [s for s in preferred_matches if s not in required_matches]
+        return score, all_matches, missing_required
+
+
+class BatchScorer:
+    """Vectorised JobMatcher scoring of one job against a whole candidate pool"""
+
+    @staticmethod
+    def score_job(job, pool):
+        required, preferred = JobMatcher._job_skill_lists(job)
+        hits = pool.hits(required + preferred)
+        required_hits = hits[:len(required)].sum(axis=0)
+        preferred_hits = hits[len(required):].sum(axis=0)
+
+        contract_match = np.zeros(len(pool), dtype=bool)
+        if job.job_type:
+            contract_match = pool.contracts == job.job_type
+
+        # A job's score depends only on (required hits, preferred hits, contract match), so every
+        # reachable value is computed once with JobMatcher's own arithmetic and looked up per candidate.
+        table = np.empty((len(required) + 1, len(preferred) + 1, 2))
+        for r in range(len(required) + 1):
+            for p in range(len(preferred) + 1):
+                for bonus in (0, 1):
+                    table[r, p, bonus] = JobMatcher._final_score(r, len(required), p, len(preferred), 10 * bonus)
+        scores = table[required_hits, preferred_hits, contract_match.astype(np.int64)]
+
+        if not required and not job.skills_wanted:
+            scores = np.full(len(pool), 50.0)
+        scores[~pool.has_skills] = 15.0
+
+        return BatchScores(pool, job, required, preferred, hits, scores)
@@ -0,0 +1,45 @@
+from app.models import User, Admin, Employee, Employer, Job, JobApplication
+from app.services.job_matcher import JobMatcher
+from app.services.job_search import JobSearch
+from app.services.match_cache import MatchCache
+from app.services.skill_index import SkillIndex
+
+class BulkWriter:
+    """Bulk inserts for generated datasets (manage.py seed, the bench load suite).
+
+    bulk_create skips the post_save signals, so each save_* method also does what those signals would have done:
+    the skill index is synced and application scores are stored. Call finish() once every row is written to
+    rebuild the job search index and drop the cached rankings of every process.
+    """
+
+    @staticmethod
+    def save_users(pairs, batch_size=None):
+        """Saves unsaved (User, Admin/Employee/Employer) pairs, linking each profile to its user"""
+        User.objects.bulk_create([user for user, _ in pairs], batch_size=batch_size)
+        for user, profile in pairs:
+            profile.user = user
+
+        profiles = {Admin: [], Employee: [], Employer: []}
+        for _, profile in pairs:
+            profiles[type(profile)].append(profile)
+        for model, rows in profiles.items():
+            model.objects.bulk_create(rows, batch_size=batch_size)
+        SkillIndex.sync_employees(profiles[Employee])
+
+    @staticmethod
+    def save_jobs(jobs, batch_size=None):
+        Job.objects.bulk_create(jobs, batch_size=batch_size)
+        SkillIndex.sync_jobs(jobs)
+
+    @staticmethod
+    def save_applications(applications, batch_size=None):
+        """Scores and saves applications; their job and applicant must already be loaded"""
+        for application in applications:
+            JobMatcher.score_application(application)
+        JobApplication.objects.bulk_create(applications, batch_size=batch_size)
+        SkillIndex.sync_applications(applications)
+
+    @staticmethod
+    def finish():
+        JobSearch.rebuild()
+        MatchCache.invalidate_catalog()
@@ -0,0 +1,50 @@
+import hashlib
+from django.conf import settings
+from django.utils import timezone
+from app.helper import PARSER_VERSION
+from app.models import ParsedCV
+
+class ParsedCVCache:
+    """parse_cv results keyed by the SHA-256 of the document and PARSER_VERSION, least recently used evicted first"""
+
+    @staticmethod
+    def max_entries():
+        return getattr(settings, 'PARSED_CV_CACHE_MAX_ENTRIES', 1000)
+
+    @staticmethod
+    def hash_file(file):
+        """Hex SHA-256 of a Django File (upload or storage file), read in chunks and rewound afterwards"""
+        digest = hashlib.sha256()
+        for chunk in file.chunks():
+            digest.update(chunk)
+        file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def get(content_hash):
+        """The cached result for a document, or None"""
+        if not content_hash:
+            return None
+        entries = ParsedCV.objects.filter(content_hash=content_hash, parser_version=PARSER_VERSION)
+        result = entries.values_list('result', flat=True).first()
+        if result is not None:
+            entries.update(last_used_at=timezone.now())
+        return result
+
+    @staticmethod
+    def put(content_hash, result):
+        if not content_hash:
+            return
+        ParsedCV.objects.update_or_create(
+            content_hash=content_hash,
+            parser_version=PARSER_VERSION,
+            defaults={'result': result, 'last_used_at': timezone.now()}
+        )
+        ParsedCVCache.evict()
+
+    @staticmethod
+    def evict():
+        """Deletes results of older parser versions and the least recently used entries beyond max_entries"""
+        ParsedCV.objects.exclude(parser_version=PARSER_VERSION).delete()
+        stale_ids = ParsedCV.objects.order_by('-last_used_at', '-id').values_list('id', flat=True)[ParsedCVCache.max_entries():]
+        ParsedCV.objects.filter(id__in=list(stale_ids)).delete()
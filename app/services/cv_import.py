@@ -0,0 +1,98 @@
+import hashlib
+import re
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from app.models import Employee, User
+from app.services.match_cache import MatchCache
+from app.services.skill_index import SkillIndex
+
+# Employee field -> parse_cv key; list values are joined the way the signup review form does.
+PROFILE_FIELDS = {
+    'skills': 'Skills',
+    'experience': 'Experience',
+    'education': 'Education',
+    'languages': 'Languages',
+    'interests': 'Interests',
+    'phone': 'Phone',
+}
+
+class CVImporter:
+    """Creates or updates Employee profiles in bulk from parsed CVs, matching existing accounts by e-mail address"""
+
+    @staticmethod
+    def profile_values(data):
+        values = {}
+        for field, key in PROFILE_FIELDS.items():
+            value = data.get(key) or ''
+            if isinstance(value, list):
+                value = ', '.join(value)
+            values[field] = value
+        values['phone'] = values['phone'][:Employee._meta.get_field('phone').max_length]
+        return values
+
+    @staticmethod
+    def username_for(email):
+        """@ plus the e-mail's local part, with a digest of the address appended so imports never collide"""
+        local = re.sub(r'\W', '', email.split('@')[0])[:30]
+        return f"@{local}_{hashlib.sha1(email.encode()).hexdigest()[:8]}"
+
+    @staticmethod
+    def split_name(name):
+        first, _, last = (name or '').strip().partition(' ')
+        return first[:50], last.strip()[:50]
+
+    @staticmethod
+    @transaction.atomic
+    def save(parsed):
+        """Saves [(source, parse_cv data)] and returns (created, updated, [(source, reason)] failures)"""
+        failures = []
+        by_email = {}
+        for source, data in parsed:
+            email = (data.get('E-mail') or '').strip('.')
+            if not email:
+                failures.append((source, 'no e-mail address found'))
+            elif email in by_email:
+                failures.append((source, f'same e-mail address as {by_email[email][0]}'))
+            else:
+                by_email[email] = (source, data)
+
+        users = {user.email: user for user in User.objects.filter(email__in=by_email)}
+        # The default Employee manager annotates email, whose property setter saves the user row for every loaded employee.
+        employees = {
+            employee.user_id: employee
+            for employee in Employee._base_manager.select_related('user').filter(user__in=users.values())
+        }
+        unusable_password = make_password(None)
+
+        new_users, new_employees, updated = [], [], []
+        for email, (source, data) in by_email.items():
+            values = CVImporter.profile_values(data)
+            user = users.get(email)
+            if user is None:
+                first_name, last_name = CVImporter.split_name(data.get('Name'))
+                user = User(username=CVImporter.username_for(email), email=email, first_name=first_name,
+                            last_name=last_name, user_type='employee', password=unusable_password)
+                new_users.append(user)
+                new_employees.append(Employee(user=user, **values))
+            elif user.user_type != 'employee':
+                failures.append((source, f'{email} belongs to an {user.user_type} account'))
+            elif user.pk not in employees:
+                new_employees.append(Employee(user=user, **values))
+            else:
+                employee = employees[user.pk]
+                for field, value in values.items():
+                    if value:
+                        setattr(employee, field, value)
+                updated.append(employee)
+
+        User.objects.bulk_create(new_users, batch_size=500)
+        Employee.objects.bulk_create(new_employees, batch_size=500)
+        Employee.objects.bulk_update(updated, list(PROFILE_FIELDS), batch_size=500)
+
+        # bulk_create and bulk_update skip the post_save signals that keep the skill index and match cache current.
+        # invalidate_employee bumps the employee's shared MatchCacheVersion row, so web workers drop their rankings too.
+        SkillIndex.sync_employees(new_employees + updated)
+        for employee in updated:
+            MatchCache.invalidate_employee(employee.pk)
+
+        return len(new_employees), len(updated), failures
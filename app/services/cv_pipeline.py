@@ -0,0 +1,68 @@
+from datetime import timedelta
+from django.db.models import F
+from django.utils import timezone
+from app.models import CVParseJob
+from app.services.cv_cache import ParsedCVCache
+
+MAX_ATTEMPTS = 3
+
+class CVPipeline:
+    """Queue of CV parse jobs stored in the database; process_cvs claims and runs them outside the web workers"""
+
+    @staticmethod
+    def enqueue(file_path, content_hash=''):
+        """Queues a stored CV; a document parsed before (same content hash) is answered from the cache at once"""
+        cached = ParsedCVCache.get(content_hash)
+        if cached is not None:
+            return CVParseJob.objects.create(
+                file_path=file_path, content_hash=content_hash, status='done', result=cached, finished_at=timezone.now()
+            )
+        return CVParseJob.objects.create(file_path=file_path, content_hash=content_hash)
+
+    @staticmethod
+    def claim(limit):
+        """Marks up to limit pending jobs as processing and returns those this worker won"""
+        claimed = []
+        for job_id in CVParseJob.objects.filter(status='pending').values_list('id', flat=True)[:limit]:
+            won = CVParseJob.objects.filter(id=job_id, status='pending').update(
+                status='processing', started_at=timezone.now(), attempts=F('attempts') + 1
+            )
+            if won:
+                claimed.append(CVParseJob.objects.get(id=job_id))
+        return claimed
+
+    @staticmethod
+    def finish(job, status, outcome):
+        job.status = status
+        job.result = outcome if status == 'done' else None
+        job.error = outcome if status == 'failed' else ''
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'result', 'error', 'finished_at'])
+        if status == 'done':
+            ParsedCVCache.put(job.content_hash, outcome)
+
+    @staticmethod
+    def release(jobs):
+        """Puts claimed jobs that never got a result back in the queue, or fails them after MAX_ATTEMPTS"""
+        for job in jobs:
+            if job.attempts >= MAX_ATTEMPTS:
+                CVPipeline.finish(job, 'failed', 'Gave up after the parser process crashed')
+            else:
+                CVParseJob.objects.filter(id=job.id, status='processing').update(status='pending')
+
+    @staticmethod
+    def requeue_stale(older_than):
+        """Returns jobs stuck in processing (e.g. their worker died) to the queue, or fails them after MAX_ATTEMPTS"""
+        stale = CVParseJob.objects.filter(status='processing', started_at__lt=timezone.now() - timedelta(seconds=older_than))
+        stale.filter(attempts__gte=MAX_ATTEMPTS).update(
+            status='failed', error='Gave up after the worker stopped responding', finished_at=timezone.now()
+        )
+        return stale.update(status='pending')
+
+    @staticmethod
+    def result(job_id):
+        """The parsed CV data of a finished job, or None while it is still queued or running"""
+        job = CVParseJob.objects.filter(id=job_id).only('status', 'result').first()
+        if job is None or not job.is_finished:
+            return None
+        return job.result or {}
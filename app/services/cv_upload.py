@@ -0,0 +1,60 @@
+import fitz
+from django.conf import settings
+from django.core.files.uploadhandler import SkipFile, StopUpload, TemporaryFileUploadHandler
+from django.template.defaultfilters import filesizeformat
+
+PDF_HEADER = b'%PDF-'
+
+class PDFUploadHandler(TemporaryFileUploadHandler):
+    """Streams an uploaded CV to a temporary file in chunks, giving up on it as soon as the first chunk is not a PDF
+    or the bytes received pass CV_UPLOAD_MAX_BYTES, so nothing beyond the limit is ever written to disk.
+
+    The reason is left in error for the view; the file is then missing from request.FILES.
+    """
+
+    chunk_size = 64 * 2 ** 10
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_bytes = settings.CV_UPLOAD_MAX_BYTES
+        self.error = None
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        if content_length is not None and content_length > self.max_bytes:
+            self._reject_too_large()
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+
+    def receive_data_chunk(self, raw_data, start):
+        if start == 0 and not raw_data.startswith(PDF_HEADER):
+            self.error = "The file is not a PDF."
+            raise SkipFile()
+        if start + len(raw_data) > self.max_bytes:
+            self._reject_too_large()
+        return super().receive_data_chunk(raw_data, start)
+
+    def _reject_too_large(self):
+        # The parser closes (and so deletes) the partial temporary file and discards the rest of the body.
+        self.error = f"The file is larger than {filesizeformat(self.max_bytes)}."
+        raise StopUpload()
+
+
+class CVUpload:
+    """Checks on uploaded CV files before they are stored and queued for parsing"""
+
+    @staticmethod
+    def check_pdf(file_path):
+        """Returns why the PDF cannot be accepted (unreadable, password-protected or over CV_UPLOAD_MAX_PAGES), or None.
+
+        PDFs that are only owner-encrypted (e.g. printing disabled) open without a password and are accepted.
+        """
+        try:
+            with fitz.open(file_path, filetype='pdf') as doc:
+                if doc.needs_pass:
+                    return "Password-protected PDFs cannot be read."
+                if len(doc) == 0:
+                    return "The PDF has no pages."
+                if len(doc) > settings.CV_UPLOAD_MAX_PAGES:
+                    return f"The PDF has more than {settings.CV_UPLOAD_MAX_PAGES} pages."
+        except Exception:
+            return "The PDF could not be read."
+        return None
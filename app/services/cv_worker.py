@@ -0,0 +1,30 @@
+"""Functions run inside process_cvs' parser processes.
+
+Spawned children import this module before Django is set up, so nothing here may import models at module level.
+"""
+
+def init_django():
+    """Process pool initializer for workers that only need app.helper's text extraction"""
+    import django
+    django.setup()
+
+def init_worker():
+    """Process pool initializer: sets Django up and loads the spaCy model once per worker process"""
+    init_django()
+    from app.helper import nlp
+    nlp.load()
+
+def parse_cv_file(file_path):
+    """Returns ('done', data) or ('failed', error) instead of raising"""
+    from app.helper import parse_cv
+
+    try:
+        return 'done', parse_cv(file_path)
+    except Exception as e:
+        return 'failed', f"{type(e).__name__}: {e}"
+
+def extract_cv_text(file_path):
+    """Returns (file_path, text); text is empty when nothing could be read from the PDF"""
+    from app.helper import extract_text_from_pdf
+
+    return file_path, extract_text_from_pdf(file_path)
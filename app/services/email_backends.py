@@ -0,0 +1,46 @@
+import logging
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+class SendGridBackend:
+    """Delivers outbox emails through one SendGrid API client, reused for every message the worker sends"""
+
+    def __init__(self):
+        from sendgrid import SendGridAPIClient
+
+        self.client = SendGridAPIClient(settings.SENDGRID_API_KEY)
+
+    def send(self, email):
+        from sendgrid.helpers.mail import Mail
+
+        message = Mail(
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to_emails=email.to_email,
+            subject=email.subject,
+            html_content=email.html_content,
+            plain_text_content=email.text_content or None
+        )
+        message.reply_to = settings.DEFAULT_FROM_EMAIL
+        self.client.send(message)
+
+
+class StubBackend:
+    """Keeps sent emails in memory (and logs them) instead of calling an API; used in tests and without an API key"""
+
+    sent = []
+
+    def send(self, email):
+        StubBackend.sent.append(email)
+        logger.info("Email to %s: %s", email.to_email, email.subject)
+
+
+def get_backend():
+    return import_string(settings.EMAIL_OUTBOX_BACKEND)()
+
+
+def is_permanent_failure(error):
+    """Client errors other than rate limiting will fail the same way on every retry"""
+    status_code = getattr(error, 'status_code', None)
+    return status_code is not None and 400 <= status_code < 500 and status_code != 429
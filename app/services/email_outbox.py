@@ -0,0 +1,74 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from app.models import OutboundEmail
+from app.services.email_backends import is_permanent_failure
+
+MAX_ATTEMPTS = 5
+
+class EmailOutbox:
+    """Emails stored in the database by request handlers and delivered by the send_emails worker"""
+
+    @staticmethod
+    def enqueue(to_email, subject, html_content, text_content=''):
+        return OutboundEmail.objects.create(
+            to_email=to_email, subject=subject, html_content=html_content, text_content=text_content
+        )
+
+    @staticmethod
+    def claim(limit):
+        """Marks up to limit due pending emails as sending and returns those this worker won"""
+        now = timezone.now()
+        claimed = []
+        due = OutboundEmail.objects.filter(status='pending', next_attempt_at__lte=now)
+        for email_id in due.values_list('id', flat=True)[:limit]:
+            won = OutboundEmail.objects.filter(id=email_id, status='pending').update(
+                status='sending', started_at=now, attempts=F('attempts') + 1
+            )
+            if won:
+                claimed.append(OutboundEmail.objects.get(id=email_id))
+        return claimed
+
+    @staticmethod
+    def backoff(attempts):
+        """Seconds before retry number attempts: EMAIL_RETRY_BASE_DELAY doubled per attempt, capped"""
+        return min(settings.EMAIL_RETRY_BASE_DELAY * 2 ** (attempts - 1), settings.EMAIL_RETRY_MAX_DELAY)
+
+    @staticmethod
+    def mark_sent(email):
+        email.status = 'sent'
+        email.sent_at = timezone.now()
+        email.last_error = ''
+        email.save(update_fields=['status', 'sent_at', 'last_error'])
+
+    @staticmethod
+    def mark_failed(email, error):
+        """Schedules a retry with exponential backoff, or gives up after MAX_ATTEMPTS or on a permanent error"""
+        email.last_error = f"{type(error).__name__}: {error}"
+        if email.attempts >= MAX_ATTEMPTS or is_permanent_failure(error):
+            email.status = 'failed'
+        else:
+            email.status = 'pending'
+            email.next_attempt_at = timezone.now() + timedelta(seconds=EmailOutbox.backoff(email.attempts))
+        email.save(update_fields=['status', 'last_error', 'next_attempt_at'])
+
+    @staticmethod
+    def deliver(backend, emails):
+        """Sends the claimed emails with one backend instance; returns how many were sent"""
+        sent = 0
+        for email in emails:
+            try:
+                backend.send(email)
+            except Exception as e:
+                EmailOutbox.mark_failed(email, e)
+            else:
+                EmailOutbox.mark_sent(email)
+                sent += 1
+        return sent
+
+    @staticmethod
+    def requeue_stale(older_than):
+        """Returns emails stuck in sending (e.g. their worker died) to the queue"""
+        cutoff = timezone.now() - timedelta(seconds=older_than)
+        return OutboundEmail.objects.filter(status='sending', started_at__lt=cutoff).update(status='pending')
@@ -0,0 +1,74 @@
+import html
+import re
+import threading
+from django.template.loader import render_to_string
+from django.utils.html import escape
+
+# Values substituted per email. Each template is rendered once with these markers in their place, and the output is
+# split around them; markers use no characters that HTML escaping would change.
+FIELDS = ('first_name', 'code', 'site_name')
+MARKERS = {field: f'@@EMAIL_{field.upper()}@@' for field in FIELDS}
+MARKER_PATTERN = re.compile('(' + '|'.join(re.escape(marker) for marker in MARKERS.values()) + ')')
+FIELD_BY_MARKER = {marker: field for field, marker in MARKERS.items()}
+
+class CompiledEmailTemplate:
+    """An email template rendered once, kept as literal chunks and field slots for the HTML and plaintext bodies"""
+
+    def __init__(self, html_content):
+        self.html_parts = self._split(html_content)
+        self.text_parts = self._split(self.to_text(html_content))
+
+    @staticmethod
+    def _split(content):
+        """Alternating literal text and field names: even positions are literals, odd positions are fields"""
+        parts = MARKER_PATTERN.split(content)
+        return [part if i % 2 == 0 else FIELD_BY_MARKER[part] for i, part in enumerate(parts)]
+
+    @staticmethod
+    def to_text(html_content):
+        """A plaintext version of an HTML email: head and styles dropped, block tags turned into line breaks"""
+        text = re.sub(r'(?is)<(head|style|script)\b.*?</\1>', '', html_content)
+        text = re.sub(r'(?i)<br\s*/?>\s*', '\n', text)
+        text = re.sub(r'(?i)</?(p|div|h[1-6]|tr|li)\b[^>]*>', '\n', text)
+        text = html.unescape(re.sub(r'<[^>]+>', '', text))
+        lines = [' '.join(line.split()) for line in text.splitlines()]
+        return re.sub(r'\n{3,}', '\n\n', '\n'.join(lines)).strip() + '\n'
+
+    def render(self, values):
+        """Returns (html, text) with the given {field: value} substituted; HTML values are escaped like {{ }} does"""
+        escaped = {field: escape(value) for field, value in values.items()}
+        html_content = ''.join(escaped[part] if i % 2 else part for i, part in enumerate(self.html_parts))
+        text_content = ''.join(str(values[part]) if i % 2 else part for i, part in enumerate(self.text_parts))
+        return html_content, text_content
+
+
+class EmailTemplates:
+    """Per-process cache of compiled email templates"""
+
+    _compiled = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get(template_name):
+        compiled = EmailTemplates._compiled.get(template_name)
+        if compiled is None:
+            marked = render_to_string(template_name, {
+                'user': {'first_name': MARKERS['first_name']},
+                'code': MARKERS['code'],
+                'site_name': MARKERS['site_name'],
+            })
+            compiled = CompiledEmailTemplate(marked)
+            with EmailTemplates._lock:
+                EmailTemplates._compiled[template_name] = compiled
+        return compiled
+
+    @staticmethod
+    def render(template_name, user, code, site_name):
+        """(html, text) bodies of the email for the user; the HTML equals render_to_string with the same context"""
+        values = {'first_name': user.first_name, 'code': code, 'site_name': site_name}
+        return EmailTemplates.get(template_name).render(values)
+
+    @staticmethod
+    def clear():
+        with EmailTemplates._lock:
+            EmailTemplates._compiled.clear()
@@ -1,4 +1,6 @@
-from app.models import Job, Employee
+from django.db.models import Prefetch, QuerySet
+from app.models import Job, Employee, JobApplication, JobSkill
+from app.services.skill_normalizer import SkillProfile
 
 class JobMatcher:
     """Service for matching employees to jobs based on skills and interests"""
@@ -19,77 +21,60 @@ class JobMatcher:
     
     @staticmethod
     def _skill_matches(job_skill, employee_skills):
-        if job_skill in employee_skills:
-            return True
-        
-        job_skill_lower = job_skill.lower()
-        
-        skill_variations = {
-            'javascript': ['js'],
-            'typescript': ['ts'],
-            'react': ['reactjs', 'react.js'],
-            'react native': ['rn'],
-            'node.js': ['nodejs', 'node'],
-            'python': ['py'],
-            'ruby on rails': ['rails', 'ror'],
-            'amazon web services': ['aws'],
-            'google cloud platform': ['gcp'],
-            'microsoft azure': ['azure'],
-            'ci/cd': ['cicd', 'continuous integration', 'continuous deployment'],
-            'machine learning': ['ml'],
-            'artificial intelligence': ['ai'],
-            'user experience': ['ux'],
-            'user interface': ['ui'],
-            'docker': ['containerization'],
-            'kubernetes': ['k8s'],
-            'database': ['db'],
-            'postgresql': ['postgres'],
-            'mongodb': ['mongo']
-        }
-        
-        if job_skill_lower in skill_variations:
-            variations = skill_variations[job_skill_lower]
-            for variation in variations:
-                if variation in employee_skills:
-                    return True
-        
-        for key, variations in skill_variations.items():
-            if job_skill_lower in variations and key in employee_skills:
-                return True
-        
-        for employee_skill in employee_skills:
-            if (len(employee_skill) > 3 and employee_skill in job_skill_lower) or \
-               (len(job_skill_lower) > 3 and job_skill_lower in employee_skill):
-                return True
-        
-        return False
+        return SkillProfile.for_skills(employee_skills).matches(job_skill)
 
     @staticmethod
     def calculate_match_score(employee_skills, job_required_skills, job_preferred_skills = None, employee_preferred_contract = None, job_type = None):
         """Returns a match score from 0-100, list of skills that matched, list of required skills candidate is missing"""
         
         employee_skills_list = JobMatcher._parse_skills(employee_skills)
-        job_required_list = JobMatcher._parse_skills(job_required_skills)
-        job_preferred_list = JobMatcher._parse_skills(job_preferred_skills)
+        profile = SkillProfile.for_skills(employee_skills_list) if employee_skills_list else None
 
-        if not employee_skills_list:
-            return 15.0, [], job_required_list
+        return JobMatcher._score(
+            profile,
+            JobMatcher._parse_skills(job_required_skills),
+            JobMatcher._parse_skills(job_preferred_skills),
+            job_preferred_skills,
+            employee_preferred_contract,
+            job_type
+        )
+
+    @staticmethod
+    def _score(profile, job_required_list, job_preferred_list, job_preferred_skills, employee_preferred_contract, job_type):
+        """Scores parsed job skills against a compiled employee SkillProfile (None when the employee has no skills)"""
+        if profile is None:
+            return 15.0, [], list(job_required_list)
         
         if not job_required_list and not job_preferred_skills:
-            return 50.0, employee_skills_list, []
+            return 50.0, list(profile.skills), []
+        
+        required_matches = []
+        missing_required = []
+        for skill in job_required_list:
+            (required_matches if profile.matches(skill) else missing_required).append(skill)
+        preferred_matches = [skill for skill in job_preferred_list if profile.matches(skill)]
+
+        contract_bonus = 0
+        if employee_preferred_contract and job_type and employee_preferred_contract == job_type:
+            contract_bonus = 10
+        
+        final_score = JobMatcher._final_score(
+            len(required_matches), len(job_required_list), len(preferred_matches), len(job_preferred_list), contract_bonus
+        )
+        all_matches = required_matches + [s for s in preferred_matches if s not in required_matches]
         
-        required_matches = [skill for skill in job_required_list if JobMatcher._skill_matches(skill, employee_skills_list)]
-        preferred_matches = [skill for skill in job_preferred_list if JobMatcher._skill_matches(skill, employee_skills_list)]
-        missing_required = [skill for skill in job_required_list if not JobMatcher._skill_matches(skill, employee_skills_list)]
+        return final_score, all_matches, missing_required
 
-        required_match_pct = len(required_matches) / len(job_required_list) if job_required_list else 1.0
-        preferred_match_pct = len(preferred_matches) / len(job_preferred_list) if job_preferred_list else 1.0
+    @staticmethod
+    def _final_score(required_hits, required_total, preferred_hits, preferred_total, contract_bonus):
+        """Combines skill hit counts and the contract bonus into the rounded 0-100 score"""
+        required_match_pct = required_hits / required_total if required_total else 1.0
+        preferred_match_pct = preferred_hits / preferred_total if preferred_total else 1.0
 
-               
-        if job_required_list and job_preferred_list:
+        if required_total and preferred_total:
             required_weight = 0.7
             preferred_weight = 0.3
-        elif job_required_list:
+        elif required_total:
             required_weight = 1.0
             preferred_weight = 0.0
         else:
@@ -98,25 +83,82 @@ class JobMatcher:
         
         skill_score = (required_match_pct * required_weight + preferred_match_pct * preferred_weight) * 90
         
-        contract_bonus = 0
-        if employee_preferred_contract and job_type and employee_preferred_contract == job_type:
-            contract_bonus = 10
-        
-        final_score = min(100, skill_score + contract_bonus)
-        all_matches = required_matches + [s for s in preferred_matches if s not in required_matches]
-        
-        return round(final_score, 1), all_matches, missing_required
+        return round(min(100, skill_score + contract_bonus), 1)
     
     @staticmethod
-    def match_employee_to_jobs(employee, jobs = None):
+    def score_application(application):
+        """Sets an application's stored score, matching and missing skills from its job (does not save)"""
+        job = application.job
+        application.score, application.matching_skills, application.missing_skills = JobMatcher.calculate_match_score(
+            application.skills,
+            job.skills_needed,
+            job.skills_wanted,
+            application.applicant.preferred_contract,
+            job.job_type
+        )
+
+    @staticmethod
+    def rescore_applications(applications):
+        """Recomputes and saves the stored scores of the given applications"""
+        applications = list(applications.select_related('job', 'applicant'))
+        for application in applications:
+            JobMatcher.score_application(application)
+        JobApplication.objects.bulk_update(applications, ['score', 'matching_skills', 'missing_skills'], batch_size=500)
+
+    @staticmethod
+    def job_skills_prefetch():
+        """Prefetch of a job queryset's normalised skill rows, consumed by _job_skill_lists"""
+        return Prefetch('job_skills', queryset=JobSkill.objects.select_related('skill').order_by('kind', 'position'))
+
+    @staticmethod
+    def _job_skill_lists(job):
+        """Returns (required, preferred) skill lists from prefetched JobSkill rows, parsing text otherwise"""
+        if 'job_skills' not in getattr(job, '_prefetched_objects_cache', {}):
+            return JobMatcher._parse_skills(job.skills_needed), JobMatcher._parse_skills(job.skills_wanted)
+
+        required, preferred = [], []
+        for job_skill in job.job_skills.all():
+            (required if job_skill.kind == 'required' else preferred).append(job_skill.skill.name)
+        return required, preferred
+
+    @staticmethod
+    def _employees_in_bulk(employees, employee_ids):
+        """Loads just the given employees, by pk, out of a list or queryset of candidates"""
+        if isinstance(employees, (list, tuple)):
+            return {employee.pk: employee for employee in employees}
+        # The default manager annotates email, whose property setter saves the user row for every loaded employee.
+        return Employee._base_manager.select_related('user').in_bulk(employee_ids)
+
+    @staticmethod
+    def match_employee_to_jobs(employee, jobs = None, lazy = False):
+        """Scores only the jobs that share at least one skill with the employee, found via the skill index.
+        With lazy=True and a job queryset, returns a RankedJobMatches that only scores the top of the ranking on demand"""
+        from app.services.skill_index import SkillIndex
+
         if jobs is None:
             jobs = Job.objects.all()
 
+        if lazy and isinstance(jobs, QuerySet):
+            from app.services.match_ranking import RankedJobMatches
+            return RankedJobMatches(employee, jobs)
+
+        candidate_ids = SkillIndex.candidate_job_ids(employee.skills)
+        if isinstance(jobs, QuerySet):
+            jobs = jobs.filter(id__in=candidate_ids).prefetch_related(JobMatcher.job_skills_prefetch())
+        else:
+            candidate_ids = set(candidate_ids)
+            jobs = [job for job in jobs if job.id in candidate_ids]
+
+        employee_skills_list = JobMatcher._parse_skills(employee.skills)
+        profile = SkillProfile.for_skills(employee_skills_list) if employee_skills_list else None
+
         matches = []
         for job in jobs:
-            score, matching_skills, missing_skills = JobMatcher.calculate_match_score(
-                employee.skills, 
-                job.skills_needed, 
+            job_required_list, job_preferred_list = JobMatcher._job_skill_lists(job)
+            score, matching_skills, missing_skills = JobMatcher._score(
+                profile,
+                job_required_list,
+                job_preferred_list,
                 job.skills_wanted,
                 employee.preferred_contract,
                 job.job_type
@@ -134,19 +176,27 @@ class JobMatcher:
     
 
     @staticmethod
-    def match_job_to_employees(job, employees=None):
+    def match_job_to_employees(job, employees=None, lazy=False):
+        """Scores the whole candidate pool in one vectorised pass, see BatchScorer.
+        With lazy=True, returns a RankedEmployeeMatches that only builds match dicts for the rows it is sliced to"""
+        from app.services.batch_scorer import BatchScorer, CandidatePool
+
         if employees is None:
             employees = Employee.objects.all()
-        
+
+        if lazy:
+            from app.services.match_ranking import RankedEmployeeMatches
+            return RankedEmployeeMatches(job, employees)
+
+        pool = CandidatePool.from_employees(employees)
+        result = BatchScorer.score_job(job, pool)
+        rows = result.ranking()
+        employees_by_pk = JobMatcher._employees_in_bulk(employees, pool.employee_ids[rows].tolist())
+
         matches = []
-        for employee in employees:
-            score, matching_skills, missing_skills = JobMatcher.calculate_match_score(
-                employee.skills, 
-                job.skills_needed, 
-                job.skills_wanted,
-                employee.preferred_contract,
-                job.job_type
-            )
+        for row in rows.tolist():
+            employee = employees_by_pk[int(pool.employee_ids[row])]
+            score, matching_skills, missing_skills = result.details(row)
             
             matches.append({
                 'employee': employee,
@@ -156,4 +206,4 @@ class JobMatcher:
                 'contract_match': employee.preferred_contract == job.job_type
             })
         
-        return sorted(matches, key=lambda x: x['score'], reverse=True)
+        return matches
@@ -0,0 +1,156 @@
+import re
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from app.models import Job
+
+SEARCH_FIELDS = ('name', 'description', 'department', 'skills_needed')
+
+class IContainsJobSearch:
+    """Substring search over SEARCH_FIELDS; the fallback for databases without a full-text index"""
+
+    def search(self, jobs, text):
+        condition = Q()
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f'{field}__icontains': text})
+        return jobs.filter(condition)
+
+    def index_job(self, job):
+        pass
+
+    def remove_job(self, job_id):
+        pass
+
+    def rebuild(self):
+        pass
+
+
+class SQLiteJobSearch(IContainsJobSearch):
+    """FTS5 table app_job_fts (created by migration 0013_job_search) with one row per job, rowid = job id, rewritten on every
+    Job save. Words in the query are matched as prefixes and ranked with bm25; when nothing matches (e.g. the text
+    is the middle of a word) the substring search is used instead."""
+
+    TABLE = 'app_job_fts'
+
+    @staticmethod
+    def match_expression(text):
+        words = re.findall(r'\w+', text.lower())
+        return ' '.join(f'"{word}"*' for word in words)
+
+    def match_ids(self, text):
+        """Subquery of the ids of indexed jobs matching text"""
+        return RawSQL(f"SELECT rowid FROM {self.TABLE} WHERE {self.TABLE} MATCH %s", [self.match_expression(text)])
+
+    def search(self, jobs, text):
+        expression = self.match_expression(text)
+        if expression:
+            matches = jobs.filter(id__in=self.match_ids(text))
+            if matches.exists():
+                # bm25 is lower for better matches; ties keep the queryset's own ordering.
+                rank = RawSQL(
+                    f"SELECT -bm25({self.TABLE}, 10.0, 1.0, 5.0, 5.0) FROM {self.TABLE} "
+                    f"WHERE {self.TABLE} MATCH %s AND rowid = app_job.id", [expression]
+                )
+                return matches.annotate(search_rank=rank).order_by('-search_rank', *jobs.query.order_by)
+        return super().search(jobs, text)
+
+    def index_job(self, job):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.TABLE} WHERE rowid = %s", [job.pk])
+            cursor.execute(
+                f"INSERT INTO {self.TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s, %s)",
+                [job.pk] + [getattr(job, field) or '' for field in SEARCH_FIELDS]
+            )
+
+    def remove_job(self, job_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.TABLE} WHERE rowid = %s", [job_id])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.TABLE}")
+            cursor.execute(
+                f"INSERT INTO {self.TABLE} (rowid, {', '.join(SEARCH_FIELDS)}) "
+                f"SELECT id, {', '.join(SEARCH_FIELDS)} FROM app_job"
+            )
+
+
+class PostgresJobSearch(IContainsJobSearch):
+    """Weighted tsvector in Job.search_vector (GIN indexed), ranked with ts_rank; when no document matches, jobs whose
+    name, department or skills are trigram-similar to the text (pg_trgm, GIN indexed) are returned instead"""
+
+    CONFIG = 'english'
+    TRIGRAM_THRESHOLD = 0.3
+
+    def vector(self):
+        from django.contrib.postgres.search import SearchVector
+
+        return (
+            SearchVector('name', weight='A', config=self.CONFIG)
+            + SearchVector('department', 'skills_needed', weight='B', config=self.CONFIG)
+            + SearchVector('description', weight='C', config=self.CONFIG)
+        )
+
+    def search(self, jobs, text):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity, TrigramWordSimilarity
+        from django.db.models import F
+        from django.db.models.functions import Greatest
+
+        query = SearchQuery(text, search_type='websearch', config=self.CONFIG)
+        matches = jobs.filter(search_vector=query)
+        if matches.exists():
+            ranked = matches.annotate(search_rank=SearchRank(F('search_vector'), query))
+            return ranked.order_by('-search_rank', *jobs.query.order_by)
+
+        similar = jobs.annotate(search_rank=Greatest(
+            TrigramSimilarity('name', text),
+            TrigramSimilarity('department', text),
+            TrigramWordSimilarity(text, 'skills_needed'),
+        )).filter(search_rank__gte=self.TRIGRAM_THRESHOLD)
+        return similar.order_by('-search_rank', *jobs.query.order_by)
+
+    def index_job(self, job):
+        Job.objects.filter(pk=job.pk).update(search_vector=self.vector())
+
+    def rebuild(self):
+        Job.objects.update(search_vector=self.vector())
+
+
+BACKENDS = {
+    'postgresql': PostgresJobSearch,
+    'sqlite': SQLiteJobSearch,
+}
+
+class JobSearch:
+    """Full-text job search through the backend for the default database (or JOB_SEARCH_BACKEND, a dotted path)"""
+
+    _backend = None
+
+    @staticmethod
+    def backend():
+        if JobSearch._backend is None:
+            path = getattr(settings, 'JOB_SEARCH_BACKEND', None)
+            backend_class = import_string(path) if path else BACKENDS.get(connection.vendor, IContainsJobSearch)
+            JobSearch._backend = backend_class()
+        return JobSearch._backend
+
+    @staticmethod
+    def search(jobs, text):
+        """Filters the jobs queryset to those matching text, most relevant first"""
+        text = text.strip()
+        return JobSearch.backend().search(jobs, text) if text else jobs
+
+    @staticmethod
+    def index_job(job):
+        JobSearch.backend().index_job(job)
+
+    @staticmethod
+    def remove_job(job_id):
+        JobSearch.backend().remove_job(job_id)
+
+    @staticmethod
+    def rebuild():
+        """Reindexes every job, e.g. after Job rows were written with bulk_create or update()"""
+        JobSearch.backend().rebuild()
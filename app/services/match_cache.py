@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.db.models import F
+from app.models import MatchCacheVersion
+from app.services.job_matcher import JobMatcher
+
+CATALOG_SCOPE = 'catalog'
+
+class MatchCache:
+    """Per-process LRU/TTL cache of lazy employee job rankings, keyed by employee, filters, and the job catalog
+    and employee versions.
+
+    A cached RankedJobMatches keeps every match it has already ranked, so flipping back and forth between pages
+    of the same search is a single lookup. The versions are MatchCacheVersion rows, read with one query per
+    lookup, so an invalidation from any process (web workers, import_cvs, seed) orphans the entries of every
+    other process, which then age out. Job saves and deletes bump the catalog version, and skill or contract
+    changes bump the employee's; see app/signals.py.
+    """
+
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def max_entries():
+        return getattr(settings, 'MATCH_CACHE_MAX_ENTRIES', 512)
+
+    @staticmethod
+    def ttl():
+        return getattr(settings, 'MATCH_CACHE_TTL', 300)
+
+    @staticmethod
+    def employee_scope(employee_pk):
+        return f'employee:{employee_pk}'
+
+    @staticmethod
+    def versions(employee_pk):
+        """(catalog version, employee version), 0 for a scope never invalidated"""
+        scopes = [CATALOG_SCOPE, MatchCache.employee_scope(employee_pk)]
+        stored = dict(MatchCacheVersion.objects.filter(scope__in=scopes).values_list('scope', 'version'))
+        return tuple(stored.get(scope, 0) for scope in scopes)
+
+    @staticmethod
+    def key(employee, filters):
+        return (employee.pk, *MatchCache.versions(employee.pk), tuple(sorted(filters.items())))
+
+    @staticmethod
+    def _bump(scope):
+        if not MatchCacheVersion.objects.filter(scope=scope).update(version=F('version') + 1):
+            MatchCacheVersion.objects.bulk_create([MatchCacheVersion(scope=scope, version=1)], ignore_conflicts=True)
+
+    @staticmethod
+    def job_matches(employee, jobs, filters):
+        """Returns the cached lazy ranking of jobs for the employee, ranking the filtered queryset on a miss"""
+        key = MatchCache.key(employee, filters)
+        now = time.monotonic()
+
+        with MatchCache._lock:
+            entry = MatchCache._entries.get(key)
+            if entry is not None and entry[0] > now:
+                MatchCache._entries.move_to_end(key)
+                return entry[1]
+
+        matches = JobMatcher.match_employee_to_jobs(employee, jobs, lazy=True)
+
+        with MatchCache._lock:
+            MatchCache._entries[key] = (now + MatchCache.ttl(), matches)
+            MatchCache._entries.move_to_end(key)
+            while len(MatchCache._entries) > MatchCache.max_entries():
+                MatchCache._entries.popitem(last=False)
+        return matches
+
+    @staticmethod
+    def invalidate_catalog():
+        MatchCache._bump(CATALOG_SCOPE)
+
+    @staticmethod
+    def invalidate_employee(employee_pk):
+        MatchCache._bump(MatchCache.employee_scope(employee_pk))
+        with MatchCache._lock:
+            for key in [key for key in MatchCache._entries if key[0] == employee_pk]:
+                del MatchCache._entries[key]
+
+    @staticmethod
+    def clear():
+        """Invalidates every ranking, in all processes"""
+        MatchCache.invalidate_catalog()
+        with MatchCache._lock:
+            MatchCache._entries.clear()
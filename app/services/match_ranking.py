@@ -0,0 +1,185 @@
+import abc
+import heapq
+import numpy as np
+from django.db.models import Count, Q
+from app.models import Employee
+from app.services.job_matcher import JobMatcher
+from app.services.skill_index import SkillIndex
+from app.services.skill_normalizer import SkillProfile
+
+class RankedMatches(abc.ABC):
+    """Match results sorted by descending score, built lazily: only the top of the ranking a slice needs is scored
+    in full, so a Paginator can page through it without materialising every match"""
+
+    def __init__(self):
+        self._ranked = []
+        self._complete = False
+
+    @abc.abstractmethod
+    def count(self):
+        """Returns the number of candidates, matching or not"""
+
+    @abc.abstractmethod
+    def _top(self, k):
+        """Returns the k best matches in order (score descending, ties in candidate order)"""
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count())
+            self._rank(stop)
+            return self._ranked[start:stop:step]
+
+        if index < 0:
+            index += self.count()
+        if not 0 <= index < self.count():
+            raise IndexError('match index out of range')
+        self._rank(index + 1)
+        return self._ranked[index]
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __bool__(self):
+        return self.count() > 0
+
+    def __eq__(self, other):
+        if isinstance(other, (list, RankedMatches)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def _rank(self, k):
+        if len(self._ranked) < k and not self._complete:
+            self._ranked = self._top(k)
+            self._complete = len(self._ranked) >= self.count()
+
+
+class RankedJobMatches(RankedMatches):
+    """Jobs ranked for one employee. Skill hit counts from the JobSkill index give every candidate an upper bound
+    on its score; candidates are scored exactly in bound order and the scan stops once no remaining bound can
+    reach the K-th best score"""
+
+    def __init__(self, employee, jobs):
+        super().__init__()
+        self.employee = employee
+        self.jobs = jobs
+
+        employee_skills_list = JobMatcher._parse_skills(employee.skills)
+        self._profile = SkillProfile.for_skills(employee_skills_list) if employee_skills_list else None
+        self._skill_ids = SkillIndex.matching_skill_ids(employee.skills)
+        self._candidates = None
+
+    def count(self):
+        return len(self._candidate_bounds())
+
+    def _candidate_bounds(self):
+        """[(upper bound, position, job id)] of the candidate jobs, from one aggregate query"""
+        if self._candidates is None:
+            skill_ids = self._skill_ids
+            rows = self.jobs.filter(id__in=SkillIndex.job_ids_with_skills(skill_ids)).annotate(
+                required_total=Count('job_skills', filter=Q(job_skills__kind='required')),
+                required_hits=Count('job_skills', filter=Q(job_skills__kind='required', job_skills__skill_id__in=skill_ids)),
+                preferred_total=Count('job_skills', filter=Q(job_skills__kind='preferred')),
+                preferred_hits=Count('job_skills', filter=Q(job_skills__kind='preferred', job_skills__skill_id__in=skill_ids)),
+            ).values_list('id', 'required_total', 'required_hits', 'preferred_total', 'preferred_hits', 'skills_wanted', 'job_type')
+
+            self._candidates = [
+                (self._upper_bound(*row[1:]), position, row[0])
+                for position, row in enumerate(rows)
+            ]
+        return self._candidates
+
+    def _upper_bound(self, required_total, required_hits, preferred_total, preferred_hits, skills_wanted, job_type):
+        """The score _score would give if every indexed hit is a real match"""
+        if self._profile is None:
+            return 15.0
+        if not required_total and not skills_wanted:
+            return 50.0
+
+        contract = self.employee.preferred_contract
+        contract_bonus = 10 if contract and job_type and contract == job_type else 0
+        return JobMatcher._final_score(required_hits, required_total, preferred_hits, preferred_total, contract_bonus)
+
+    def _top(self, k):
+        candidates = sorted(self._candidate_bounds(), key=lambda candidate: (-candidate[0], candidate[1]))
+        heap = []  # min-heap of (score, -position, match) holding the k best so far
+
+        for start in range(0, len(candidates), k):
+            batch = candidates[start:start + k]
+            if len(heap) == k and (batch[0][0], -batch[0][1]) < heap[0][:2]:
+                break
+
+            jobs = self.jobs.filter(id__in=[job_id for _, _, job_id in batch]).prefetch_related(JobMatcher.job_skills_prefetch())
+            jobs_by_id = {job.id: job for job in jobs}
+            for _, position, job_id in batch:
+                score, match = self._score(jobs_by_id[job_id])
+                entry = (score, -position, match)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+
+        return [match for _, _, match in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def _score(self, job):
+        job_required_list, job_preferred_list = JobMatcher._job_skill_lists(job)
+        score, matching_skills, missing_skills = JobMatcher._score(
+            self._profile,
+            job_required_list,
+            job_preferred_list,
+            job.skills_wanted,
+            self.employee.preferred_contract,
+            job.job_type
+        )
+        return score, {
+            'job': job,
+            'score': score,
+            'matching_skills': matching_skills,
+            'missing_skills': missing_skills,
+            'contract_match': self.employee.preferred_contract == job.job_type
+        }
+
+
+class RankedEmployeeMatches(RankedMatches):
+    """Candidates ranked for one job. Every score comes out of the vectorised BatchScorer, so the top K are picked
+    with a partial sort and match dicts (and Employee instances) are only built for rows that are shown"""
+
+    def __init__(self, job, employees):
+        from app.services.batch_scorer import BatchScorer, CandidatePool
+
+        super().__init__()
+        self.job = job
+        self.employees = employees if employees is not None else Employee.objects.all()
+        self._pool = CandidatePool.from_employees(self.employees)
+        self._result = BatchScorer.score_job(job, self._pool)
+
+    def count(self):
+        return len(self._pool)
+
+    def _top(self, k):
+        scores = self._result.scores
+        if k < len(scores):
+            # Everything scoring at least the K-th best score, then a stable sort of just those rows.
+            kth_score = -np.partition(-scores, k - 1)[k - 1]
+            rows = np.flatnonzero(scores >= kth_score)
+            rows = rows[np.lexsort((rows, -scores[rows]))][:k]
+        else:
+            rows = self._result.ranking()
+
+        employee_ids = self._pool.employee_ids[rows].tolist()
+        employees_by_pk = JobMatcher._employees_in_bulk(self.employees, employee_ids)
+
+        matches = []
+        for row, employee_id in zip(rows.tolist(), employee_ids):
+            employee = employees_by_pk[employee_id]
+            score, matching_skills, missing_skills = self._result.details(row)
+            matches.append({
+                'employee': employee,
+                'score': score,
+                'matching_skills': matching_skills,
+                'missing_skills': missing_skills,
+                'contract_match': employee.preferred_contract == self.job.job_type
+            })
+        return matches
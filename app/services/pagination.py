@@ -0,0 +1,183 @@
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Sequence
+from functools import cached_property
+from django.conf import settings
+from django.core import signing
+from django.db import connections
+from django.db.models import Q
+
+def _cursor_value(value):
+    # Full precision (DjangoJSONEncoder drops microseconds), since the seek compares for equality.
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f'{type(value).__name__} is not a supported cursor value')
+
+
+class CursorSerializer:
+    """JSON for signing.dumps that also accepts the datetimes and decimals found in ordering columns"""
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'), default=_cursor_value).encode('latin-1')
+
+    def loads(self, data):
+        return json.loads(data.decode('latin-1'))
+
+
+def approximate_count(queryset, limit=None):
+    """Returns (count, is_lower_bound) for the queryset without scanning all of it.
+
+    On PostgreSQL this is the planner's row estimate; elsewhere an exact count stopping at limit
+    (PAGINATION_COUNT_LIMIT), in which case is_lower_bound tells the caller to show it as "limit+".
+    """
+    connection = connections[queryset.db]
+    queryset = queryset.order_by()
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows']), False
+
+    limit = limit or getattr(settings, 'PAGINATION_COUNT_LIMIT', 1000)
+    count = queryset[:limit].count()
+    return count, count >= limit
+
+
+class KeysetPaginator:
+    """Pages a queryset by seeking past the last row shown instead of using OFFSET, so every page costs one
+    indexed range scan however deep it is.
+
+    The ordering is the queryset's own order_by (field or annotation names, none of them nullable) with pk appended
+    as a tiebreaker. Cursors are signed tokens holding the ordering values of the row to continue from; a cursor
+    that is invalid or was made for another ordering yields the first page.
+    """
+
+    SALT = 'app.keyset-cursor'
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = [str(field) for field in queryset.query.order_by]
+        if not any(field.lstrip('-') in ('pk', 'id') for field in self.ordering):
+            descending = bool(self.ordering) and self.ordering[0].startswith('-')
+            self.ordering.append('-pk' if descending else 'pk')
+
+    def encode_cursor(self, direction, values):
+        return signing.dumps([self.ordering, direction, values], salt=self.SALT, serializer=CursorSerializer)
+
+    def decode_cursor(self, cursor):
+        try:
+            ordering, direction, values = signing.loads(cursor, salt=self.SALT, serializer=CursorSerializer)
+        except (signing.BadSignature, TypeError, ValueError):
+            return None
+        if ordering != self.ordering or direction not in ('next', 'previous'):
+            return None
+        if values is not None and len(values) != len(self.ordering):
+            return None
+        return direction, values
+
+    def values_of(self, obj):
+        return [getattr(obj, field.lstrip('-')) for field in self.ordering]
+
+    def seek(self, values, reverse=False):
+        """Condition for the rows after (or, with reverse, before) the row with the given ordering values"""
+        def beyond(field, inclusive=False):
+            lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+            return f"{field.lstrip('-')}__{lookup}{'e' if inclusive else ''}"
+
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            condition |= equal & Q(**{beyond(field): value})
+            equal &= Q(**{field.lstrip('-'): value})
+
+        # The redundant non-strict bound on the leading column lets the database range scan its index.
+        return Q(**{beyond(self.ordering[0], inclusive=True): values[0]}) & condition
+
+    def get_page(self, cursor=None):
+        decoded = self.decode_cursor(cursor) if cursor else None
+        direction, values = decoded or ('next', None)
+
+        if direction == 'next':
+            queryset = self.queryset.order_by(*self.ordering)
+            if values is not None:
+                queryset = queryset.filter(self.seek(values))
+            rows = list(queryset[:self.per_page + 1])
+            has_next = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            has_previous = values is not None
+        else:
+            reversed_ordering = [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+            queryset = self.queryset.order_by(*reversed_ordering)
+            if values is not None:
+                queryset = queryset.filter(self.seek(values, reverse=True))
+            rows = list(queryset[:self.per_page + 1])
+            has_previous = len(rows) > self.per_page
+            rows = rows[:self.per_page][::-1]
+            has_next = values is not None
+
+        return KeysetPage(rows, self, has_next, has_previous)
+
+    @cached_property
+    def last_cursor(self):
+        return self.encode_cursor('previous', None)
+
+
+class KeysetPage(Sequence):
+    """One page of a KeysetPaginator, with cursors for its neighbours instead of page numbers"""
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f'<KeysetPage of {len(self.object_list)} rows>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @cached_property
+    def next_cursor(self):
+        if not (self._has_next and self.object_list):
+            return None
+        return self.paginator.encode_cursor('next', self.paginator.values_of(self.object_list[-1]))
+
+    @cached_property
+    def previous_cursor(self):
+        if not (self._has_previous and self.object_list):
+            return None
+        return self.paginator.encode_cursor('previous', self.paginator.values_of(self.object_list[0]))
+
+    @cached_property
+    def _approximate_count(self):
+        return approximate_count(self.paginator.queryset)
+
+    @property
+    def approximate_count(self):
+        """Approximate number of rows across all pages; only queried when used"""
+        return self._approximate_count[0]
+
+    @property
+    def count_is_lower_bound(self):
+        return self._approximate_count[1]
@@ -0,0 +1,146 @@
+import math
+import threading
+from contextvars import ContextVar
+
+# Upper bounds (seconds) of the request latency histogram, as in Prometheus' default buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+class RequestSample:
+    """Measurements of one request, filled in by RequestMetricsMiddleware"""
+
+    __slots__ = ('queries', 'db_seconds', 'template_seconds', 'template_depth')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.template_depth = 0
+
+
+# The sample of the request being handled in this thread (or task), if metrics are enabled.
+current_sample = ContextVar('request_metrics_sample', default=None)
+
+
+class ViewMetrics:
+    """Running totals for one view"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def add(self, sample, seconds, status_code):
+        self.requests += 1
+        self.errors += status_code >= 500
+        self.queries += sample.queries
+        self.max_queries = max(self.max_queries, sample.queries)
+        self.db_seconds += sample.db_seconds
+        self.template_seconds += sample.template_seconds
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def latency_quantile(self, quantile):
+        """Upper bound of the histogram bucket holding the quantile (the request maximum for the last bucket)"""
+        rank = quantile * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+    def summary(self, view):
+        requests = self.requests or 1
+        return {
+            'view': view,
+            'requests': self.requests,
+            'errors': self.errors,
+            'avg_queries': self.queries / requests,
+            'max_queries': self.max_queries,
+            'avg_db_ms': 1000 * self.db_seconds / requests,
+            'avg_template_ms': 1000 * self.template_seconds / requests,
+            'avg_ms': 1000 * self.seconds / requests,
+            'p95_ms': 1000 * self.latency_quantile(0.95),
+            'max_ms': 1000 * self.max_seconds,
+        }
+
+
+class RequestMetrics:
+    """Per-process aggregate of request measurements keyed by URL name.
+
+    Every server process keeps its own totals (cleared on restart), so with several workers each page or scrape
+    reports the process that served it.
+    """
+
+    _views = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def record(view, sample, seconds, status_code):
+        with RequestMetrics._lock:
+            metrics = RequestMetrics._views.get(view)
+            if metrics is None:
+                metrics = RequestMetrics._views[view] = ViewMetrics()
+            metrics.add(sample, seconds, status_code)
+
+    @staticmethod
+    def summaries():
+        """One summary dict per view, slowest total time first"""
+        with RequestMetrics._lock:
+            rows = [(metrics.seconds, metrics.summary(view)) for view, metrics in RequestMetrics._views.items()]
+        return [summary for _, summary in sorted(rows, key=lambda row: row[0], reverse=True)]
+
+    @staticmethod
+    def reset():
+        with RequestMetrics._lock:
+            RequestMetrics._views.clear()
+
+    @staticmethod
+    def prometheus():
+        """The totals in the Prometheus text exposition format"""
+        with RequestMetrics._lock:
+            views = sorted(RequestMetrics._views.items())
+            lines = []
+
+            def family(name, kind, help_text, values):
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for view, value in values:
+                    lines.append(f'{name}{{view="{_escape_label(view)}"}} {value}')
+
+            family('app_requests_total', 'counter', 'Requests handled.', [(v, m.requests) for v, m in views])
+            family('app_request_errors_total', 'counter', 'Requests answered with a 5xx status.',
+                   [(v, m.errors) for v, m in views])
+            family('app_request_db_queries_total', 'counter', 'SQL queries run while handling requests.',
+                   [(v, m.queries) for v, m in views])
+            family('app_request_db_seconds_total', 'counter', 'Time spent in SQL queries.',
+                   [(v, m.db_seconds) for v, m in views])
+            family('app_request_template_seconds_total', 'counter', 'Time spent rendering templates.',
+                   [(v, m.template_seconds) for v, m in views])
+
+            lines.append('# HELP app_request_duration_seconds Request latency.')
+            lines.append('# TYPE app_request_duration_seconds histogram')
+            for view, metrics in views:
+                label = _escape_label(view)
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                    cumulative += count
+                    le = '+Inf' if bound == math.inf else repr(bound)
+                    lines.append(f'app_request_duration_seconds_bucket{{view="{label}",le="{le}"}} {cumulative}')
+                lines.append(f'app_request_duration_seconds_sum{{view="{label}"}} {metrics.seconds}')
+                lines.append(f'app_request_duration_seconds_count{{view="{label}"}} {metrics.requests}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,121 @@
+from app.models import Skill, JobSkill, EmployeeSkill, ApplicationSkill
+from app.services.job_matcher import JobMatcher
+
+SKILL_MAX_LENGTH = Skill._meta.get_field('name').max_length
+
+class SkillIndex:
+    """Keeps the normalised Skill tables in sync with the free-text skill fields and queries them"""
+
+    @staticmethod
+    def parse(skills_text):
+        """Parses skills text the same way as the matcher, dropping names too long to store"""
+        return [skill for skill in JobMatcher._parse_skills(skills_text) if len(skill) <= SKILL_MAX_LENGTH]
+
+    @staticmethod
+    def skill_ids(names):
+        """Returns a {name: id} mapping for the given normalised names, creating missing skills"""
+        names = set(names)
+        if not names:
+            return {}
+
+        ids = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = names - ids.keys()
+        if missing:
+            Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+            ids.update(Skill.objects.filter(name__in=missing).values_list('name', 'id'))
+        return ids
+
+    @staticmethod
+    def _replace_rows(model, owner_field, owner, fields, rows):
+        """Rewrites an owner's rows only when their content differs from the given value tuples"""
+        if set(model.objects.filter(**{owner_field: owner}).values_list(*fields)) == set(rows):
+            return
+
+        model.objects.filter(**{owner_field: owner}).delete()
+        model.objects.bulk_create([model(**{owner_field: owner}, **dict(zip(fields, row))) for row in rows])
+
+    @staticmethod
+    def sync_job(job):
+        required = SkillIndex.parse(job.skills_needed)
+        preferred = SkillIndex.parse(job.skills_wanted)
+        ids = SkillIndex.skill_ids(required + preferred)
+
+        rows = [(ids[name], 'required', i) for i, name in enumerate(required)]
+        rows += [(ids[name], 'preferred', i) for i, name in enumerate(preferred)]
+        SkillIndex._replace_rows(JobSkill, 'job', job, ('skill_id', 'kind', 'position'), rows)
+
+    @staticmethod
+    def sync_jobs(jobs):
+        """sync_job for many jobs with a handful of queries, for rows written with bulk_create/bulk_update"""
+        skills_by_pk = {job.pk: (SkillIndex.parse(job.skills_needed), SkillIndex.parse(job.skills_wanted)) for job in jobs}
+        ids = SkillIndex.skill_ids(
+            name for required, preferred in skills_by_pk.values() for name in required + preferred
+        )
+
+        JobSkill.objects.filter(job_id__in=skills_by_pk).delete()
+        JobSkill.objects.bulk_create([
+            JobSkill(job_id=pk, skill_id=ids[name], kind=kind, position=i)
+            for pk, (required, preferred) in skills_by_pk.items()
+            for kind, names in (('required', required), ('preferred', preferred))
+            for i, name in enumerate(names)
+        ], batch_size=1000)
+
+    @staticmethod
+    def sync_employee(employee):
+        skills = SkillIndex.parse(employee.skills)
+        ids = SkillIndex.skill_ids(skills)
+        rows = [(ids[name], i) for i, name in enumerate(skills)]
+        SkillIndex._replace_rows(EmployeeSkill, 'employee', employee, ('skill_id', 'position'), rows)
+
+    @staticmethod
+    def sync_employees(employees):
+        """sync_employee for many employees with a handful of queries, for rows written with bulk_create/bulk_update"""
+        skills_by_pk = {employee.pk: SkillIndex.parse(employee.skills) for employee in employees}
+        ids = SkillIndex.skill_ids(name for skills in skills_by_pk.values() for name in skills)
+
+        EmployeeSkill.objects.filter(employee_id__in=skills_by_pk).delete()
+        EmployeeSkill.objects.bulk_create([
+            EmployeeSkill(employee_id=pk, skill_id=ids[name], position=i)
+            for pk, skills in skills_by_pk.items()
+            for i, name in enumerate(skills)
+        ], batch_size=1000)
+
+    @staticmethod
+    def sync_application(application):
+        skills = SkillIndex.parse(application.skills)
+        ids = SkillIndex.skill_ids(skills)
+        rows = [(ids[name], i) for i, name in enumerate(skills)]
+        SkillIndex._replace_rows(ApplicationSkill, 'application', application, ('skill_id', 'position'), rows)
+
+    @staticmethod
+    def sync_applications(applications):
+        """sync_application for many applications with a handful of queries, for rows written with bulk_create"""
+        skills_by_pk = {application.pk: SkillIndex.parse(application.skills) for application in applications}
+        ids = SkillIndex.skill_ids(name for skills in skills_by_pk.values() for name in skills)
+
+        ApplicationSkill.objects.filter(application_id__in=skills_by_pk).delete()
+        ApplicationSkill.objects.bulk_create([
+            ApplicationSkill(application_id=pk, skill_id=ids[name], position=i)
+            for pk, skills in skills_by_pk.items()
+            for i, name in enumerate(skills)
+        ], batch_size=1000)
+
+    @staticmethod
+    def matching_skill_ids(employee_skills):
+        """Returns ids of the skills listed by jobs that the given employee skills satisfy"""
+        employee_skills_list = JobMatcher._parse_skills(employee_skills)
+        if not employee_skills_list:
+            return []
+
+        job_skills = Skill.objects.filter(job_skills__isnull=False).distinct().values_list('id', 'name')
+        return [skill_id for skill_id, name in job_skills if JobMatcher._skill_matches(name, employee_skills_list)]
+
+    @staticmethod
+    def candidate_job_ids(employee_skills):
+        """Returns a queryset of ids of jobs sharing at least one skill with the employee"""
+        return SkillIndex.job_ids_with_skills(SkillIndex.matching_skill_ids(employee_skills))
+
+    @staticmethod
+    def job_ids_with_skills(skill_ids):
+        """Returns a queryset of ids of jobs listing any of the given skills"""
+        return JobSkill.objects.filter(skill_id__in=skill_ids).values_list('job_id', flat=True).distinct()
@@ -0,0 +1,146 @@
+from collections import deque
+from functools import lru_cache
+
+SKILL_VARIATIONS = {
+    'javascript': ['js'],
+    'typescript': ['ts'],
+    'react': ['reactjs', 'react.js'],
+    'react native': ['rn'],
+    'node.js': ['nodejs', 'node'],
+    'python': ['py'],
+    'ruby on rails': ['rails', 'ror'],
+    'amazon web services': ['aws'],
+    'google cloud platform': ['gcp'],
+    'microsoft azure': ['azure'],
+    'ci/cd': ['cicd', 'continuous integration', 'continuous deployment'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'user experience': ['ux'],
+    'user interface': ['ui'],
+    'docker': ['containerization'],
+    'kubernetes': ['k8s'],
+    'database': ['db'],
+    'postgresql': ['postgres'],
+    'mongodb': ['mongo']
+}
+
+# Canonical skills are numbered in declaration order; every name and alias maps to its id in one lookup.
+CANONICAL_SKILLS = tuple(SKILL_VARIATIONS)
+CANONICAL_IDS = {skill: skill_id for skill_id, skill in enumerate(CANONICAL_SKILLS)}
+ALIAS_IDS = {
+    alias: CANONICAL_IDS[skill]
+    for skill, aliases in SKILL_VARIATIONS.items()
+    for alias in aliases
+}
+
+MIN_SUBSTRING_LENGTH = 3
+# Below this many patterns a plain scan with str.__contains__ (C speed) beats walking the automaton in Python.
+AUTOMATON_MIN_PATTERNS = 32
+_SEPARATOR = '\x00'
+
+
+def canonical_id(skill):
+    """Returns the canonical skill id for a canonical name or alias, or None if unknown"""
+    skill_id = CANONICAL_IDS.get(skill)
+    return skill_id if skill_id is not None else ALIAS_IDS.get(skill)
+
+
+class SkillAutomaton:
+    """Aho-Corasick automaton answering whether any of a fixed set of patterns occurs in a text"""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._terminal = [False]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._terminal.append(False)
+                state = next_state
+            self._terminal[state] = True
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._terminal[next_state] = self._terminal[next_state] or self._terminal[self._fail[next_state]]
+
+    def search(self, text):
+        goto, fail, terminal = self._goto, self._fail, self._terminal
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if terminal[state]:
+                return True
+        return False
+
+
+class SkillProfile:
+    """A set of employee skills compiled once so that job skills can be tested against it cheaply"""
+
+    def __init__(self, employee_skills):
+        self.skills = list(employee_skills)
+        self._skill_set = set(self.skills)
+        self._canonical_ids = {CANONICAL_IDS[s] for s in self.skills if s in CANONICAL_IDS}
+        self._alias_ids = {ALIAS_IDS[s] for s in self.skills if s in ALIAS_IDS}
+        long_skills = [s for s in self.skills if len(s) > MIN_SUBSTRING_LENGTH]
+        if len(long_skills) >= AUTOMATON_MIN_PATTERNS:
+            self._contains_any = SkillAutomaton(long_skills).search
+        else:
+            self._contains_any = lambda text: any(skill in text for skill in long_skills)
+        self._haystack = _SEPARATOR.join(self.skills)
+        self._results = {}
+
+    @classmethod
+    def for_skills(cls, employee_skills):
+        return _cached_profile(tuple(employee_skills))
+
+    def matches(self, job_skill):
+        """Same outcome as the alias and substring rules of JobMatcher._skill_matches, memoised per job skill"""
+        result = self._results.get(job_skill)
+        if result is None:
+            result = self._results[job_skill] = self._matches(job_skill)
+        return result
+
+    def _matches(self, job_skill):
+        if job_skill in self._skill_set:
+            return True
+
+        job_skill_lower = job_skill.lower()
+
+        skill_id = CANONICAL_IDS.get(job_skill_lower)
+        if skill_id is not None and skill_id in self._alias_ids:
+            return True
+
+        skill_id = ALIAS_IDS.get(job_skill_lower)
+        if skill_id is not None and skill_id in self._canonical_ids:
+            return True
+
+        if self._contains_any(job_skill_lower):
+            return True
+
+        if len(job_skill_lower) > MIN_SUBSTRING_LENGTH:
+            if _SEPARATOR not in job_skill_lower:
+                return job_skill_lower in self._haystack
+            return any(job_skill_lower in skill for skill in self.skills)
+
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _cached_profile(employee_skills):
+    return SkillProfile(employee_skills)
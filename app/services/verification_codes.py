@@ -0,0 +1,37 @@
+import time
+from django.conf import settings
+from django.utils import timezone
+from app.models import VerificationCode
+
+class VerificationCodePurge:
+    """Deletes verification codes that can no longer be redeemed, in batches so no single statement holds long locks"""
+
+    _last_run = None
+
+    @staticmethod
+    def purge(batch_size=1000):
+        """Deletes expired codes (a range on the created_at index), then the used ones still inside LIFETIME.
+        Returns the number of codes deleted"""
+        expired = VerificationCode.objects.filter(created_at__lt=timezone.now() - VerificationCode.LIFETIME)
+        used = VerificationCode.objects.filter(is_used=True)
+
+        deleted = 0
+        for codes in (expired, used):
+            while True:
+                ids = list(codes.order_by().values_list('id', flat=True)[:batch_size])
+                if not ids:
+                    break
+                deleted += VerificationCode.objects.filter(id__in=ids).delete()[0]
+        return deleted
+
+    @staticmethod
+    def maybe_purge():
+        """Purges at most once per VERIFICATION_CODE_PURGE_INTERVAL seconds per process; None disables it"""
+        interval = getattr(settings, 'VERIFICATION_CODE_PURGE_INTERVAL', None)
+        if interval is None:
+            return 0
+        now = time.monotonic()
+        if VerificationCodePurge._last_run is not None and now - VerificationCodePurge._last_run < interval:
+            return 0
+        VerificationCodePurge._last_run = now
+        return VerificationCodePurge.purge()
@@ -0,0 +1,65 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from app.models import Job, Employee, JobApplication
+from app.services.job_matcher import JobMatcher
+from app.services.job_search import JobSearch
+from app.services.match_cache import MatchCache
+from app.services.skill_index import SkillIndex
+
+# Deleting a job, employee or application cascades to its skill rows; delete receivers only drop cached matches.
+
+JOB_SCORE_FIELDS = ('skills_needed', 'skills_wanted', 'job_type')
+EMPLOYEE_MATCH_FIELDS = ('skills', 'preferred_contract')
+
+def _stored_values(instance, fields):
+    """The given fields as currently stored in the database, or None for an unsaved instance"""
+    if instance.pk is None:
+        return None
+    return type(instance).objects.filter(pk=instance.pk).values_list(*fields).first()
+
+@receiver(pre_save, sender=Job)
+def remember_job_score_fields(sender, instance, **kwargs):
+    instance._previous_score_fields = _stored_values(instance, JOB_SCORE_FIELDS)
+
+@receiver(post_save, sender=Job)
+def sync_job_skills(sender, instance, created, **kwargs):
+    SkillIndex.sync_job(instance)
+    JobSearch.index_job(instance)
+    MatchCache.invalidate_catalog()
+
+    previous = getattr(instance, '_previous_score_fields', None)
+    if not created and previous is not None and previous != tuple(getattr(instance, field) for field in JOB_SCORE_FIELDS):
+        JobMatcher.rescore_applications(instance.applications.all())
+
+@receiver(post_delete, sender=Job)
+def invalidate_job_matches(sender, instance, **kwargs):
+    MatchCache.invalidate_catalog()
+    JobSearch.remove_job(instance.pk)
+
+@receiver(pre_save, sender=Employee)
+def remember_employee_match_fields(sender, instance, **kwargs):
+    instance._previous_match_fields = _stored_values(instance, EMPLOYEE_MATCH_FIELDS)
+
+@receiver(post_save, sender=Employee)
+def sync_employee_skills(sender, instance, **kwargs):
+    SkillIndex.sync_employee(instance)
+
+    previous = getattr(instance, '_previous_match_fields', None)
+    if previous != (instance.skills, instance.preferred_contract):
+        MatchCache.invalidate_employee(instance.pk)
+    # The stored application scores include the contract bonus.
+    if previous is not None and previous[1] != instance.preferred_contract:
+        JobMatcher.rescore_applications(instance.applications.all())
+
+@receiver(post_delete, sender=Employee)
+def invalidate_employee_matches(sender, instance, **kwargs):
+    MatchCache.invalidate_employee(instance.pk)
+
+@receiver(pre_save, sender=JobApplication)
+def score_application(sender, instance, **kwargs):
+    if instance.score is None:
+        JobMatcher.score_application(instance)
+
+@receiver(post_save, sender=JobApplication)
+def sync_application_skills(sender, instance, **kwargs):
+    SkillIndex.sync_application(instance)
@@ -0,0 +1,95 @@
+from unittest.mock import patch
+from django.test import TestCase
+from django.urls import reverse
+from app.services.job_matcher import JobMatcher
+from app.models import User, Employee, Employer, Job, JobApplication
+
+class ApplicationScoreTests(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user(
+            username='@employer',
+            email='employer@example.com',
+            password='testpassword',
+            user_type='employer'
+        )
+        self.employer = Employer.objects.create(user=employer_user, company_name='Test Company')
+        self.job = Job.objects.create(
+            name='Python Developer',
+            department='Engineering',
+            description='Description',
+            salary=50000,
+            created_by=self.employer,
+            skills_needed='Python, Django',
+            skills_wanted='Docker',
+            job_type='FT'
+        )
+
+        self.applications = []
+        for i, skills in enumerate(['Python', 'Python, Django, Docker', 'Go']):
+            user = User.objects.create_user(
+                username=f'@employee{i}',
+                email=f'employee{i}@example.com',
+                password='testpassword',
+                user_type='employee'
+            )
+            employee = Employee.objects.create(user=user, skills=skills, preferred_contract='FT')
+            self.applications.append(JobApplication.objects.create(job=self.job, applicant=employee, skills=skills))
+
+    def _expected(self, application):
+        application.refresh_from_db()
+        job = application.job
+        return JobMatcher.calculate_match_score(
+            application.skills, job.skills_needed, job.skills_wanted, application.applicant.preferred_contract, job.job_type
+        )
+
+    def _stored(self, application):
+        application.refresh_from_db()
+        return application.score, application.matching_skills, application.missing_skills
+
+    def test_score_stored_on_submission(self):
+        for application in self.applications:
+            self.assertEqual(self._stored(application), self._expected(application))
+
+    def test_job_skill_change_rescores_applications(self):
+        self.job.skills_needed = 'Go'
+        self.job.save()
+        for application in self.applications:
+            self.assertEqual(self._stored(application), self._expected(application))
+        self.assertEqual(self._stored(self.applications[2])[0], 73.0)
+
+    def test_unrelated_job_change_keeps_scores(self):
+        JobApplication.objects.filter(pk=self.applications[0].pk).update(score=1.0)
+        self.job.description = 'Updated'
+        self.job.save()
+        self.assertEqual(self._stored(self.applications[0])[0], 1.0)
+
+    def test_contract_change_rescores_applications(self):
+        employee = self.applications[1].applicant
+        employee.preferred_contract = 'PT'
+        employee.save()
+        self.assertEqual(self._stored(self.applications[1]), self._expected(self.applications[1]))
+        self.assertEqual(self._stored(self.applications[1])[0], 90.0)
+
+    def test_job_detail_orders_by_stored_score(self):
+        self.client.login(username='@employer', password='testpassword')
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('job_detail', args=[self.job.id]))
+
+        scores = [item['score'] for item in response.context['applications_with_scores']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(response.context['applications_page'].paginator.count, 3)
+
+    @patch('app.views.employer_views.APPLICATIONS_PER_PAGE', 1)
+    def test_job_detail_links_a_window_of_pages(self):
+        for i in range(3, 12):
+            user = User.objects.create_user(username=f'@employee{i}', email=f'employee{i}@example.com',
+                                            password='testpassword', user_type='employee')
+            employee = Employee.objects.create(user=user, skills='Python')
+            JobApplication.objects.create(job=self.job, applicant=employee, skills='Python')
+        self.client.login(username='@employer', password='testpassword')
+
+        response = self.client.get(reverse('job_detail', args=[self.job.id]), {'page': 6})
+        self.assertEqual(response.context['applications_page'].paginator.num_pages, 12)
+        self.assertEqual(list(response.context['page_range']), [1, '…', 4, 5, 6, 7, 8, '…', 12])
+        self.assertContains(response, '?page=8')
+        self.assertNotContains(response, '?page=10"')
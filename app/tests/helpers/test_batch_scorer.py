@@ -0,0 +1,132 @@
+import numpy as np
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from app.services.batch_scorer import BatchScorer, CandidatePool, SkillVocabulary
+from app.services.job_matcher import JobMatcher
+from app.models import User, Employee, Employer, Job
+
+class BatchScorerTests(TestCase):
+    EMPLOYEE_SKILLS = [
+        'Python, JS, Docker',
+        'JavaScript, React.js, Postgres',
+        'python developer; aws; k8s',
+        'Containerization, ML, SQL',
+        'Django',
+        '',
+        'Communication, Leadership',
+        'node, node, Go',
+    ]
+
+    def setUp(self):
+        employer_user = User.objects.create_user(
+            username='@employer',
+            email='employer@example.com',
+            password='testpassword',
+            user_type='employer'
+        )
+        self.employer = Employer.objects.create(user=employer_user, company_name='Test Company')
+
+        self.employees = []
+        for i, skills in enumerate(self.EMPLOYEE_SKILLS):
+            user = User.objects.create_user(
+                username=f'@employee{i}',
+                email=f'employee{i}@example.com',
+                password='testpassword',
+                user_type='employee'
+            )
+            self.employees.append(Employee.objects.create(
+                user=user,
+                skills=skills,
+                preferred_contract=['FT', 'PT', ''][i % 3]
+            ))
+
+    def _create_job(self, skills_needed, skills_wanted, job_type='FT'):
+        return Job.objects.create(
+            name='Job',
+            department='Engineering',
+            description='Description',
+            salary=50000,
+            created_by=self.employer,
+            skills_needed=skills_needed,
+            skills_wanted=skills_wanted,
+            job_type=job_type
+        )
+
+    def _assert_same_as_pairwise(self, job):
+        pool = CandidatePool.from_employees(self.employees)
+        result = BatchScorer.score_job(job, pool)
+        for row, employee in enumerate(self.employees):
+            expected = JobMatcher.calculate_match_score(
+                employee.skills,
+                job.skills_needed,
+                job.skills_wanted,
+                employee.preferred_contract,
+                job.job_type
+            )
+            self.assertEqual(result.details(row), expected, employee.skills)
+
+    def test_scores_equal_calculate_match_score(self):
+        jobs = [
+            self._create_job('Python, Django', 'React, AWS'),
+            self._create_job('JavaScript, Node.js, PostgreSQL', 'Docker', 'PT'),
+            self._create_job('Kubernetes, Machine Learning', ''),
+            self._create_job('', 'Python, Go'),
+            self._create_job('', ''),
+            self._create_job('Senior Python Developer, Lead', 'Communication skills'),
+            self._create_job('py, js, db', 'docker, docker'),
+        ]
+        for job in jobs:
+            self._assert_same_as_pairwise(job)
+
+    def test_ranking_is_stable_descending(self):
+        job = self._create_job('Python, Docker', 'AWS')
+        result = BatchScorer.score_job(job, CandidatePool.from_employees(self.employees))
+        ranking = result.ranking().tolist()
+
+        scores = [result.scores[row] for row in ranking]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        for first, second in zip(ranking, ranking[1:]):
+            if result.scores[first] == result.scores[second]:
+                self.assertLess(first, second)
+
+    def test_match_job_to_employees_uses_pool(self):
+        job = self._create_job('Python, Docker', 'AWS')
+        matches = JobMatcher.match_job_to_employees(job, Employee.objects.all())
+
+        self.assertEqual(len(matches), len(self.employees))
+        for match in matches:
+            expected = JobMatcher.calculate_match_score(
+                match['employee'].skills, job.skills_needed, job.skills_wanted,
+                match['employee'].preferred_contract, job.job_type
+            )
+            self.assertEqual((match['score'], match['matching_skills'], match['missing_skills']), expected)
+
+    def test_match_job_to_employees_only_reads(self):
+        job = self._create_job('Python, Docker', 'AWS')
+        with CaptureQueriesContext(connection) as queries:
+            matches = JobMatcher.match_job_to_employees(job, Employee.objects.all())
+            self.assertEqual(len({match['employee'].email for match in matches}), len(self.employees))
+
+        self.assertEqual(len(queries), 4)
+        self.assertTrue(all(query['sql'].upper().startswith('SELECT') for query in queries))
+
+    def test_pool_from_pairs_groups_rows(self):
+        vocabulary = SkillVocabulary({1: 'python', 2: 'django', 3: 'docker'})
+        pool = CandidatePool.from_pairs(
+            [30, 10, 20],
+            ['FT', 'PT', ''],
+            np.array([[10, 3], [30, 1], [30, 2], [10, 1]]),
+            vocabulary
+        )
+        self.assertEqual(pool.skill_names(0), ['python', 'django'])
+        self.assertEqual(pool.skill_names(1), ['docker', 'python'])
+        self.assertEqual(pool.skill_names(2), [])
+        self.assertEqual(pool.has_skills.tolist(), [True, True, False])
+
+    def test_vocabulary_matching_ids(self):
+        vocabulary = SkillVocabulary({1: 'python', 2: 'js', 3: 'python developer', 4: 'sql'})
+        self.assertEqual(vocabulary.matching_ids('python'), {1, 3})
+        self.assertEqual(vocabulary.matching_ids('javascript'), {2})
+        self.assertEqual(vocabulary.matching_ids('senior python developer'), {1, 3})
+        self.assertEqual(vocabulary.matching_ids('mysql'), set())
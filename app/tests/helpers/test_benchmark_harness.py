@@ -0,0 +1,51 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+from app.benchmarks import extractor_scaling, load, matcher_scaling
+from app.benchmarks.timing import regressions, scaling_exponent
+
+class ScalingTests(SimpleTestCase):
+    def test_scaling_exponent(self):
+        self.assertAlmostEqual(scaling_exponent({10: 0.01, 100: 0.1, 1000: 1.0}), 1.0)
+        self.assertAlmostEqual(scaling_exponent({10: 0.01, 100: 1.0}), 2.0)
+        self.assertIsNone(scaling_exponent({10: 0.01}))
+
+    def test_regressions_only_report_drops_beyond_threshold(self):
+        baseline = {'fast': 100.0, 'slow': 100.0, 'new_in_baseline': 5.0}
+        current = {'fast': 85.0, 'slow': 70.0, 'unknown': 1.0}
+        self.assertEqual(regressions(baseline, current, 0.2), [('slow', 100.0, 70.0)])
+
+    def test_generated_cvs_have_the_requested_length(self):
+        for size in (500, 4000):
+            self.assertEqual(len(extractor_scaling.generate_cv(size)), size)
+        self.assertIn('EDUCATION', extractor_scaling.generate_cv(4000))
+
+    def test_baseline_regression_fails_the_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            saved = Path(directory) / 'baseline.json'
+            call_command('benchmark', 'extractor_scaling', repeat=1, save=str(saved), stdout=StringIO())
+            document = json.loads(saved.read_text())
+            self.assertIn('extract_email [1000 chars]', document['ops_per_sec'])
+
+            document['ops_per_sec']['extract_email [1000 chars]'] *= 1000
+            saved.write_text(json.dumps(document))
+            with self.assertRaisesMessage(CommandError, 'extract_email [1000 chars]'):
+                call_command('benchmark', 'extractor_scaling', repeat=1, baseline=str(saved), stdout=StringIO())
+
+
+class MatcherScalingTests(TestCase):
+    def test_pool_curves_cover_both_directions(self):
+        load.seed(employees=20, employers=2, jobs=20, applications=0, hot_applications=0)
+        results = matcher_scaling.pool_curves(StringIO(), repeat=1, pool_sizes=(5, 20))
+
+        self.assertEqual(set(results['scaling']), {'match_employee_to_jobs', 'match_job_to_employees'})
+        self.assertIn('match_job_to_employees [20 pool]', results['ops_per_sec'])
+        self.assertTrue(all(rate > 0 for rate in results['ops_per_sec'].values()))
+
+    def test_primitive_rates(self):
+        rates = matcher_scaling.primitive_rates(StringIO(), repeat=1, size=50)
+        self.assertEqual(set(rates), {'_parse_skills', '_skill_matches', 'calculate_match_score'})
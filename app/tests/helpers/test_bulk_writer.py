@@ -0,0 +1,28 @@
+from django.test import TestCase
+from app.models import User, Employee, Employer, Job, JobApplication, JobSkill, EmployeeSkill, ApplicationSkill
+from app.services.bulk_writer import BulkWriter
+from app.services.job_search import JobSearch
+from app.services.match_cache import MatchCache
+
+class BulkWriterTests(TestCase):
+    def test_rows_get_the_side_effects_of_their_signals(self):
+        employer, employee = Employer(company_name='Acme'), Employee(skills='Python, Docker', preferred_contract='FT')
+        BulkWriter.save_users([
+            (User(username='@acme', email='hr@acme.com', user_type='employer'), employer),
+            (User(username='@jane', email='jane@example.com', user_type='employee'), employee),
+        ])
+        job = Job(name='Python Developer', description='', department='IT', salary=1, job_type='FT',
+                  skills_needed='Python, Django', created_by=employer)
+        BulkWriter.save_jobs([job])
+        BulkWriter.save_applications([JobApplication(job=job, applicant=employee, skills=employee.skills)])
+        catalog_version, _ = MatchCache.versions(employee.pk)
+        BulkWriter.finish()
+
+        self.assertEqual(Employee.objects.get().user.username, '@jane')
+        self.assertEqual(EmployeeSkill.objects.filter(employee=employee).count(), 2)
+        self.assertEqual(JobSkill.objects.filter(job=job).count(), 2)
+        application = JobApplication.objects.get()
+        self.assertEqual((application.score, application.matching_skills), (55.0, ['python']))
+        self.assertEqual(ApplicationSkill.objects.filter(application=application).count(), 2)
+        self.assertIn(job, JobSearch.search(Job.objects.all(), 'Python Developer'))
+        self.assertEqual(MatchCache.versions(employee.pk)[0], catalog_version + 1)
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+from django.test import SimpleTestCase
+from app import helper
+from app.benchmarks.cv_extraction import EXTRACTORS, SAMPLE_CV, extract_legacy, extract_shared, generate_cvs, matches_legacy
+from app.helper import CVDocument
+
+class CVDocumentTests(SimpleTestCase):
+    def test_is_the_original_text(self):
+        document = CVDocument("Name\nSKILLS\nPython")
+        self.assertEqual(document, "Name\nSKILLS\nPython")
+        self.assertIs(CVDocument.of(document), document)
+        self.assertEqual(document.lines_lower, ['name', 'skills', 'python'])
+        self.assertEqual(document.words, {'name', 'skills', 'python'})
+
+    def test_section_stops_at_end_keyword_and_is_cached(self):
+        document = CVDocument("SKILLS\nPython, Go\n\nDocker\nEDUCATION\nBSc\nKey Skills\nSQL")
+        section = document.section(['Skills'], ['EDUCATION'])
+        self.assertEqual(section, ['Python, Go', 'Docker', 'SQL'])
+        self.assertIs(document.section(['Skills'], ['EDUCATION']), section)
+
+    def test_extractors_match_legacy(self):
+        for text in generate_cvs(300) + ['', 'English only', SAMPLE_CV.upper(), SAMPLE_CV.replace('\n', '\r\n')]:
+            self.assertTrue(matches_legacy(extract_legacy(text), extract_shared(text)), text)
+
+    def test_plain_strings_still_accepted(self):
+        for name in EXTRACTORS:
+            self.assertEqual(getattr(helper, name)(SAMPLE_CV), getattr(helper, name)(CVDocument(SAMPLE_CV)))
+
+    def test_parse_cv_shares_one_document(self):
+        seen = []
+        def record(text):
+            seen.append(text)
+            return []
+        with patch('app.helper.extract_text_from_pdf', return_value=SAMPLE_CV), \
+             patch('app.helper.extract_name', return_value=None), \
+             patch('app.helper.extract_skills', side_effect=record), \
+             patch('app.helper.extract_languages', side_effect=record):
+            helper.parse_cv('cv.pdf')
+        self.assertIsInstance(seen[0], CVDocument)
+        self.assertIs(seen[0], seen[1])
@@ -0,0 +1,102 @@
+import os
+import tempfile
+from collections import OrderedDict
+from io import StringIO
+from unittest.mock import patch
+import fitz
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from app.models import Employee, EmployeeSkill, Employer, Job, User
+from app.services.cv_import import CVImporter
+from app.services.match_cache import MatchCache
+
+def cv_data(email, name='Jane Doe', skills=('Python', 'SQL')):
+    return {'Name': name, 'E-mail': email, 'Phone': '07123 456789', 'Education': ['BSc Physics'],
+            'Experience': [], 'Skills': list(skills), 'Languages': ['English'], 'Interests': []}
+
+class CVImporterTests(TestCase):
+    def test_creates_users_and_employees(self):
+        created, updated, failures = CVImporter.save([('a.pdf', cv_data('jane@example.com')),
+                                                      ('b.pdf', cv_data('bob@example.com', 'Bob'))])
+        self.assertEqual((created, updated, failures), (2, 0, []))
+
+        jane = Employee.objects.get(user__email='jane@example.com')
+        self.assertEqual((jane.user.first_name, jane.user.last_name), ('Jane', 'Doe'))
+        self.assertEqual(jane.user.user_type, 'employee')
+        self.assertFalse(jane.user.has_usable_password())
+        self.assertTrue(jane.user.username.startswith('@jane_'))
+        self.assertEqual(jane.skills, 'Python, SQL')
+        self.assertEqual(jane.education, 'BSc Physics')
+        self.assertEqual(EmployeeSkill.objects.filter(employee=jane).count(), 2)
+
+    def test_updates_existing_employee_without_blanking_fields(self):
+        employee = Employee.objects.create(username='@janedoe', email='jane@example.com', password='x',
+                                           first_name='Jane', last_name='Doe', experience='Acme Ltd')
+        created, updated, failures = CVImporter.save([('a.pdf', cv_data('jane@example.com', skills=['Docker']))])
+        self.assertEqual((created, updated, failures), (0, 1, []))
+
+        employee.refresh_from_db()
+        self.assertEqual(employee.skills, 'Docker')
+        self.assertEqual(employee.experience, 'Acme Ltd')
+        self.assertEqual(list(employee.employee_skills.values_list('skill__name', flat=True)), ['docker'])
+
+    def test_updates_do_not_save_user_rows(self):
+        Employee.objects.create(username='@janedoe', email='jane@example.com', password='x',
+                                first_name='Jane', last_name='Doe')
+        with CaptureQueriesContext(connection) as queries:
+            CVImporter.save([('a.pdf', cv_data('jane@example.com', skills=['Docker']))])
+        self.assertFalse([query for query in queries if query['sql'].startswith('UPDATE "app_user"')])
+
+    def test_updates_invalidate_other_processes_match_cache(self):
+        employee = Employee.objects.create(username='@janedoe', email='jane@example.com', password='x',
+                                           first_name='Jane', last_name='Doe', skills='Python')
+        MatchCache.clear()
+        matches = MatchCache.job_matches(employee, Job.objects.all(), {})
+
+        # import_cvs runs in its own process, with its own empty cache
+        with patch.object(MatchCache, '_entries', OrderedDict()):
+            CVImporter.save([('a.pdf', cv_data('jane@example.com', skills=['Docker']))])
+
+        self.assertIsNot(MatchCache.job_matches(employee, Job.objects.all(), {}), matches)
+
+    def test_reports_failures(self):
+        Employer.objects.create(username='@acme', email='hr@acme.com', password='x', first_name='A', last_name='B')
+        created, updated, failures = CVImporter.save([
+            ('none.pdf', cv_data(None)),
+            ('first.pdf', cv_data('jane@example.com')),
+            ('again.pdf', cv_data('jane@example.com')),
+            ('employer.pdf', cv_data('hr@acme.com')),
+        ])
+        self.assertEqual((created, updated), (1, 0))
+        self.assertEqual([source for source, _ in failures], ['none.pdf', 'again.pdf', 'employer.pdf'])
+        self.assertEqual(User.objects.filter(email='jane@example.com').count(), 1)
+
+
+class ImportCVsCommandTests(TestCase):
+    def write_pdf(self, directory, filename, text):
+        document = fitz.open()
+        document.new_page().insert_text((72, 72), text)
+        document.save(os.path.join(directory, filename))
+
+    def test_imports_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write_pdf(directory, 'jane.pdf', "Jane Doe\njane@example.com\nSKILLS\nPython, Docker")
+            os.makedirs(os.path.join(directory, 'agency'))
+            self.write_pdf(directory, 'agency/bob.pdf', "Bob Stone\nbob@example.com\nSKILLS\nSQL")
+            with open(os.path.join(directory, 'broken.pdf'), 'wb') as f:
+                f.write(b'not a pdf')
+
+            out, err = StringIO(), StringIO()
+            call_command('import_cvs', directory, '--workers', '1', stdout=out, stderr=err)
+
+        self.assertIn('2 created, 0 updated, 1 failed', out.getvalue())
+        self.assertIn('broken.pdf: no text could be extracted', err.getvalue())
+        self.assertIn('Docker', Employee.objects.get(user__email='jane@example.com').skills)
+        self.assertTrue(Employee.objects.filter(user__email='bob@example.com').exists())
+
+    def test_missing_directory(self):
+        with self.assertRaises(CommandError):
+            call_command('import_cvs', '/nonexistent/cvs')
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import patch, Mock, MagicMock
-from app.helper import is_valid_pdf, extract_text_from_pdf, extract_email, extract_phone_number, extract_name, extract_education, extract_experience, extract_skills, extract_interests, extract_languages, parse_cv
+from app.helper import iter_pdf_text, extract_text_from_pdf, extract_email, extract_phone_number, extract_name, extract_education, extract_experience, extract_skills, extract_interests, extract_languages, parse_cv
 
 class TestHelperMethods(unittest.TestCase):
     def setUp(self):
@@ -29,65 +29,63 @@ class TestHelperMethods(unittest.TestCase):
         Hiking, Photography, Reading
         """
 
-    @patch('app.helper.fitz.open')
-    def test_is_valid_pdf_true(self, mock_fitz_open):
+    def mock_pdf(self, mock_fitz_open, page_texts, needs_pass=False):
         mock_doc = MagicMock()
-        mock_doc.__len__.return_value = 5
+        mock_doc.__enter__.return_value = mock_doc
+        mock_doc.needs_pass = needs_pass
+        pages = [MagicMock(**{'get_text.return_value': text}) for text in page_texts]
+        mock_doc.__len__.return_value = len(pages)
+        mock_doc.__getitem__.side_effect = pages.__getitem__
         mock_fitz_open.return_value = mock_doc
-        
-        result = is_valid_pdf("valid.pdf")
-        self.assertTrue(result)
-        mock_fitz_open.assert_called_once_with("valid.pdf")
+        return pages
 
     @patch('app.helper.fitz.open')
-    def test_is_valid_pdf_false_empty(self, mock_fitz_open):
-        mock_doc = MagicMock()
-        mock_doc.__len__.return_value = 0
-        mock_fitz_open.return_value = mock_doc
-        
-        result = is_valid_pdf("empty.pdf")
-        self.assertFalse(result)
-
-    @patch('app.helper.fitz.open')
-    def test_is_valid_pdf_exception(self, mock_fitz_open):
-        mock_fitz_open.side_effect = Exception("Invalid PDF")
-        
-        result = is_valid_pdf("invalid.pdf")
-        self.assertFalse(result)
-
-    @patch('app.helper.pdfplumber.open')
-    def test_extract_text_from_pdf(self, mock_plumber_open):
-        mock_pdf = MagicMock()
-        mock_page1 = MagicMock()
-        mock_page1.extract_text.return_value = "Page 1 content"
-        mock_page2 = MagicMock()
-        mock_page2.extract_text.return_value = "Page 2 content"
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_plumber_open.return_value.__enter__.return_value = mock_pdf
+    def test_extract_text_from_pdf(self, mock_fitz_open):
+        self.mock_pdf(mock_fitz_open, ["Page 1 content\n", "Page 2 content\n"])
         
         result = extract_text_from_pdf("test.pdf")
         self.assertEqual(result, "Page 1 content\nPage 2 content")
+        mock_fitz_open.assert_called_once_with("test.pdf")
 
-    @patch('app.helper.pdfplumber.open')
-    def test_extract_text_from_pdf_empty_page(self, mock_plumber_open):
-        mock_pdf = MagicMock()
-        mock_page1 = MagicMock()
-        mock_page1.extract_text.return_value = "Page 1 content"
-        mock_page2 = MagicMock()
-        mock_page2.extract_text.return_value = None
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_plumber_open.return_value.__enter__.return_value = mock_pdf
+    @patch('app.helper.fitz.open')
+    def test_extract_text_from_pdf_empty_page(self, mock_fitz_open):
+        self.mock_pdf(mock_fitz_open, ["Page 1 content", " \n"])
         
         result = extract_text_from_pdf("test.pdf")
         self.assertEqual(result, "Page 1 content")
 
-    @patch('app.helper.pdfplumber.open')
-    def test_extract_text_from_pdf_exception(self, mock_plumber_open):
-        mock_plumber_open.side_effect = Exception("Error opening PDF")
+    @patch('app.helper.fitz.open')
+    def test_extract_text_from_pdf_exception(self, mock_fitz_open):
+        mock_fitz_open.side_effect = Exception("Error opening PDF")
         
         result = extract_text_from_pdf("invalid.pdf")
         self.assertEqual(result, "")
 
+    @patch('app.helper.fitz.open')
+    def test_extract_text_from_pdf_encrypted(self, mock_fitz_open):
+        self.mock_pdf(mock_fitz_open, ["Secret"], needs_pass=True)
+        self.assertEqual(extract_text_from_pdf("locked.pdf"), "")
+
+    @patch('app.helper.fitz.open')
+    def test_iter_pdf_text_empty_document(self, mock_fitz_open):
+        self.mock_pdf(mock_fitz_open, [])
+        self.assertEqual(list(iter_pdf_text("empty.pdf")), [])
+        mock_fitz_open.assert_called_once_with("empty.pdf")
+
+    @patch('app.helper.fitz.open')
+    def test_iter_pdf_text_invalid_pdf_raises(self, mock_fitz_open):
+        mock_fitz_open.side_effect = Exception("Invalid PDF")
+        with self.assertRaises(Exception):
+            list(iter_pdf_text("invalid.pdf"))
+
+    @patch('app.helper.fitz.open')
+    def test_iter_pdf_text_stops_at_budget(self, mock_fitz_open):
+        pages = self.mock_pdf(mock_fitz_open, ["a" * 10, "b" * 10, "c" * 10, "d" * 10])
+        
+        self.assertEqual(list(iter_pdf_text("big.pdf", max_pages=2, max_chars=100)), ["a" * 10, "b" * 10])
+        self.assertEqual(list(iter_pdf_text("big.pdf", max_pages=10, max_chars=15)), ["a" * 10, "b" * 5])
+        pages[3].get_text.assert_not_called()
+
     def test_extract_email(self):
         text = "Contact me at john.doe@example.com for more information."
         self.assertEqual(extract_email(text), "john.doe@example.com")
@@ -0,0 +1,129 @@
+import os
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.conf import settings
+from django.core.management import call_command
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from app.helper import PARSER_VERSION
+from app.models import CVParseJob, ParsedCV
+from app.services.cv_cache import ParsedCVCache
+from app.services.cv_pipeline import CVPipeline, MAX_ATTEMPTS
+from app.services.cv_worker import parse_cv_file
+from app.tests.views.test_cv_upload import pdf_bytes
+
+class CVPipelineTests(TestCase):
+    def test_claim_marks_jobs_processing_once(self):
+        first = CVPipeline.enqueue('uploads/a.pdf')
+        second = CVPipeline.enqueue('uploads/b.pdf')
+
+        claimed = CVPipeline.claim(1)
+        self.assertEqual([job.id for job in claimed], [first.id])
+        self.assertEqual(claimed[0].status, 'processing')
+        self.assertEqual(claimed[0].attempts, 1)
+        self.assertEqual([job.id for job in CVPipeline.claim(5)], [second.id])
+        self.assertEqual(CVPipeline.claim(5), [])
+
+    def test_result_available_once_finished(self):
+        job = CVPipeline.enqueue('uploads/a.pdf')
+        self.assertIsNone(CVPipeline.result(job.id))
+
+        CVPipeline.finish(job, 'done', {'Skills': ['Python']})
+        self.assertEqual(CVPipeline.result(job.id), {'Skills': ['Python']})
+
+        failed = CVPipeline.enqueue('uploads/b.pdf')
+        CVPipeline.finish(failed, 'failed', 'ValueError: broken')
+        self.assertEqual(CVPipeline.result(failed.id), {})
+        self.assertEqual(CVParseJob.objects.get(id=failed.id).error, 'ValueError: broken')
+
+    def test_requeue_stale(self):
+        retry = CVPipeline.enqueue('uploads/a.pdf')
+        give_up = CVPipeline.enqueue('uploads/b.pdf')
+        CVPipeline.claim(2)
+        long_ago = timezone.now() - timedelta(hours=1)
+        CVParseJob.objects.update(started_at=long_ago)
+        CVParseJob.objects.filter(id=give_up.id).update(attempts=MAX_ATTEMPTS)
+
+        CVPipeline.requeue_stale(600)
+        self.assertEqual(CVParseJob.objects.get(id=retry.id).status, 'pending')
+        self.assertEqual(CVParseJob.objects.get(id=give_up.id).status, 'failed')
+
+    def test_release_requeues_or_fails(self):
+        retry = CVPipeline.enqueue('uploads/a.pdf')
+        give_up = CVPipeline.enqueue('uploads/b.pdf')
+        CVParseJob.objects.filter(id=give_up.id).update(attempts=MAX_ATTEMPTS - 1)
+
+        CVPipeline.release(CVPipeline.claim(2))
+        self.assertEqual(CVParseJob.objects.get(id=retry.id).status, 'pending')
+        self.assertEqual(CVParseJob.objects.get(id=give_up.id).status, 'failed')
+
+    def test_parse_cv_file_reports_errors(self):
+        with patch('app.helper.parse_cv', side_effect=ValueError('broken')):
+            self.assertEqual(parse_cv_file('missing.pdf'), ('failed', 'ValueError: broken'))
+
+    def test_worker_command_processes_queue(self):
+        upload_dir = os.path.join(settings.MEDIA_ROOT, 'uploads')
+        os.makedirs(upload_dir, exist_ok=True)
+        with open(os.path.join(upload_dir, 'not_a_pdf.pdf'), 'wb') as f:
+            f.write(b'This is not a PDF')
+        content_hash = ParsedCVCache.hash_file(ContentFile(b'This is not a PDF'))
+        job = CVPipeline.enqueue('uploads/not_a_pdf.pdf', content_hash)
+        duplicate = CVPipeline.enqueue('uploads/not_a_pdf.pdf', content_hash)
+
+        out = StringIO()
+        call_command('process_cvs', '--once', '--workers', '1', stdout=out)
+        job.refresh_from_db()
+        duplicate.refresh_from_db()
+        self.assertEqual(job.status, 'done')
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(duplicate.result, job.result)
+        self.assertEqual(ParsedCVCache.get(content_hash), job.result)
+
+        # Re-uploads of the same document are answered without queueing a parse.
+        again = CVPipeline.enqueue('uploads/copy.pdf', content_hash)
+        self.assertEqual(again.status, 'done')
+        self.assertEqual(CVPipeline.result(again.id), job.result)
+
+    def test_hash_file_rewinds(self):
+        file = ContentFile(b'abc')
+        self.assertEqual(ParsedCVCache.hash_file(file), 'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad')
+        self.assertEqual(file.read(), b'abc')
+
+    @override_settings(PARSED_CV_CACHE_MAX_ENTRIES=2)
+    def test_cache_evicts_least_recently_used(self):
+        ParsedCV.objects.create(content_hash='old-version', parser_version=PARSER_VERSION - 1, result={})
+        ParsedCVCache.put('a', {'Name': 'A'})
+        ParsedCVCache.put('b', {'Name': 'B'})
+        self.assertEqual(ParsedCVCache.get('a'), {'Name': 'A'})
+        ParsedCVCache.put('c', {'Name': 'C'})
+
+        self.assertEqual(set(ParsedCV.objects.values_list('content_hash', flat=True)), {'a', 'c'})
+        self.assertIsNone(ParsedCVCache.get('b'))
+
+    def test_upload_records_content_hash(self):
+        content = pdf_bytes()
+        response = self.client.post(reverse('employee_signup_2'), {'cv': ContentFile(content, name='cv.pdf')})
+        self.assertEqual(response.status_code, 302)
+        job = CVParseJob.objects.get(id=self.client.session['cv_parse_job'])
+        self.assertEqual(job.content_hash, ParsedCVCache.hash_file(ContentFile(content)))
+
+    def test_review_step_polls_until_parsed(self):
+        job = CVPipeline.enqueue('uploads/test_cv.pdf')
+        session = self.client.session
+        session['cv_filename'] = 'uploads/test_cv.pdf'
+        session['cv_parse_job'] = job.id
+        session.save()
+
+        response = self.client.get(reverse('employee_signup_3'))
+        self.assertTrue(response.context['cv_pending'])
+        self.assertEqual(self.client.get(reverse('cv_parse_status')).json(), {'status': 'pending'})
+
+        CVPipeline.finish(job, 'done', {'Phone': '555-1234'})
+        response = self.client.get(reverse('employee_signup_3'))
+        self.assertFalse(response.context['cv_pending'])
+        self.assertEqual(response.context['cv_data']['Phone'], '555-1234')
+        self.assertEqual(self.client.get(reverse('cv_parse_status')).json(), {'status': 'done'})
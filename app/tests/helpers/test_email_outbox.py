@@ -0,0 +1,101 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from app.models import OutboundEmail, User
+from app.services.email_backends import SendGridBackend, StubBackend
+from app.services.email_outbox import EmailOutbox, MAX_ATTEMPTS
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FailingBackend:
+    def __init__(self, error):
+        self.error = error
+
+    def send(self, email):
+        raise self.error
+
+
+@override_settings(EMAIL_OUTBOX_BACKEND='app.services.email_backends.StubBackend',
+                   EMAIL_RETRY_BASE_DELAY=30, EMAIL_RETRY_MAX_DELAY=3600)
+class EmailOutboxTests(TestCase):
+    def setUp(self):
+        StubBackend.sent.clear()
+
+    def test_claim_only_due_emails_once(self):
+        due = EmailOutbox.enqueue('a@example.com', 'Hi', '<p>Hi</p>')
+        later = EmailOutbox.enqueue('b@example.com', 'Hi', '<p>Hi</p>')
+        OutboundEmail.objects.filter(id=later.id).update(next_attempt_at=timezone.now() + timedelta(minutes=5))
+
+        claimed = EmailOutbox.claim(10)
+        self.assertEqual([email.id for email in claimed], [due.id])
+        self.assertEqual((claimed[0].status, claimed[0].attempts), ('sending', 1))
+        self.assertEqual(EmailOutbox.claim(10), [])
+
+    def test_backoff_doubles_and_is_capped(self):
+        self.assertEqual([EmailOutbox.backoff(attempt) for attempt in (1, 2, 3)], [30, 60, 120])
+        self.assertEqual(EmailOutbox.backoff(20), 3600)
+
+    def test_failed_delivery_is_retried_later(self):
+        EmailOutbox.enqueue('a@example.com', 'Hi', '<p>Hi</p>')
+        before = timezone.now()
+        self.assertEqual(EmailOutbox.deliver(FailingBackend(HTTPError(503)), EmailOutbox.claim(10)), 0)
+
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, 'pending')
+        self.assertGreaterEqual(email.next_attempt_at, before + timedelta(seconds=30))
+        self.assertIn('HTTP 503', email.last_error)
+
+    def test_gives_up_after_max_attempts_or_client_error(self):
+        retried = EmailOutbox.enqueue('a@example.com', 'Hi', '<p>Hi</p>')
+        OutboundEmail.objects.filter(id=retried.id).update(attempts=MAX_ATTEMPTS - 1)
+        rejected = EmailOutbox.enqueue('b@example.com', 'Hi', '<p>Hi</p>')
+        emails = EmailOutbox.claim(10)
+
+        EmailOutbox.deliver(FailingBackend(HTTPError(503)), emails[:1])
+        EmailOutbox.deliver(FailingBackend(HTTPError(400)), emails[1:])
+        self.assertEqual(OutboundEmail.objects.get(id=retried.id).status, 'failed')
+        self.assertEqual(OutboundEmail.objects.get(id=rejected.id).status, 'failed')
+
+    def test_requeue_stale(self):
+        EmailOutbox.enqueue('a@example.com', 'Hi', '<p>Hi</p>')
+        EmailOutbox.claim(10)
+        OutboundEmail.objects.update(started_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(EmailOutbox.requeue_stale(300), 1)
+        self.assertEqual(OutboundEmail.objects.get().status, 'pending')
+
+    def test_worker_command_drains_outbox(self):
+        for address in ('a@example.com', 'b@example.com'):
+            EmailOutbox.enqueue(address, 'Verify your email address', '<p>123456</p>')
+
+        out = StringIO()
+        call_command('send_emails', '--once', stdout=out)
+        self.assertEqual([email.to_email for email in StubBackend.sent], ['a@example.com', 'b@example.com'])
+        self.assertEqual(set(OutboundEmail.objects.values_list('status', flat=True)), {'sent'})
+        self.assertIn('Sent 2 of 2 email(s)', out.getvalue())
+
+    @patch('sendgrid.SendGridAPIClient')
+    def test_sendgrid_backend_reuses_one_client(self, mock_client_class):
+        backend = SendGridBackend()
+        for address in ('a@example.com', 'b@example.com'):
+            backend.send(OutboundEmail(to_email=address, subject='Hi', html_content='<p>Hi</p>', text_content='Hi'))
+        mock_client_class.assert_called_once()
+        self.assertEqual(mock_client_class.return_value.send.call_count, 2)
+
+    @patch('app.forms.auth_forms.ReCaptchaField.clean', return_value=True)
+    def test_password_reset_only_enqueues(self, mock_recaptcha):
+        User.objects.create_user(username='@resetme', email='reset@example.com', password='x', user_type='employee')
+        with patch('app.services.email_backends.StubBackend.send') as mock_send:
+            response = self.client.post(reverse('password_reset'), {'email': 'reset@example.com'})
+
+        self.assertRedirects(response, reverse('verify_reset_code'))
+        mock_send.assert_not_called()
+        email = OutboundEmail.objects.get()
+        self.assertEqual((email.to_email, email.status), ('reset@example.com', 'pending'))
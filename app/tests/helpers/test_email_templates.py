@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase
+from app.services.email_templates import CompiledEmailTemplate, EmailTemplates
+
+TEMPLATES = ['account/email_verification.html', 'account/password_reset_email.html']
+
+class EmailTemplatesTests(SimpleTestCase):
+    def setUp(self):
+        EmailTemplates.clear()
+
+    def test_html_matches_render_to_string(self):
+        user = SimpleNamespace(first_name="O'Brien & <Sons>")
+        for template in TEMPLATES:
+            html_content, _ = EmailTemplates.render(template, user, '012345', 'TappedIn')
+            expected = render_to_string(template, {'user': user, 'code': '012345', 'site_name': 'TappedIn'})
+            self.assertEqual(html_content, expected)
+
+    def test_plaintext_alternative(self):
+        user = SimpleNamespace(first_name="O'Brien & <Sons>")
+        _, text_content = EmailTemplates.render(TEMPLATES[0], user, '012345', 'TappedIn')
+        self.assertIn("Hello O'Brien & <Sons>,", text_content)
+        self.assertIn("\n012345\n", text_content)
+        self.assertIn("Thanks,\nThe TappedIn Team", text_content)
+        self.assertNotIn("<", text_content.replace("<Sons>", ""))
+        self.assertNotIn("font-family", text_content)
+
+    def test_each_template_compiled_once(self):
+        with patch('app.services.email_templates.render_to_string', wraps=render_to_string) as mock_render:
+            for code in ('111111', '222222', '333333'):
+                EmailTemplates.render(TEMPLATES[1], SimpleNamespace(first_name='Ann'), code, 'TappedIn')
+        mock_render.assert_called_once()
+
+    def test_to_text(self):
+        html_content = "<html><head><style>p {color: red}</style></head><body><h2>Hi</h2><p>A &amp; B<br>C</p></body></html>"
+        self.assertEqual(CompiledEmailTemplate.to_text(html_content), "Hi\n\nA & B\nC\n")
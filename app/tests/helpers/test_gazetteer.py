@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+from django.test import SimpleTestCase
+from app import helper
+from app.gazetteer import Gazetteer, load_gazetteers
+
+class GazetteerTests(SimpleTestCase):
+    def test_whole_words_only(self):
+        gazetteer = Gazetteer(["Go", "Java", "Art"])
+        self.assertEqual(gazetteer.find("java, go and golang; martial arts"), {"Java", "Go"})
+        self.assertEqual(gazetteer.find("google javascript"), set())
+
+    def test_multi_word_and_symbol_terms(self):
+        gazetteer = Gazetteer(["C++", "C#", "CI/CD", "Machine Learning"])
+        self.assertEqual(gazetteer.find("c++ and c# with ci/cd pipelines for machine learning"),
+                         {"C++", "C#", "CI/CD", "Machine Learning"})
+        self.assertEqual(gazetteer.find("c#sharp machinelearning"), set())
+
+    def test_nested_terms_at_the_same_position(self):
+        gazetteer = Gazetteer(["Data", "Data Science", "Science"])
+        self.assertEqual(gazetteer.find("data science"), {"Data", "Data Science", "Science"})
+        self.assertEqual(gazetteer.find("database"), set())
+
+    def test_substring_mode(self):
+        gazetteer = Gazetteer(["Cleaning", "Lao", "Laos"], whole_words=False)
+        self.assertEqual(gazetteer.find("dry-cleaning in laos"), {"Cleaning", "Lao", "Laos"})
+
+    def test_in_order_and_duplicates(self):
+        gazetteer = Gazetteer(["Hiking", "Travel", "Hiking", "Traveling"], whole_words=False)
+        self.assertEqual(gazetteer.terms, ["Hiking", "Travel", "Traveling"])
+        self.assertEqual(gazetteer.in_order("traveling and hiking"), ["Hiking", "Travel", "Traveling"])
+        self.assertEqual(gazetteer.in_order("nothing"), [])
+
+    def test_load_from_data_file(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump({"skills": ["Rust"], "languages": ["Lao"]}, f)
+        self.addCleanup(os.remove, f.name)
+        gazetteers = load_gazetteers(substring_lists={'languages'}, path=f.name)
+        self.assertEqual(gazetteers['skills'].find("rust, trusty"), {"Rust"})
+        self.assertEqual(gazetteers['languages'].find("laos"), {"Lao"})
+
+    def test_skills_now_include_multi_word_terms(self):
+        skills = helper.extract_skills("Experienced in Machine Learning and C++ with CI/CD")
+        self.assertIn("Machine Learning", skills)
+        self.assertIn("C++", skills)
+        self.assertIn("CI/CD", skills)
@@ -194,6 +194,25 @@ class JobMatcherTests(TestCase):
         self.assertEqual(len(matches), 1)
         self.assertEqual(matches[0]['employee'], self.employee2)
     
+    def test_only_jobs_sharing_a_skill_are_matched(self):
+        # Jobs sharing no skill with the employee are left out of the ranking, not listed with a low score
+        kubernetes_employee = Employee.objects.create(
+            user=User.objects.create_user(
+                username='@kubernetes',
+                email='kubernetes@example.com',
+                password='testpassword',
+                user_type='employee'
+            ),
+            skills='Kubernetes',
+            preferred_contract='PT'
+        )
+        matches = JobMatcher.match_employee_to_jobs(kubernetes_employee)
+        self.assertEqual([match['job'] for match in matches], [self.job2])
+
+        # So an employee without skills matches no job at all
+        kubernetes_employee.skills = ''
+        self.assertEqual(JobMatcher.match_employee_to_jobs(kubernetes_employee), [])
+
     def test_edge_cases(self):
         # Test with empty skills fields
         empty_skills_employee = Employee.objects.create(
@@ -207,10 +226,12 @@ class JobMatcherTests(TestCase):
             preferred_contract='FT'
         )
         
-        matches = JobMatcher.match_employee_to_jobs(empty_skills_employee)
-        # Should still return matches but with low scores
-        self.assertEqual(len(matches), 2)
-        self.assertLess(matches[0]['score'], 25.0)  # Low score expected
+        # Should still score every job, but with low scores
+        for job in (self.job1, self.job2):
+            score, _, _ = JobMatcher.calculate_match_score(
+                empty_skills_employee.skills, job.skills_needed, job.skills_wanted, 'FT', job.job_type
+            )
+            self.assertLess(score, 25.0)  # Low score expected
         
         # Test with job having no required skills
         no_skills_job = Job.objects.create(
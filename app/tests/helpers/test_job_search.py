@@ -0,0 +1,76 @@
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from app.models import User, Employee, Employer, Job
+from app.services.job_search import JobSearch, SQLiteJobSearch
+
+@skipUnless(connection.vendor == 'sqlite', 'FTS5 backend')
+class SQLiteJobSearchTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='@searcher', email='s@example.com', password='x', user_type='employer')
+        self.employer = Employer.objects.create(user=user, company_name='Acme')
+
+    def make_job(self, name, description='', department='IT', skills_needed='Python'):
+        return Job.objects.create(
+            name=name, description=description, department=department, skills_needed=skills_needed,
+            salary=50000, created_by=self.employer
+        )
+
+    def search(self, text):
+        return list(JobSearch.search(Job.objects.order_by('-created_at'), text))
+
+    def test_backend_for_sqlite(self):
+        self.assertIsInstance(JobSearch.backend(), SQLiteJobSearch)
+
+    def test_words_match_as_prefixes_and_name_ranks_first(self):
+        in_description = self.make_job('Backend Engineer', description='Work with the developer team')
+        in_name = self.make_job('Senior Developer')
+        self.make_job('Accountant', department='Finance', skills_needed='Excel')
+
+        self.assertEqual(self.search('develop'), [in_name, in_description])
+
+    def test_index_follows_save_and_delete(self):
+        job = self.make_job('Data Analyst')
+        self.assertEqual(self.search('analyst'), [job])
+
+        job.name = 'Data Scientist'
+        job.save()
+        self.assertEqual(self.search('scientist'), [job])
+        self.assertEqual(self.search('analyst'), [])
+
+        job.delete()
+        self.assertEqual(self.search('scientist'), [])
+
+    def test_mid_word_text_falls_back_to_substring_search(self):
+        job = self.make_job('Frontend Engineer', skills_needed='JavaScript, HTML')
+        self.assertEqual(self.search('script'), [job])
+
+    def test_empty_text_leaves_queryset_unchanged(self):
+        self.make_job('Tester')
+        self.assertEqual(len(self.search('   ')), 1)
+
+    def test_rebuild_indexes_bulk_created_jobs(self):
+        Job.objects.bulk_create([
+            Job(name='Bulk Plumber', description='', department='Ops', skills_needed='Pipes', salary=1, created_by=self.employer)
+        ])
+        backend = JobSearch.backend()
+        self.assertFalse(Job.objects.filter(id__in=backend.match_ids('plumber')).exists())
+        JobSearch.rebuild()
+        self.assertEqual([job.name for job in self.search('plumber')], ['Bulk Plumber'])
+
+    def test_dashboard_search_uses_index(self):
+        user = User.objects.create_user(username='@seeker', email='e@example.com', password='pw', user_type='employee')
+        Employee.objects.create(user=user, skills='Python')
+        job = self.make_job('Django Developer')
+        self.make_job('Chef', department='Kitchen', skills_needed='Cooking')
+
+        self.client.login(username='@seeker', password='pw')
+        response = self.client.get(reverse('employee_dashboard'), {'search': 'djang', 'tab': 'all'})
+        self.assertEqual(list(response.context['jobs']), [job])
+
+    def test_filter_columns_are_indexed(self):
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(cursor, Job._meta.db_table)
+        for name in ('job_country_idx', 'job_type_idx', 'job_salary_idx', 'job_created_id_idx'):
+            self.assertIn(name, indexes)
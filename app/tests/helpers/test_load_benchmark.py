@@ -0,0 +1,35 @@
+from django.test import TestCase
+from app.benchmarks import load
+from app.models import User, Job, JobApplication, JobSkill, ApplicationSkill
+
+class LoadBenchmarkTests(TestCase):
+    def setUp(self):
+        self.dataset = load.seed(employees=12, employers=2, jobs=15, applications=40, hot_applications=8)
+
+    def test_seed_builds_indexed_dataset(self):
+        self.assertEqual(User.objects.count(), 15)
+        self.assertEqual(len(set(User.objects.values_list('password', flat=True))), 1)
+        self.assertEqual(JobApplication.objects.filter(job=self.dataset.hot_job).count(), 8)
+        self.assertFalse(JobApplication.objects.filter(applicant=self.dataset.employee).exists())
+        self.assertEqual(JobSkill.objects.values('job').distinct().count(), Job.objects.count())
+        self.assertFalse(JobApplication.objects.filter(score__isnull=True).exists())
+        self.assertEqual(ApplicationSkill.objects.values('application').distinct().count(), JobApplication.objects.count())
+
+    def test_every_scenario_succeeds(self):
+        results = load.run(self.dataset, requests=2, warmup=1)
+
+        self.assertEqual(list(results), [scenario.name for scenario in load.SCENARIOS])
+        for name, summary in results.items():
+            self.assertEqual(summary['errors'], 0, name)
+            self.assertEqual(summary['requests'], 2)
+            self.assertLessEqual(summary['p50_ms'], summary['p99_ms'])
+            self.assertGreater(summary['queries_per_request'], 0)
+
+    def test_summarize_and_compare(self):
+        summary = load.summarize([0.01] * 98 + [0.1, 0.2], [3] * 100)
+        self.assertAlmostEqual(summary['p50_ms'], 10.0)
+        self.assertGreater(summary['p99_ms'], 100.0)
+        self.assertEqual(summary['queries_per_request'], 3)
+
+        slower = dict(summary, p50_ms=15.0)
+        self.assertIn('p50 10.0 -> 15.0 ms (+50%)', load.compare({'home': summary}, {'home': slower})[0])
@@ -0,0 +1,101 @@
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from app.services.match_cache import MatchCache
+from app.models import User, Employee, Employer, Job, MatchCacheVersion
+
+class MatchCacheTests(TestCase):
+    def setUp(self):
+        MatchCache.clear()
+        employer_user = User.objects.create_user(
+            username='@employer',
+            email='employer@example.com',
+            password='testpassword',
+            user_type='employer'
+        )
+        self.employer = Employer.objects.create(user=employer_user, company_name='Test Company')
+
+        employee_user = User.objects.create_user(
+            username='@employee',
+            email='employee@example.com',
+            password='testpassword',
+            user_type='employee'
+        )
+        self.employee = Employee.objects.create(user=employee_user, skills='Python, Docker', preferred_contract='FT')
+        self.job = self._create_job('Python Developer', 'Python, Django')
+        self.filters = {'search': '', 'tab': 'suitable'}
+
+    def _create_job(self, name, skills_needed):
+        return Job.objects.create(
+            name=name,
+            department='Engineering',
+            description='Description',
+            salary=50000,
+            created_by=self.employer,
+            skills_needed=skills_needed,
+            job_type='FT'
+        )
+
+    def _matches(self, filters=None):
+        return MatchCache.job_matches(self.employee, Job.objects.order_by('-created_at'), filters or self.filters)
+
+    def test_repeat_lookup_is_a_cache_hit(self):
+        matches = self._matches()
+        first_page = matches[:10]
+        # Each lookup only reads the invalidation versions
+        with self.assertNumQueries(2):
+            self.assertIs(self._matches(), matches)
+            self.assertEqual(self._matches()[:10], first_page)
+
+    def test_filters_are_part_of_the_key(self):
+        self.assertIsNot(self._matches(), self._matches({'search': 'python', 'tab': 'suitable'}))
+
+    def test_job_changes_invalidate(self):
+        matches = self._matches()
+        self._create_job('Docker Engineer', 'Docker')
+        refreshed = self._matches()
+        self.assertIsNot(refreshed, matches)
+        self.assertEqual(len(refreshed), 2)
+
+        self.job.delete()
+        self.assertEqual(len(self._matches()), 1)
+
+    def test_employee_skill_changes_invalidate(self):
+        matches = self._matches()
+        self.employee.skills = 'Go'
+        self.employee.save()
+        self.assertIsNot(self._matches(), matches)
+
+    def test_invalidation_by_another_process_is_seen(self):
+        matches = self._matches()
+        # What MatchCache.invalidate_* run in another process leaves behind; this process's entries are untouched
+        MatchCacheVersion.objects.update_or_create(scope=MatchCache.employee_scope(self.employee.pk), defaults={'version': 7})
+        self.assertIsNot(self._matches(), matches)
+
+        matches = self._matches()
+        MatchCacheVersion.objects.filter(scope='catalog').update(version=100)
+        self.assertIsNot(self._matches(), matches)
+
+    def test_unrelated_employee_save_keeps_entry(self):
+        matches = self._matches()
+        self.employee.interests = 'Hiking'
+        self.employee.save()
+        self.assertIs(self._matches(), matches)
+
+    @override_settings(MATCH_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_is_evicted(self):
+        first = self._matches({'search': 'a'})
+        second = self._matches({'search': 'b'})
+        self.assertIs(self._matches({'search': 'a'}), first)
+        self._matches({'search': 'c'})
+
+        self.assertIs(self._matches({'search': 'a'}), first)
+        self.assertIsNot(self._matches({'search': 'b'}), second)
+
+    @override_settings(MATCH_CACHE_TTL=60)
+    def test_entries_expire(self):
+        with patch('app.services.match_cache.time.monotonic', return_value=1000):
+            matches = self._matches()
+        with patch('app.services.match_cache.time.monotonic', return_value=1059):
+            self.assertIs(self._matches(), matches)
+        with patch('app.services.match_cache.time.monotonic', return_value=1061):
+            self.assertIsNot(self._matches(), matches)
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+from django.core.paginator import Paginator
+from django.test import TestCase
+from app.services.job_matcher import JobMatcher
+from app.services.match_ranking import RankedMatches, RankedJobMatches, RankedEmployeeMatches
+from app.models import User, Employee, Employer, Job
+
+class MatchRankingTests(TestCase):
+    JOB_SKILLS = [
+        ('Python, Django', 'React, AWS', 'FT'),
+        ('Docker, Kubernetes, AWS', 'Python, CI/CD', 'PT'),
+        ('JavaScript', '', 'FT'),
+        ('Python', '', 'PT'),
+        ('Python, Go, Rust', 'Docker', 'FT'),
+        ('Negotiation, CRM', 'Salesforce', 'FT'),
+        ('Django, PostgreSQL', 'Python', 'FT'),
+        ('Senior Python Developer', 'JS', 'PT'),
+        ('Python, Django', 'React, AWS', 'FT'),
+        ('Machine Learning, Python', 'SQL', 'PT'),
+        ('', 'Python', 'FT'),
+        ('Node.js, JS', '', 'FT'),
+    ]
+
+    def setUp(self):
+        employer_user = User.objects.create_user(
+            username='@employer',
+            email='employer@example.com',
+            password='testpassword',
+            user_type='employer'
+        )
+        self.employer = Employer.objects.create(user=employer_user, company_name='Test Company')
+
+        self.employees = []
+        for i, skills in enumerate(['Python, JS, Docker, AWS', 'Django', 'Go; Rust', '', 'ML, python, react']):
+            user = User.objects.create_user(
+                username=f'@employee{i}',
+                email=f'employee{i}@example.com',
+                password='testpassword',
+                user_type='employee'
+            )
+            self.employees.append(Employee.objects.create(user=user, skills=skills, preferred_contract=['FT', 'PT'][i % 2]))
+
+        for i, (needed, wanted, job_type) in enumerate(self.JOB_SKILLS):
+            Job.objects.create(
+                name=f'Job {i}',
+                department='Engineering',
+                description='Description',
+                salary=50000,
+                created_by=self.employer,
+                skills_needed=needed,
+                skills_wanted=wanted,
+                job_type=job_type
+            )
+
+    def _summary(self, matches, key):
+        return [(match[key].pk, match['score'], match['matching_skills'], match['missing_skills']) for match in matches]
+
+    def test_lazy_job_ranking_equals_eager_ranking(self):
+        jobs = Job.objects.order_by('-created_at', '-id')
+        for employee in self.employees:
+            eager = self._summary(JobMatcher.match_employee_to_jobs(employee, jobs), 'job')
+            ranked = JobMatcher.match_employee_to_jobs(employee, jobs, lazy=True)
+
+            self.assertIsInstance(ranked, RankedJobMatches)
+            self.assertEqual(len(ranked), len(eager))
+            for k in (1, 2, 3, 5, len(eager)):
+                fresh = JobMatcher.match_employee_to_jobs(employee, jobs, lazy=True)
+                self.assertEqual(self._summary(fresh[:k], 'job'), eager[:k])
+            self.assertEqual(self._summary(ranked, 'job'), eager)
+
+    def test_job_ranking_stops_early(self):
+        employee = self.employees[0]
+        ranked = JobMatcher.match_employee_to_jobs(employee, Job.objects.all(), lazy=True)
+        with patch.object(RankedJobMatches, '_score', autospec=True, side_effect=RankedJobMatches._score) as score:
+            top = ranked[:1]
+        self.assertEqual(len(top), 1)
+        self.assertLess(score.call_count, len(ranked))
+
+    def test_paginator_pages_lazily(self):
+        employee = self.employees[0]
+        jobs = Job.objects.order_by('-created_at', '-id')
+        eager = self._summary(JobMatcher.match_employee_to_jobs(employee, jobs), 'job')
+
+        paginator = Paginator(JobMatcher.match_employee_to_jobs(employee, jobs, lazy=True), 3)
+        self.assertEqual(paginator.count, len(eager))
+        pages = []
+        for number in paginator.page_range:
+            pages += self._summary(paginator.page(number), 'job')
+        self.assertEqual(pages, eager)
+
+    def test_lazy_employee_ranking_equals_eager_ranking(self):
+        for job in Job.objects.all():
+            eager = self._summary(JobMatcher.match_job_to_employees(job, Employee.objects.all()), 'employee')
+            for k in (1, 2, 4, len(eager)):
+                ranked = JobMatcher.match_job_to_employees(job, Employee.objects.all(), lazy=True)
+                self.assertIsInstance(ranked, RankedEmployeeMatches)
+                self.assertEqual(self._summary(ranked[:k], 'employee'), eager[:k])
+
+    def test_indexing(self):
+        ranked = JobMatcher.match_employee_to_jobs(self.employees[0], Job.objects.all(), lazy=True)
+        self.assertEqual(ranked[-1], list(ranked)[-1])
+        self.assertEqual(ranked[:0], [])
+        with self.assertRaises(IndexError):
+            ranked[len(ranked)]
+        self.assertFalse(JobMatcher.match_employee_to_jobs(self.employees[3], Job.objects.all(), lazy=True))
+
+    def test_incomplete_subclass_cannot_be_created(self):
+        class CountOnly(RankedMatches):
+            def count(self):
+                return 0
+
+        with self.assertRaises(TypeError):
+            CountOnly()
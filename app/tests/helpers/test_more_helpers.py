@@ -25,29 +25,35 @@ class MoreHelperTests(TestCase):
         Reading, Hiking, Photography
         """
     
-    @patch('app.helper.pdfplumber.open')
+    @patch('app.helper.fitz.open')
     def test_extract_text_from_pdf(self, mock_open):
         """Test PDF text extraction"""
         
         mock_pdf = MagicMock()
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf.needs_pass = False
         mock_page = MagicMock()
-        mock_page.extract_text.return_value = "Sample text from PDF"
-        mock_pdf.pages = [mock_page]
-        mock_open.return_value.__enter__.return_value = mock_pdf
+        mock_page.get_text.return_value = "Sample text from PDF\n"
+        mock_open.return_value = mock_pdf
+
+        def use_pages(pages):
+            mock_pdf.__len__.return_value = len(pages)
+            mock_pdf.__getitem__.side_effect = pages.__getitem__
         
+        use_pages([mock_page])
         result = extract_text_from_pdf("dummy.pdf")
         self.assertEqual(result, "Sample text from PDF")
         
         mock_page2 = MagicMock()
-        mock_page2.extract_text.return_value = "More text"
-        mock_pdf.pages = [mock_page, mock_page2]
+        mock_page2.get_text.return_value = "More text"
+        use_pages([mock_page, mock_page2])
         
         result = extract_text_from_pdf("dummy.pdf")
         self.assertEqual(result, "Sample text from PDF\nMore text")
         
         mock_page3 = MagicMock()
-        mock_page3.extract_text.return_value = None
-        mock_pdf.pages = [mock_page, mock_page3, mock_page2]
+        mock_page3.get_text.return_value = ""
+        use_pages([mock_page, mock_page3, mock_page2])
         
         result = extract_text_from_pdf("dummy.pdf")
         self.assertEqual(result, "Sample text from PDF\nMore text")
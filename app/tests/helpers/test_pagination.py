@@ -0,0 +1,131 @@
+from datetime import timedelta
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from app.models import User, Admin, Employee, Employer, Job
+from app.services.job_search import JobSearch
+from app.services.pagination import KeysetPaginator, approximate_count
+
+class KeysetPaginatorTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='@pager', email='p@example.com', password='x', user_type='employer')
+        self.employer = Employer.objects.create(user=user, company_name='Acme')
+        now = timezone.now()
+        jobs = [
+            Job.objects.create(name=f'Job {i}', description='', department='IT', skills_needed='Python', salary=i,
+                               created_by=self.employer)
+            for i in range(23)
+        ]
+        # Several jobs share a timestamp, so the id tiebreaker decides their order.
+        for i, job in enumerate(jobs):
+            Job.objects.filter(pk=job.pk).update(created_at=now - timedelta(minutes=i // 3))
+        self.expected = list(Job.objects.order_by('-created_at', '-pk'))
+
+    def paginator(self, per_page=5):
+        return KeysetPaginator(Job.objects.order_by('-created_at'), per_page)
+
+    def test_walks_forward_and_back_through_every_row(self):
+        paginator = self.paginator()
+        pages = [paginator.get_page()]
+        while pages[-1].has_next():
+            pages.append(paginator.get_page(pages[-1].next_cursor))
+
+        self.assertEqual([job for page in pages for job in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [5, 5, 5, 5, 3])
+        self.assertFalse(pages[0].has_previous())
+
+        back = paginator.get_page(pages[3].previous_cursor)
+        self.assertEqual(list(back), list(pages[2]))
+        self.assertTrue(back.has_next() and back.has_previous())
+
+    def test_last_cursor_ends_at_the_last_row(self):
+        last = self.paginator().get_page(self.paginator().last_cursor)
+        self.assertEqual(list(last), self.expected[-5:])
+        self.assertFalse(last.has_next())
+        self.assertTrue(last.has_previous())
+
+    def test_invalid_or_foreign_cursor_gives_first_page(self):
+        cursor = self.paginator().get_page().next_cursor
+        by_salary = KeysetPaginator(Job.objects.order_by('salary'), 5)
+
+        self.assertEqual(list(self.paginator().get_page(cursor[:-2] + 'xx')), self.expected[:5])
+        self.assertEqual([job.salary for job in by_salary.get_page(cursor)], [0, 1, 2, 3, 4])
+
+    def test_deep_page_is_a_seek_without_offset_or_count(self):
+        paginator = self.paginator()
+        page = paginator.get_page(paginator.get_page().next_cursor)
+        page = paginator.get_page(page.next_cursor)
+
+        with CaptureQueriesContext(connection) as queries:
+            list(paginator.get_page(page.next_cursor))
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]['sql'].upper()
+        self.assertNotIn('OFFSET', sql)
+        self.assertNotIn('COUNT(', sql)
+
+    def test_pages_through_ranked_search_results(self):
+        Job.objects.filter(salary__lt=8).update(name='Python Developer')
+        Job.objects.filter(salary__lt=8).update(description='python')
+        JobSearch.rebuild()
+        paginator = KeysetPaginator(JobSearch.search(Job.objects.order_by('-created_at'), 'python'), 3)
+
+        first = paginator.get_page()
+        seen = list(first)
+        page = first
+        while page.has_next():
+            page = paginator.get_page(page.next_cursor)
+            seen.extend(page)
+
+        self.assertEqual(len(seen), 23)
+        self.assertEqual(len(set(seen)), 23)
+        self.assertEqual({job.salary for job in seen[:8]}, set(range(8)))
+
+    @override_settings(PAGINATION_COUNT_LIMIT=10)
+    def test_approximate_count_is_capped(self):
+        self.assertEqual(approximate_count(Job.objects.all()), (10, True))
+        self.assertEqual(approximate_count(Job.objects.filter(salary__lt=4)), (4, False))
+
+
+class KeysetPaginationViewTests(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user(username='@boss', email='b@example.com', password='pw', user_type='employer')
+        employer = Employer.objects.create(user=employer_user, company_name='Acme')
+        for i in range(12):
+            Job.objects.create(name=f'Role {i}', description='', department='IT', skills_needed='Python', salary=i,
+                               created_by=employer)
+
+    def test_dashboard_next_cursor(self):
+        user = User.objects.create_user(username='@seeker', email='s@example.com', password='pw', user_type='employee')
+        Employee.objects.create(user=user, skills='Python')
+        self.client.login(username='@seeker', password='pw')
+
+        first = self.client.get(reverse('employee_dashboard'), {'tab': 'all'}).context['jobs']
+        self.assertContains(self.client.get(reverse('employee_dashboard'), {'tab': 'all'}), 'About 12 jobs')
+        second = self.client.get(reverse('employee_dashboard'), {'tab': 'all', 'cursor': first.next_cursor}).context['jobs']
+
+        self.assertEqual(len(first), 10)
+        self.assertEqual(len(second), 2)
+        self.assertFalse(set(first) & set(second))
+
+    def test_list_users_pages_in_chosen_order(self):
+        admin_user = User.objects.create_user(username='@root', email='r@example.com', password='pw', user_type='admin')
+        Admin.objects.create(user=admin_user)
+        for i in range(30):
+            User.objects.create_user(username=f'@user{i:02}', email=f'u{i}@example.com', password='x', user_type='employee')
+        self.client.login(username='@root', password='pw')
+
+        first = self.client.get(reverse('list_users'), {'order_by': '-username'}).context['users_page']
+        second = self.client.get(reverse('list_users'), {'order_by': '-username', 'cursor': first.next_cursor}).context['users_page']
+
+        usernames = [user.username for user in list(first) + list(second)]
+        self.assertEqual(usernames, sorted(User.objects.values_list('username', flat=True), reverse=True))
+
+    def test_list_users_ignores_unknown_ordering(self):
+        admin_user = User.objects.create_user(username='@root', email='r@example.com', password='pw', user_type='admin')
+        Admin.objects.create(user=admin_user)
+        self.client.login(username='@root', password='pw')
+
+        response = self.client.get(reverse('list_users'), {'order_by': 'password'})
+        self.assertEqual(response.context['order_by'], 'username')
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase
+from app.models import Admin, Employee, Employer, User, Job, JobApplication, JobSkill, EmployeeSkill, ApplicationSkill
+from app.services.job_search import JobSearch
+from app.services.match_cache import MatchCache
+
+class SeedCommandTests(TestCase):
+    def seed(self, **options):
+        call_command('seed', stdout=StringIO(), **options)
+
+    def test_seeds_requested_sizes_with_one_password_hash(self):
+        self.seed(users=30, jobs=25, applications=60, batch_size=7)
+
+        self.assertEqual(Admin.objects.count() + Employee.objects.count() + Employer.objects.count(), 30)
+        self.assertEqual(Job.objects.count(), 25)
+        self.assertEqual(JobApplication.objects.count(), 60)
+        self.assertEqual(len(set(User.objects.values_list('password', flat=True))), 1)
+        self.assertTrue(User.objects.get(username='@admin').check_password('Password123'))
+        self.assertTrue(User.objects.get(username='@admin').is_superuser)
+        self.assertTrue(JobApplication.objects.filter(job__created_by__user__username='@employer',
+                                                      applicant__user__username='@employee').exists())
+
+    def test_bulk_rows_are_indexed_and_scored(self):
+        self.seed(users=20, jobs=10, applications=30)
+
+        self.assertEqual(JobSkill.objects.values('job').distinct().count(), Job.objects.count())
+        self.assertEqual(EmployeeSkill.objects.values('employee').distinct().count(), Employee.objects.count())
+        self.assertEqual(ApplicationSkill.objects.values('application').distinct().count(),
+                         JobApplication.objects.exclude(skills='').count())
+        self.assertFalse(JobApplication.objects.filter(score__isnull=True).exists())
+        self.assertIn(Job.objects.get(name='Senior Developer'), JobSearch.search(Job.objects.all(), 'Senior Developer'))
+
+    def test_rerunning_tops_up_without_duplicates(self):
+        self.seed(users=15, jobs=8, applications=20)
+        self.seed(users=25, jobs=12, applications=40)
+
+        self.assertEqual(User.objects.count(), 25)
+        self.assertEqual(Job.objects.count(), 12)
+        self.assertEqual(JobApplication.objects.count(), 40)
+        self.assertEqual(Job.objects.filter(name='Software Developer').count(), 1)
+
+    def test_applications_are_capped_by_possible_pairs(self):
+        self.seed(users=5, jobs=3, applications=1000)
+        self.assertEqual(JobApplication.objects.count(), Job.objects.count() * Employee.objects.count())
+
+    def test_invalidates_other_processes_match_cache(self):
+        self.seed(users=5, jobs=3, applications=0)
+        employee = Employee._base_manager.get(user__username='@employee')
+        MatchCache.clear()
+        matches = MatchCache.job_matches(employee, Job.objects.all(), {})
+
+        # seed runs in its own process, with its own empty cache
+        with patch.object(MatchCache, '_entries', OrderedDict()):
+            self.seed(users=5, jobs=6, applications=0)
+
+        self.assertIsNot(MatchCache.job_matches(employee, Job.objects.all(), {}), matches)
@@ -0,0 +1,125 @@
+from django.test import TestCase
+from app.services.job_matcher import JobMatcher
+from app.services.skill_index import SkillIndex
+from app.models import User, Employee, Employer, Job, JobApplication, JobSkill, EmployeeSkill, ApplicationSkill
+
+class SkillIndexTests(TestCase):
+    def setUp(self):
+        employer_user = User.objects.create_user(
+            username='@employer',
+            email='employer@example.com',
+            password='testpassword',
+            user_type='employer'
+        )
+        self.employer = Employer.objects.create(user=employer_user, company_name='Test Company')
+
+        employee_user = User.objects.create_user(
+            username='@employee',
+            email='employee@example.com',
+            password='testpassword',
+            user_type='employee'
+        )
+        self.employee = Employee.objects.create(
+            user=employee_user,
+            skills='Python, JS',
+            preferred_contract='FT'
+        )
+
+        self.python_job = self._create_job('Python Developer', 'Python, Django', 'Docker')
+        self.js_job = self._create_job('Frontend Developer', 'JavaScript', '')
+        self.sales_job = self._create_job('Sales Executive', 'Negotiation, CRM', 'Salesforce')
+
+    def _create_job(self, name, skills_needed, skills_wanted):
+        return Job.objects.create(
+            name=name,
+            department='Engineering',
+            description='Description',
+            salary=50000,
+            created_by=self.employer,
+            skills_needed=skills_needed,
+            skills_wanted=skills_wanted,
+            job_type='FT'
+        )
+
+    def _job_rows(self, job):
+        return list(JobSkill.objects.filter(job=job).order_by('kind', 'position').values_list('kind', 'skill__name'))
+
+    def test_job_save_creates_required_and_preferred_rows(self):
+        self.assertEqual(self._job_rows(self.python_job), [
+            ('preferred', 'docker'), ('required', 'python'), ('required', 'django')
+        ])
+
+    def test_job_update_replaces_stale_rows(self):
+        self.python_job.skills_needed = 'Go'
+        self.python_job.skills_wanted = 'Docker, Kubernetes'
+        self.python_job.save()
+        self.assertEqual(self._job_rows(self.python_job), [
+            ('preferred', 'docker'), ('preferred', 'kubernetes'), ('required', 'go')
+        ])
+
+    def test_sync_jobs_indexes_bulk_created_jobs(self):
+        bulk_job, = Job.objects.bulk_create([Job(
+            name='Bulk', department='Ops', description='', salary=1, created_by=self.employer,
+            skills_needed='Go, SQL', skills_wanted='Docker'
+        )])
+        self.python_job.skills_needed = 'Rust'
+
+        SkillIndex.sync_jobs([bulk_job, self.python_job])
+        self.assertEqual(self._job_rows(bulk_job), [('preferred', 'docker'), ('required', 'go'), ('required', 'sql')])
+        self.assertEqual(self._job_rows(self.python_job), [('preferred', 'docker'), ('required', 'rust')])
+
+    def test_job_delete_removes_rows(self):
+        job_id = self.sales_job.id
+        self.sales_job.delete()
+        self.assertFalse(JobSkill.objects.filter(job_id=job_id).exists())
+
+    def test_skills_are_shared_between_owners(self):
+        self.assertEqual(
+            JobSkill.objects.get(job=self.python_job, skill__name='python').skill_id,
+            EmployeeSkill.objects.get(employee=self.employee, skill__name='python').skill_id
+        )
+
+    def test_employee_and_application_rows_follow_text(self):
+        self.employee.skills = 'Go; Rust'
+        self.employee.save()
+        self.assertEqual(
+            list(EmployeeSkill.objects.filter(employee=self.employee).values_list('skill__name', flat=True)),
+            ['go', 'rust']
+        )
+
+        application = JobApplication.objects.create(job=self.python_job, applicant=self.employee, skills='Python, SQL')
+        self.assertEqual(
+            list(ApplicationSkill.objects.filter(application=application).values_list('skill__name', flat=True)),
+            ['python', 'sql']
+        )
+
+    def test_prefetched_skill_lists_match_parsed_text(self):
+        job = Job.objects.prefetch_related(JobMatcher.job_skills_prefetch()).get(pk=self.python_job.pk)
+        with self.assertNumQueries(0):
+            lists = JobMatcher._job_skill_lists(job)
+        self.assertEqual(lists, (['python', 'django'], ['docker']))
+
+    def test_candidate_job_ids_include_aliases_and_exclude_unrelated_jobs(self):
+        candidates = set(SkillIndex.candidate_job_ids(self.employee.skills))
+        self.assertEqual(candidates, {self.python_job.id, self.js_job.id})
+
+    def test_candidate_job_ids_empty_for_employee_without_skills(self):
+        self.assertEqual(list(SkillIndex.candidate_job_ids('')), [])
+
+    def test_match_employee_to_jobs_only_scores_candidates(self):
+        matches = JobMatcher.match_employee_to_jobs(self.employee)
+        self.assertEqual({match['job'] for match in matches}, {self.python_job, self.js_job})
+
+        filtered = Job.objects.filter(name='Frontend Developer')
+        matches = JobMatcher.match_employee_to_jobs(self.employee, filtered)
+        self.assertEqual([match['job'] for match in matches], [self.js_job])
+
+    def test_match_scores_unchanged_for_candidates(self):
+        matches = JobMatcher.match_employee_to_jobs(self.employee)
+        for match in matches:
+            job = match['job']
+            expected = JobMatcher.calculate_match_score(
+                self.employee.skills, job.skills_needed, job.skills_wanted,
+                self.employee.preferred_contract, job.job_type
+            )
+            self.assertEqual(match['score'], expected[0])
@@ -0,0 +1,67 @@
+from django.test import SimpleTestCase
+from app.benchmarks.skill_matching import legacy_skill_matches, legacy_match_score, generate_pairs
+from app.services.job_matcher import JobMatcher
+from app.services.skill_normalizer import (
+    SKILL_VARIATIONS, SkillAutomaton, SkillProfile, canonical_id
+)
+
+class SkillAutomatonTests(SimpleTestCase):
+    def test_finds_any_pattern(self):
+        automaton = SkillAutomaton(['he', 'she', 'his', 'hers'])
+        self.assertTrue(automaton.search('ushers'))
+        self.assertTrue(automaton.search('ahis'))
+        self.assertFalse(automaton.search('hxe'))
+
+    def test_follows_failure_links(self):
+        automaton = SkillAutomaton(['python programming', 'programming'])
+        self.assertTrue(automaton.search('advanced programming'))
+        self.assertFalse(automaton.search('python program'))
+
+    def test_empty_automaton_matches_nothing(self):
+        self.assertFalse(SkillAutomaton([]).search('anything'))
+
+
+class SkillNormalizerTests(SimpleTestCase):
+    def test_canonical_id_maps_names_and_aliases(self):
+        self.assertEqual(canonical_id('javascript'), canonical_id('js'))
+        self.assertEqual(canonical_id('react'), canonical_id('react.js'))
+        self.assertIsNone(canonical_id('cobol'))
+
+    def test_alias_rules_match_legacy(self):
+        vocabulary = list(SKILL_VARIATIONS)
+        for aliases in SKILL_VARIATIONS.values():
+            vocabulary.extend(aliases)
+
+        for job_skill in vocabulary + [skill.upper() for skill in vocabulary]:
+            for employee_skill in vocabulary:
+                self.assertEqual(
+                    SkillProfile([employee_skill]).matches(job_skill),
+                    legacy_skill_matches(job_skill, [employee_skill]),
+                    (job_skill, employee_skill)
+                )
+
+    def test_substring_rules_match_legacy(self):
+        cases = [
+            ('python programming', ['python']),
+            ('java', ['javascript']),
+            ('sql', ['mysql']),
+            ('excel', ['excel']),
+            ('git', ['github']),
+            ('data', ['big data', 'data visualization']),
+        ]
+        for job_skill, employee_skills in cases:
+            self.assertEqual(
+                JobMatcher._skill_matches(job_skill, employee_skills),
+                legacy_skill_matches(job_skill, employee_skills),
+                job_skill
+            )
+
+    def test_automaton_used_for_large_profiles(self):
+        employee_skills = [f'skill number {i}' for i in range(40)]
+        profile = SkillProfile(employee_skills)
+        self.assertTrue(profile.matches('advanced skill number 7 usage'))
+        self.assertFalse(profile.matches('cooking'))
+
+    def test_scores_identical_to_legacy(self):
+        for pair in generate_pairs(500):
+            self.assertEqual(JobMatcher.calculate_match_score(*pair), legacy_match_score(*pair), pair)
@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock, patch
+from django.test import SimpleTestCase
+from app import helper
+from app.helper import NAME_SEARCH_CHARS, SpacyPipeline, extract_name
+
+class SpacyPipelineTests(SimpleTestCase):
+    @patch('spacy.load')
+    def test_loads_once_on_first_call(self, mock_load):
+        pipeline = SpacyPipeline("en_core_web_sm", exclude=["parser", "lemmatizer"])
+        self.assertFalse(pipeline.loaded)
+        mock_load.assert_not_called()
+
+        pipeline("first")
+        pipeline("second")
+        mock_load.assert_called_once_with("en_core_web_sm", exclude=["parser", "lemmatizer"])
+        self.assertTrue(pipeline.loaded)
+        self.assertEqual(mock_load.return_value.call_count, 2)
+
+    def test_module_pipeline_excludes_unused_components(self):
+        self.assertEqual(helper.nlp.model, "en_core_web_sm")
+        self.assertTrue({"parser", "lemmatizer", "attribute_ruler"} <= set(helper.nlp.exclude))
+
+    @patch('app.helper.nlp')
+    def test_extract_name_only_reads_the_top_of_the_cv(self, mock_nlp):
+        mock_nlp.return_value = MagicMock(ents=[])
+        extract_name("Jane Doe\n" + "x" * 5000)
+        (text,), _ = mock_nlp.call_args
+        self.assertEqual(len(text), NAME_SEARCH_CHARS)
+        self.assertTrue(text.startswith("Jane Doe\n"))
@@ -0,0 +1,55 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import skipUnless
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from app.models import User, VerificationCode
+from app.services.verification_codes import VerificationCodePurge
+
+class VerificationCodePurgeTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='@coder', email='coder@example.com', password='x')
+        VerificationCodePurge._last_run = None
+
+    def make_code(self, age_minutes=0, is_used=False):
+        code = VerificationCode.objects.create(user=self.user, code='123456', code_type='password_reset', is_used=is_used)
+        VerificationCode.objects.filter(id=code.id).update(created_at=timezone.now() - timedelta(minutes=age_minutes))
+        return code
+
+    def test_purge_deletes_used_and_expired_in_batches(self):
+        live = self.make_code()
+        for _ in range(5):
+            self.make_code(age_minutes=20)
+        self.make_code(is_used=True)
+
+        self.assertEqual(VerificationCodePurge.purge(batch_size=2), 6)
+        self.assertEqual(list(VerificationCode.objects.values_list('id', flat=True)), [live.id])
+
+    def test_command(self):
+        self.make_code(age_minutes=60)
+        out = StringIO()
+        call_command('purge_verification_codes', '--batch-size', '10', stdout=out)
+        self.assertIn('Deleted 1 verification code(s)', out.getvalue())
+        self.assertFalse(VerificationCode.objects.exists())
+
+    @override_settings(VERIFICATION_CODE_PURGE_INTERVAL=3600)
+    def test_periodic_purge_runs_once_per_interval(self):
+        self.make_code(age_minutes=60)
+        self.assertEqual(VerificationCodePurge.maybe_purge(), 1)
+        self.make_code(age_minutes=60)
+        self.assertEqual(VerificationCodePurge.maybe_purge(), 0)
+
+    @override_settings(VERIFICATION_CODE_PURGE_INTERVAL=None)
+    def test_periodic_purge_can_be_disabled(self):
+        self.make_code(age_minutes=60)
+        self.assertEqual(VerificationCodePurge.maybe_purge(), 0)
+        self.assertEqual(VerificationCode.objects.count(), 1)
+
+    @skipUnless(connection.vendor == 'sqlite', "other planners may prefer a scan on a tiny table")
+    def test_lookup_uses_the_composite_index(self):
+        plan = VerificationCode.objects.filter(
+            user=self.user, code_type='password_reset', code='123456', is_used=False
+        ).order_by('-created_at')[:1].explain()
+        self.assertIn('verification_lookup_idx', plan)
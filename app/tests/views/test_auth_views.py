@@ -1,6 +1,6 @@
 from django.test import TestCase, Client
 from django.urls import reverse
-from app.models import User, VerificationCode
+from app.models import User, VerificationCode, OutboundEmail
 from unittest.mock import patch
 
 class PasswordResetTests(TestCase):
@@ -40,7 +40,9 @@ class PasswordResetTests(TestCase):
         })
         
         self.assertEqual(response.status_code, 302)
-        self.assertTemplateUsed(response, 'account/password_reset_email.html')
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.subject, 'Password Reset Verification Code')
+        self.assertIn('Password Reset', email.html_content)
         
     def test_verify_reset_code_page(self):
         """Test that verify reset code page loads when session data exists"""
@@ -0,0 +1,58 @@
+import fitz
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from app.models import CVParseJob
+
+def pdf_bytes(pages=1, text="Jane Doe", password=None):
+    document = fitz.open()
+    for _ in range(pages):
+        document.new_page().insert_text((72, 72), text)
+    if password:
+        return document.tobytes(encryption=fitz.PDF_ENCRYPT_AES_256, user_pw=password, owner_pw=password)
+    return document.tobytes()
+
+class CVUploadTests(TestCase):
+    def setUp(self):
+        self.url = reverse('employee_signup_2')
+
+    def upload(self, content, name='cv.pdf', **kwargs):
+        return self.client.post(self.url, {'cv': SimpleUploadedFile(name, content, content_type='application/pdf')}, **kwargs)
+
+    def assertRejected(self, response, message):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['step'], 2)
+        self.assertIn(message, [str(m) for m in response.context['messages']])
+        self.assertFalse(CVParseJob.objects.exists())
+        self.assertNotIn('cv_filename', self.client.session)
+
+    def test_accepts_pdf(self):
+        response = self.upload(pdf_bytes())
+        self.assertRedirects(response, reverse('employee_signup_3'), fetch_redirect_response=False)
+        self.assertTrue(CVParseJob.objects.exists())
+
+    def test_rejects_non_pdf_from_first_chunk(self):
+        self.assertRejected(self.upload(b'MZ not a pdf at all'), "The file is not a PDF.")
+
+    @override_settings(CV_UPLOAD_MAX_BYTES=1024)
+    def test_rejects_oversized_file_while_streaming(self):
+        self.assertRejected(self.upload(b'%PDF-1.4\n' + b'0' * 4096), "The file is larger than 1.0\xa0KB.")
+
+    @override_settings(CV_UPLOAD_MAX_PAGES=2)
+    def test_rejects_too_many_pages(self):
+        self.assertRejected(self.upload(pdf_bytes(pages=3)), "The PDF has more than 2 pages.")
+
+    def test_rejects_password_protected_pdf(self):
+        self.assertRejected(self.upload(pdf_bytes(password='secret')), "Password-protected PDFs cannot be read.")
+
+    def test_rejects_unreadable_pdf(self):
+        self.assertRejected(self.upload(b'%PDF-1.4 truncated'), "The PDF could not be read.")
+
+    def test_missing_file(self):
+        response = self.client.post(self.url, {})
+        self.assertRejected(response, "Please choose a PDF file.")
+
+    def test_csrf_still_enforced(self):
+        self.client = self.client_class(enforce_csrf_checks=True)
+        response = self.upload(pdf_bytes())
+        self.assertEqual(response.status_code, 403)
@@ -9,6 +9,7 @@ from unittest.mock import patch
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.contrib.messages.middleware import MessageMiddleware
 from django.test.client import RequestFactory
+from app.tests.views.test_cv_upload import pdf_bytes
 
 
 class EmployeeViewsTests(TestCase):
@@ -109,7 +110,7 @@ class EmployeeViewsTests(TestCase):
         """Test uploading a CV file"""
         self.client.login(username="@employeetest", password="testpass123")
         
-        cv_content = b"This is a test CV file"
+        cv_content = pdf_bytes()
         cv_file = SimpleUploadedFile("test_cv.pdf", cv_content, content_type="application/pdf")
         
         uploads_dir = os.path.join(settings.MEDIA_ROOT, "uploads")
@@ -431,7 +432,7 @@ class EmployeeViewsEdgeCasesTests(TestCase):
             # Create a file upload
             cv_file = SimpleUploadedFile(
                 "test_cv.pdf", 
-                b"file content", 
+                pdf_bytes(), 
                 content_type="application/pdf"
             )
             
@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from app.models import Admin, Employee, Employer, Job, JobApplication
+
+class QueryBudgetTests(TestCase):
+    """Each view runs a fixed number of queries however many rows it shows; a per-row query fails these tests"""
+
+    def setUp(self):
+        self.employer = Employer.objects.create_user(
+            username='@budgetboss', email='boss@example.com', password='pw', first_name='B', last_name='B',
+            company_name='Acme'
+        )
+        self.employee = Employee.objects.create_user(
+            username='@budgetseeker', email='seeker@example.com', password='pw', first_name='S', last_name='S',
+            skills='Python, Django'
+        )
+        self.applicant_count = 0
+
+    def add_jobs(self, count):
+        for i in range(count):
+            job = Job.objects.create(
+                name=f'Job {Job.objects.count()}', description='', department='IT', skills_needed='Python, SQL',
+                salary=1000, created_by=self.employer
+            )
+            JobApplication.objects.create(job=job, applicant=self.employee, full_name='S S')
+            self.add_applicants(job, 2)
+
+    def add_applicants(self, job, count):
+        for _ in range(count):
+            self.applicant_count += 1
+            applicant = Employee.objects.create_user(
+                username=f'@applicant{self.applicant_count}', email=f'a{self.applicant_count}@example.com',
+                password='pw', first_name='A', last_name=str(self.applicant_count), skills='Python'
+            )
+            JobApplication.objects.create(job=job, applicant=applicant)
+
+    def count_queries(self, username, url):
+        self.client.login(username=username, password='pw')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assertFixedQueryCount(self, username, url, budget, grow):
+        """The view's query count stays the same after grow() adds rows, and within budget"""
+        grow(2)
+        few = self.count_queries(username, url)
+        grow(6)
+        many = self.count_queries(username, url)
+        self.assertEqual(few, many, f'{url} runs a query per row')
+        self.assertLessEqual(many, budget)
+
+    def test_employer_dashboard(self):
+        self.assertFixedQueryCount('@budgetboss', reverse('employer_dashboard'), 4, self.add_jobs)
+
+    def test_my_applications(self):
+        self.assertFixedQueryCount('@budgetseeker', reverse('my_applications'), 4, self.add_jobs)
+
+    def test_employer_job_detail(self):
+        job = Job.objects.create(
+            name='Detail', description='', department='IT', skills_needed='Python', salary=1, created_by=self.employer
+        )
+        grow = lambda count: self.add_applicants(job, count)
+        self.assertFixedQueryCount('@budgetboss', reverse('job_detail', args=[job.id]), 6, grow)
+
+    def test_employee_job_detail(self):
+        self.add_jobs(1)
+        job = Job.objects.get()
+        self.assertLessEqual(self.count_queries('@budgetseeker', reverse('job_detail', args=[job.id])), 6)
+
+    def test_employee_dashboard_all_jobs(self):
+        self.assertFixedQueryCount('@budgetseeker', reverse('employee_dashboard') + '?tab=all', 5, self.add_jobs)
+
+    def test_admin_job_list(self):
+        Admin.objects.create_user(username='@budgetadmin', email='admin@example.com', password='pw', first_name='A', last_name='A')
+
+        def grow(count):
+            for _ in range(count):
+                self.applicant_count += 1
+                employer = Employer.objects.create_user(
+                    username=f'@employer{self.applicant_count}', email=f'e{self.applicant_count}@example.com',
+                    password='pw', first_name='E', last_name=str(self.applicant_count), company_name='Acme'
+                )
+                Job.objects.create(name='Job', description='', department='IT', salary=1, created_by=employer)
+
+        self.assertFixedQueryCount('@budgetadmin', reverse('list_jobs'), 6, grow)
@@ -0,0 +1,83 @@
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from app.middleware import RequestMetricsMiddleware
+from app.models import User, Admin, Employer, Job
+from app.services.request_metrics import RequestMetrics, RequestSample, ViewMetrics
+
+class RequestMetricsStoreTests(TestCase):
+    def test_latency_quantile_uses_bucket_bounds(self):
+        metrics = ViewMetrics()
+        for seconds in [0.004] * 95 + [0.3] * 5:
+            metrics.add(RequestSample(), seconds, 200)
+        self.assertEqual(metrics.latency_quantile(0.95), 0.005)
+        self.assertEqual(metrics.latency_quantile(0.99), 0.3)
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True, REQUEST_METRICS_TOKEN='scrape-secret')
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        RequestMetrics.reset()
+        admin_user = User.objects.create_user(username='@ops', email='ops@example.com', password='pw', user_type='admin')
+        Admin.objects.create(user=admin_user)
+        employer = Employer.objects.create_user(
+            username='@boss', email='boss@example.com', password='pw', first_name='B', last_name='B', company_name='Acme'
+        )
+        for i in range(3):
+            Job.objects.create(name=f'Job {i}', description='', department='IT', skills_needed='Python', salary=1,
+                               created_by=employer)
+
+    def summary(self, view):
+        return next(row for row in RequestMetrics.summaries() if row['view'] == view)
+
+    def test_records_queries_and_timings_per_url_name(self):
+        self.client.login(username='@boss', password='pw')
+        self.client.get(reverse('employer_dashboard'))
+        self.client.get(reverse('employer_dashboard'))
+
+        row = self.summary('employer_dashboard')
+        self.assertEqual(row['requests'], 2)
+        self.assertGreater(row['avg_queries'], 0)
+        self.assertGreater(row['avg_db_ms'], 0)
+        self.assertGreater(row['avg_template_ms'], 0)
+        self.assertGreaterEqual(row['avg_ms'], row['avg_db_ms'])
+
+    def test_metrics_page_is_admin_only(self):
+        self.client.login(username='@boss', password='pw')
+        self.client.get(reverse('employer_dashboard'))
+        self.assertEqual(self.client.get(reverse('request_metrics')).status_code, 302)
+
+        self.client.login(username='@ops', password='pw')
+        response = self.client.get(reverse('request_metrics'))
+        self.assertContains(response, 'employer_dashboard')
+
+        self.client.post(reverse('request_metrics'))
+        self.assertEqual([row['view'] for row in RequestMetrics.summaries()], ['request_metrics'])
+
+    def test_prometheus_endpoint(self):
+        url = reverse('prometheus_metrics')
+        self.client.get(reverse('home'))
+
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+
+        response = self.client.get(url, HTTP_AUTHORIZATION='Bearer scrape-secret')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('app_requests_total{view="home"} 1', body)
+        self.assertIn('app_request_duration_seconds_bucket{view="home",le="+Inf"} 1', body)
+        self.assertIn('app_request_duration_seconds_count{view="home"} 1', body)
+
+
+class RequestMetricsDisabledTests(TestCase):
+    @override_settings(REQUEST_METRICS_ENABLED=False)
+    def test_middleware_removes_itself(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestMetricsMiddleware(lambda request: None)
+
+    @override_settings(REQUEST_METRICS_ENABLED=False)
+    def test_nothing_recorded(self):
+        RequestMetrics.reset()
+        self.client.get(reverse('home'))
+        self.assertEqual(RequestMetrics.summaries(), [])
@@ -1,10 +1,16 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
 from app.models import Admin, Employee, Employer, Job, User
-from django.core.paginator import Paginator
 from django.db.models import Q
 from app.decorators import user_type_required
 from django.contrib import messages
 from app.forms import UserForm, JobForm
+from app.services.pagination import KeysetPaginator
+from app.services.request_metrics import RequestMetrics
+
+USER_SORT_FIELDS = ('username', 'email', 'first_name', 'last_name', 'user_type')
 
 @user_type_required('admin')
 def admin_dashboard(request):
@@ -46,10 +52,10 @@ def list_users(request):
         )
     
     order_by = request.GET.get('order_by', 'username')
+    if order_by.lstrip('-') not in USER_SORT_FIELDS:
+        order_by = 'username'
     users = users.order_by(order_by)
-    paginator = Paginator(users, 25)
-    page_number = request.GET.get('page')
-    users_page = paginator.get_page(page_number)
+    users_page = KeysetPaginator(users, 25).get_page(request.GET.get('cursor'))
     
     context = {
         'users_page' : users_page,
@@ -62,7 +68,7 @@ def list_users(request):
 
 @user_type_required('admin')
 def list_jobs(request):
-    jobs = Job.objects.all()
+    jobs = Job.objects.select_related('created_by__user')
 
     job_type_filter = request.GET.get('job_type')
     created_by_filter = request.GET.get('created_by')
@@ -83,7 +89,8 @@ def list_jobs(request):
     order_by = request.GET.get('order_by', 'created_at')
     jobs = jobs.order_by(order_by)
 
-    employers_with_jobs = Employer.objects.filter(user_id__in=Job.objects.all().values_list('created_by', flat=True).distinct()).order_by('company_name')
+    # The default Employer manager annotates email, whose property setter saves the user row for every loaded employer.
+    employers_with_jobs = Employer._base_manager.select_related('user').filter(user_id__in=Job.objects.all().values_list('created_by', flat=True).distinct()).order_by('company_name')
     job_types = Job.objects.all().values_list('job_type', flat=True).distinct()
     
     context = {'jobs': jobs, 'order_by': order_by, 'employers_with_jobs': employers_with_jobs, 'job_types': job_types}
@@ -184,3 +191,30 @@ def delete_job(request, job_id):
         return redirect('list_jobs')
     
     return render(request, 'admin/delete_job.html', {'job': job_id})
+
+@user_type_required('admin')
+def request_metrics(request):
+    """
+    Per-view query counts and timings collected by RequestMetricsMiddleware; POST clears them.
+    """
+    if request.method == 'POST':
+        RequestMetrics.reset()
+        messages.success(request, 'Request metrics cleared.')
+        return redirect('request_metrics')
+
+    return render(request, 'admin/request_metrics.html', {
+        'enabled': getattr(settings, 'REQUEST_METRICS_ENABLED', False),
+        'views': RequestMetrics.summaries(),
+    })
+
+def prometheus_metrics(request):
+    """
+    The request metrics in the Prometheus text format, for an admin session or the REQUEST_METRICS_TOKEN bearer token.
+    """
+    token = getattr(settings, 'REQUEST_METRICS_TOKEN', '')
+    authorization = request.headers.get('Authorization', '')
+    has_token = bool(token) and constant_time_compare(authorization, f'Bearer {token}')
+    is_admin = request.user.is_authenticated and request.user.user_type == 'admin'
+    if not (has_token or is_admin):
+        return HttpResponseForbidden()
+    return HttpResponse(RequestMetrics.prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,12 +1,18 @@
 from app.forms import EmployeeSignUpForm, EmployeeAccountUpdateForm
 from app.models import User, Employee, Job, JobApplication
-from app.helper import create_and_send_code_email, parse_cv
+from app.helper import create_and_send_code_email
+from app.services.cv_cache import ParsedCVCache
+from app.services.cv_pipeline import CVPipeline
+from app.services.cv_upload import CVUpload, PDFUploadHandler
+from app.services.job_search import JobSearch
+from app.services.pagination import KeysetPaginator
 from django.contrib import messages
 from django.shortcuts import render, redirect, get_object_or_404
+from django.http import JsonResponse
 import os
 from django.conf import settings
 from django.core.files.storage import default_storage
-from django.db.models import Q
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
 from collections import defaultdict
 from django.contrib.auth import update_session_auth_hash
 from app.decorators import user_type_required
@@ -55,15 +61,32 @@ def employee_signup(request):
     
     return render(request, "employee/employee_signup.html", {"form": form, "step": 1})
 
+@csrf_exempt
 def upload_cv(request):
+    # Upload handlers must be replaced before anything reads the body, and CsrfViewMiddleware would read it first.
+    handler = PDFUploadHandler(request)
+    request.upload_handlers = [handler]
+    return _upload_cv(request, handler)
+
+@csrf_protect
+def _upload_cv(request, handler):
     if request.method == "POST":
-        cv_file = request.FILES["cv"]
+        cv_file = request.FILES.get("cv")
+        if handler.error or cv_file is None:
+            error = handler.error or "Please choose a PDF file."
+        else:
+            error = CVUpload.check_pdf(cv_file.temporary_file_path())
+        if error:
+            messages.error(request, error)
+            return render(request, "employee/employee_signup.html", {"step": 2})
         try:
             upload_dir = os.path.join(settings.MEDIA_ROOT, "uploads")
             os.makedirs(upload_dir, exist_ok=True)
             cv_filename = f"uploads/{cv_file.name}"
+            content_hash = ParsedCVCache.hash_file(cv_file)
             file_path = default_storage.save(cv_filename, cv_file)
             request.session["cv_filename"] = file_path
+            request.session["cv_parse_job"] = CVPipeline.enqueue(file_path, content_hash).id
             
             return redirect("employee_signup_3")
         except Exception as e:
@@ -73,15 +96,18 @@ def upload_cv(request):
 def review_cv_data(request):
     
     cv_filename = request.session.get("cv_filename", "")
+    cv_data = defaultdict(str)
+    cv_pending = False
     if cv_filename:
-        try:
-            file_path = os.path.join(settings.MEDIA_ROOT, cv_filename)
-            cv_data = parse_cv(file_path)
-        except Exception as e:
-            print(f"Error parsing CV: {e}")
-            cv_data = defaultdict(str)
-    else:
-        cv_data = defaultdict(str)
+        # Parsing happens in the process_cvs worker; until it finishes the form is shown empty and polls.
+        job_id = request.session.get("cv_parse_job")
+        if job_id is None:
+            job_id = request.session["cv_parse_job"] = CVPipeline.enqueue(cv_filename).id
+        result = CVPipeline.result(job_id)
+        if result is None:
+            cv_pending = True
+        else:
+            cv_data = defaultdict(str, result)
 
     if request.method == "POST":
         
@@ -106,7 +132,13 @@ def review_cv_data(request):
         messages.success(request, "Profile completed")
         return redirect("employee_dashboard")
 
-    return render(request, "employee/employee_signup.html", {"step": 3, "cv_data": cv_data})
+    return render(request, "employee/employee_signup.html", {"step": 3, "cv_data": cv_data, "cv_pending": cv_pending})
+
+def cv_parse_status(request):
+    job_id = request.session.get("cv_parse_job")
+    if job_id is None:
+        return JsonResponse({"status": "missing"}, status=404)
+    return JsonResponse({"status": "pending" if CVPipeline.result(job_id) is None else "done"})
 
 @user_type_required('employee')
 def employee_update(request):
@@ -163,15 +195,7 @@ def employee_dashboard(request):
     
     job_matches = None
     jobs = []
-    base_jobs_query = Job.objects.all().order_by('-created_at')
-    
-    if filters['search']:
-        base_jobs_query = base_jobs_query.filter(
-            Q(name__icontains=filters['search']) |
-            Q(description__icontains=filters['search']) |
-            Q(department__icontains=filters['search']) |
-            Q(skills_needed__icontains=filters['search'])
-        )
+    base_jobs_query = Job.objects.select_related('created_by').order_by('-created_at')
     
     if filters['job_type'] in ['FT', 'PT']:
         base_jobs_query = base_jobs_query.filter(job_type=filters['job_type'])
@@ -190,20 +214,20 @@ def employee_dashboard(request):
         if country_code:
             base_jobs_query = base_jobs_query.filter(country=country_code)
     
+    # Last, so the full-text backend's fallback decision sees the other filters
+    base_jobs_query = JobSearch.search(base_jobs_query, filters['search'])
+    
     if active_tab == 'suitable':
         filtered_jobs = base_jobs_query
         
-        from app.services.job_matcher import JobMatcher
-        job_matches_list = JobMatcher.match_employee_to_jobs(employee, filtered_jobs)
+        from app.services.match_cache import MatchCache
+        job_matches_list = MatchCache.job_matches(employee, filtered_jobs, filters)
         
         paginator = Paginator(job_matches_list, 10)
         page_number = request.GET.get('page')
         job_matches = paginator.get_page(page_number)
     else:
-        jobs = base_jobs_query
-        paginator = Paginator(jobs, 10)
-        page_number = request.GET.get('page')
-        jobs = paginator.get_page(page_number)
+        jobs = KeysetPaginator(base_jobs_query, 10).get_page(request.GET.get('cursor'))
     
     context = {
         'employee': employee,
@@ -260,7 +284,9 @@ def my_applications(request):
         messages.error(request, "Access denied. Employee access only.")
         return redirect('login')
     
-    applications = JobApplication.objects.filter(applicant=request.user.employee).order_by('-created_at')
+    applications = JobApplication.objects.filter(applicant=request.user.employee).select_related(
+        'job__created_by'
+    ).order_by('-created_at')
     
     return render(request, 'job/my_applications.html', {
         'applications': applications
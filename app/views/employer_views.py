@@ -1,11 +1,14 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.core.paginator import Paginator
+from django.db.models import Count, F
 from app.models import Job, JobApplication, User
 from app.forms import JobForm, EmployerSignUpForm
 from django.contrib import messages
 from app.decorators import user_type_required
-from app.services.job_matcher import JobMatcher
 from app.helper import create_and_send_code_email
 
+APPLICATIONS_PER_PAGE = 25
+
 @user_type_required('employer')
 def add_job(request):
     if request.method == 'POST':
@@ -22,7 +25,7 @@ def add_job(request):
 @user_type_required(['employer', 'employee', 'admin'])
 def job_detail(request, job_id):
     if not hasattr(request.user, 'employer'):
-        job = get_object_or_404(Job, id=job_id)
+        job = get_object_or_404(Job.objects.select_related('created_by'), id=job_id)
         has_applied = False
         if hasattr(request.user, 'employee'):
             has_applied = JobApplication.objects.filter(
@@ -36,38 +39,36 @@ def job_detail(request, job_id):
             'employee': request.user.employee if hasattr(request.user, 'employee') else None
         })
     
-    job = get_object_or_404(Job, id=job_id, created_by=request.user.employer)
-    applications = JobApplication.objects.filter(job=job)
+    job = get_object_or_404(Job.objects.select_related('created_by'), id=job_id, created_by=request.user.employer)
+    applications = JobApplication.objects.filter(job=job).select_related('applicant__user').order_by(
+        F('score').desc(nulls_last=True), '-created_at'
+    )
 
-    applications_with_scores = []
-    for app in applications:
-        score, matching_skills, missing_skills = JobMatcher.calculate_match_score(
-            app.skills,
-            job.skills_needed,
-            job.skills_wanted,
-            app.applicant.preferred_contract if hasattr(app, 'applicant') and app.applicant else None,
-            job.job_type
-        )
-        
-        app_data = {
-            'application': app,
-            'score': score,
-            'matching_skills': matching_skills,
-            'missing_skills': missing_skills
+    paginator = Paginator(applications, APPLICATIONS_PER_PAGE)
+    applications_page = paginator.get_page(request.GET.get('page'))
+    # A window of page links around the current page, so jobs with thousands of applicants keep a short bar
+    page_range = list(paginator.get_elided_page_range(applications_page.number, on_each_side=2, on_ends=1))
+    applications_with_scores = [
+        {
+            'application': application,
+            'score': application.score,
+            'matching_skills': application.matching_skills,
+            'missing_skills': application.missing_skills
         }
-        applications_with_scores.append(app_data)
-    
-    applications_with_scores.sort(key=lambda x: x['score'], reverse=True)
+        for application in applications_page
+    ]
     
     return render(request, 'job/job_detail.html', {
         'job': job,
         'applications_with_scores': applications_with_scores,
+        'applications_page': applications_page,
+        'page_range': page_range,
         'is_employee': False
     })
 
 @user_type_required('employer')
 def employer_dashboard(request):
-    jobs = Job.objects.filter(created_by=request.user.employer)
+    jobs = Job.objects.filter(created_by=request.user.employer).annotate(application_count=Count('applications'))
     return render(request, 'employer/employer_dashboard.html', {
         'jobs': jobs,
         'username': request.user.email
@@ -53,6 +53,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'app.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -161,3 +162,40 @@ SENDGRID_SANDBOX_MODE_IN_DEBUG = True  #change to false when we're sending real
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# Per-process cache of "suitable jobs" rankings, invalidated across processes through MatchCacheVersion rows
+# (see app/services/match_cache.py)
+MATCH_CACHE_MAX_ENTRIES = 512
+MATCH_CACHE_TTL = 300  # seconds
+
+# Parsed CV results kept by content hash (see app/services/cv_cache.py)
+PARSED_CV_CACHE_MAX_ENTRIES = 1000
+
+# Text extraction budget per CV (see app/helper.py iter_pdf_text); anything beyond it is ignored
+CV_PDF_MAX_PAGES = 10
+CV_PDF_MAX_CHARS = 50000
+
+# Uploaded CVs are rejected above these limits (see app/services/cv_upload.py)
+CV_UPLOAD_MAX_BYTES = 5 * 1024 * 1024
+CV_UPLOAD_MAX_PAGES = 20
+
+# Emails are queued in the database and delivered by `manage.py send_emails` (see app/services/email_outbox.py);
+# without an API key they only go to the in-memory stub backend
+EMAIL_OUTBOX_BACKEND = os.environ.get(
+    'EMAIL_OUTBOX_BACKEND',
+    'app.services.email_backends.SendGridBackend' if SENDGRID_API_KEY else 'app.services.email_backends.StubBackend'
+)
+EMAIL_RETRY_BASE_DELAY = 30  # seconds, doubled after every failed attempt
+EMAIL_RETRY_MAX_DELAY = 3600
+
+# How often (seconds) the send_emails worker deletes used and expired verification codes; None disables it and
+# leaves it to `manage.py purge_verification_codes`
+VERIFICATION_CODE_PURGE_INTERVAL = 3600
+
+# Keyset pagination: approximate counts stop at this many rows (shown as "1000+") where no estimate is available
+PAGINATION_COUNT_LIMIT = 1000
+
+# Per-view request metrics (app/middleware.py), shown at /administrator/metrics/. Off unless enabled; the Prometheus
+# endpoint also accepts "Authorization: Bearer <REQUEST_METRICS_TOKEN>" so a scraper needs no admin session.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
+REQUEST_METRICS_TOKEN = os.environ.get('REQUEST_METRICS_TOKEN', '')
@@ -30,6 +30,7 @@ urlpatterns = [
     path('verify-email/', verification_views.verify_email, name='verify_email'),
     path('employee-signup/CV/', employee_views.upload_cv, name='employee_signup_2'),
     path('employee-signup/CV/parse/', employee_views.review_cv_data, name='employee_signup_3'),
+    path('employee-signup/CV/status/', employee_views.cv_parse_status, name='cv_parse_status'),
     # Employee routes
     path('employee/dashboard/', employee_views.employee_dashboard, name='employee_dashboard'),
     path('employee/update/', employee_views.employee_update, name='employee_update'),
@@ -49,6 +50,8 @@ urlpatterns = [
     path('administrator/delete-user/<int:user_id>/', admin_views.delete_user, name='delete_user'),
     path('administrator/create-job/', admin_views.create_job, name='create_job'),
     path('administrator/delete-job/<int:job_id>/', admin_views.delete_job, name='delete_job'),
+    path('administrator/metrics/', admin_views.request_metrics, name='request_metrics'),
+    path('administrator/metrics/prometheus/', admin_views.prometheus_metrics, name='prometheus_metrics'),
 ]
 
 if settings.DEBUG: